@@ -0,0 +1,440 @@
+import random
+import time
+import typing as t
+
+import numpy as np
+
+import pyspiel
+
+WIN_SCORE = 1_000_000
+MAX_PLY = 128
+
+# Piece values of the evaluation function
+PAWN_VALUE = 100
+ADVANCEMENT_BONUS = 4  # Multiplied by the square of the rows advanced
+HOME_ROW_BONUS = 10  # Pawns still defending their first row
+
+# Directions as in open_spiel's breakthrough.cc: black (player 0) moves with
+# directions 0-2 (row + 1), white (player 1) with directions 3-5 (row - 1)
+DIR_ROW_OFFSETS = [1, 1, 1, -1, -1, -1]
+DIR_COL_OFFSETS = [-1, 0, 1, -1, 0, 1]
+
+# Transposition table entry flags
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget of the move is over."""
+
+
+class BreakthroughBoard:
+    """
+    Compact Breakthrough board used by the search, with incremental Zobrist
+    hashing.
+
+    Cells are numbered row * n_cols + col as in open_spiel, and contain 0
+    (empty), 1 (black pawn, player 0) or 2 (white pawn, player 1). Moves are
+    tuples (action, source, destination, capture), where action is the
+    open_spiel action id of the move.
+    """
+
+    def __init__(self, n_rows: int, n_cols: int, seed: int = 0):
+        """
+        Parameters:
+            n_rows (int): number of rows of the board
+            n_cols (int): number of columns of the board
+            seed (int): seed of the Zobrist keys
+        """
+        self.n_rows, self.n_cols = n_rows, n_cols
+        n_cells = n_rows * n_cols
+        self.cells = [0] * n_cells
+        self.pawns = [set(), set()]
+        self.player = 0
+        self.hash = 0
+
+        rng = random.Random(seed)
+        self._zobrist_pawns = [
+            [rng.getrandbits(64) for _ in range(n_cells)] for _ in range(2)
+        ]
+        self._zobrist_player = rng.getrandbits(64)
+
+        # Destination cells reachable from every cell, for each player
+        self.steps = [[None] * n_cells for _ in range(2)]
+        for player, directions in enumerate([(0, 1, 2), (3, 4, 5)]):
+            for cell in range(n_cells):
+                row, col = divmod(cell, n_cols)
+                steps = []
+                for direction in directions:
+                    r = row + DIR_ROW_OFFSETS[direction]
+                    c = col + DIR_COL_OFFSETS[direction]
+                    if 0 <= r < n_rows and 0 <= c < n_cols:
+                        diagonal = DIR_COL_OFFSETS[direction] != 0
+                        steps.append((r * n_cols + c, direction, diagonal))
+                self.steps[player][cell] = steps
+
+        # Row each player has to reach, and number of rows still to go
+        self.goal_row = [n_rows - 1, 0]
+        self.distance = [
+            [n_rows - 1 - cell // n_cols for cell in range(n_cells)],
+            [cell // n_cols for cell in range(n_cells)],
+        ]
+
+    def set_state(self, state: pyspiel.State):
+        """
+        Copies the position of an open_spiel state.
+
+        Parameters:
+            state (pyspiel.State): breakthrough state
+        """
+        planes = np.asarray(state.observation_tensor(0)).reshape(
+            3, self.n_rows, self.n_cols
+        )
+        self.cells = [0] * (self.n_rows * self.n_cols)
+        self.pawns = [set(), set()]
+        self.hash = 0
+        for player in range(2):
+            for cell in np.flatnonzero(planes[player]):
+                cell = int(cell)
+                self.cells[cell] = player + 1
+                self.pawns[player].add(cell)
+                self.hash ^= self._zobrist_pawns[player][cell]
+        self.player = state.current_player()
+        if self.player == 1:
+            self.hash ^= self._zobrist_player
+
+    def moves(self, captures_only: bool = False) -> t.List[t.Tuple[int, int, int, int]]:
+        """
+        Returns the legal moves of the player to move.
+
+        Parameters:
+            captures_only (bool): only return the captures and the moves
+                reaching the last row (used by the quiescence search)
+        """
+        player = self.player
+        cells = self.cells
+        opponent_piece = 2 - player
+        goal_row = self.goal_row[player]
+        n_cols = self.n_cols
+        moves = []
+        for source in self.pawns[player]:
+            for destination, direction, diagonal in self.steps[player][source]:
+                piece = cells[destination]
+                if piece == 0:
+                    if captures_only and destination // n_cols != goal_row:
+                        continue
+                    capture = 0
+                elif diagonal and piece == opponent_piece:
+                    capture = 1
+                else:
+                    continue
+                action = (source * 6 + direction) * 2 + capture
+                moves.append((action, source, destination, capture))
+        return moves
+
+    def apply(self, move: t.Tuple[int, int, int, int]):
+        """Plays a move of the player to move."""
+        _, source, destination, capture = move
+        player = self.player
+        keys = self._zobrist_pawns
+        if capture:
+            self.pawns[1 - player].remove(destination)
+            self.hash ^= keys[1 - player][destination]
+        self.pawns[player].remove(source)
+        self.pawns[player].add(destination)
+        self.cells[source] = 0
+        self.cells[destination] = player + 1
+        self.hash ^= keys[player][source] ^ keys[player][destination]
+        self.hash ^= self._zobrist_player
+        self.player = 1 - player
+
+    def undo(self, move: t.Tuple[int, int, int, int]):
+        """Takes back a move applied with apply()."""
+        _, source, destination, capture = move
+        self.player = player = 1 - self.player
+        keys = self._zobrist_pawns
+        self.hash ^= self._zobrist_player
+        self.hash ^= keys[player][source] ^ keys[player][destination]
+        self.pawns[player].remove(destination)
+        self.pawns[player].add(source)
+        self.cells[source] = player + 1
+        self.cells[destination] = 0
+        if capture:
+            self.cells[destination] = 2 - player
+            self.pawns[1 - player].add(destination)
+            self.hash ^= keys[1 - player][destination]
+
+    def is_win(self, move: t.Tuple[int, int, int, int]) -> bool:
+        """Returns True if the move just applied ended the game."""
+        mover = 1 - self.player
+        return (
+            move[2] // self.n_cols == self.goal_row[mover]
+            or not self.pawns[self.player]
+        )
+
+
+class AlphaBetaBot(pyspiel.Bot):
+    """
+    Breakthrough Bot searching with iterative-deepening alpha-beta.
+
+    Every iteration searches one ply deeper than the previous one, until the
+    time budget of the move is over; the best move of the deepest completed
+    iteration is played. The search uses:
+    * a transposition table indexed by the Zobrist hash of the position, which
+      also provides the first move to try;
+    * move ordering: winning moves and captures first, then two killer moves
+      per ply and the history heuristic;
+    * a quiescence search of captures at the leaves;
+    * a material/advancement evaluation.
+    """
+
+    def __init__(
+        self,
+        game: pyspiel.Game,
+        player_id: int,
+        time_limit: float = 1.0,
+        max_depth: int = 64,
+        table_size: int = 1 << 20,
+        seed: int = 42,
+    ):
+        """
+        Parameters:
+            game (pyspiel.Game): breakthrough game (any number of rows/columns)
+            player_id (int): id of the player that the bot will be driving
+            time_limit (float): search time per move, in seconds
+            max_depth (int): maximum search depth
+            table_size (int): number of entries of the transposition table
+                (rounded down to a power of 2)
+            seed (int): seed of the Zobrist keys
+        """
+        pyspiel.Bot.__init__(self)
+        if game.get_type().short_name != "breakthrough":
+            raise ValueError("AlphaBetaBot only plays breakthrough")
+        params = game.get_parameters()
+        self._player_id = player_id
+        self._time_limit = time_limit
+        self._max_depth = max_depth
+        self._board = BreakthroughBoard(
+            params.get("rows", 8), params.get("columns", 8), seed=seed
+        )
+
+        n_cells = self._board.n_rows * self._board.n_cols
+        self._table_mask = (1 << (table_size.bit_length() - 1)) - 1
+        self._table = [None] * (self._table_mask + 1)
+        self._killers = [[None, None] for _ in range(MAX_PLY)]
+        self._history = [0] * game.num_distinct_actions()
+        self._values = [
+            [self._pawn_value(player, cell) for cell in range(n_cells)]
+            for player in range(2)
+        ]
+        self._deadline = 0.0
+        self._nodes = 0
+        self.last_search = dict()  # Statistics of the last search (depth, nodes, ...)
+
+    def _pawn_value(self, player: int, cell: int) -> int:
+        """Value of a pawn of player in a cell, for the evaluation function."""
+        board = self._board
+        advanced = board.n_rows - 1 - board.distance[player][cell]
+        value = PAWN_VALUE + ADVANCEMENT_BONUS * advanced * advanced
+        if advanced == 0:
+            value += HOME_ROW_BONUS
+        return value
+
+    def restart_at(self, state):
+        pass
+
+    def inform_action(self, state, player_id, action):
+        pass
+
+    def _evaluate(self, ply: int) -> int:
+        """
+        Returns the score of the position for the player to move. A pawn one
+        row away from the goal wins at once for the player to move (there's
+        always a diagonal move to the last row).
+        """
+        board = self._board
+        player = board.player
+        distance = board.distance[player]
+        for cell in board.pawns[player]:
+            if distance[cell] == 1:
+                return WIN_SCORE - ply - 1
+        values = self._values
+        score = 0
+        for cell in board.pawns[player]:
+            score += values[player][cell]
+        for cell in board.pawns[1 - player]:
+            score -= values[1 - player][cell]
+        return score
+
+    def _check_time(self):
+        self._nodes += 1
+        if self._nodes & 1023 == 0 and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+    def _order(
+        self, moves: t.List[t.Tuple[int, int, int, int]], tt_action: int, ply: int
+    ) -> t.List[t.Tuple[int, int, int, int]]:
+        """Sorts moves: TT move, captures (most advanced victims first), killers, history."""
+        killers = self._killers[ply]
+        history = self._history
+        distance = self._board.distance[self._board.player]
+
+        def score(move):
+            action = move[0]
+            if action == tt_action:
+                return 1 << 40
+            if move[3]:
+                return (1 << 39) - distance[move[2]]
+            if action == killers[0]:
+                return 1 << 38
+            if action == killers[1]:
+                return (1 << 38) - 1
+            return history[action]
+
+        return sorted(moves, key=score, reverse=True)
+
+    def _quiescence(self, alpha: int, beta: int, ply: int) -> int:
+        """Searches captures only, until the position is quiet."""
+        self._check_time()
+        stand_pat = self._evaluate(ply)
+        if stand_pat >= beta or ply >= MAX_PLY - 1:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+        board = self._board
+        for move in self._order(board.moves(captures_only=True), None, ply):
+            board.apply(move)
+            if board.is_win(move):
+                score = WIN_SCORE - ply - 1
+            else:
+                score = -self._quiescence(-beta, -alpha, ply + 1)
+            board.undo(move)
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        return alpha
+
+    def _search(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """
+        Negamax alpha-beta search.
+
+        Returns:
+            int: score of the position for the player to move
+        """
+        if depth <= 0:
+            return self._quiescence(alpha, beta, ply)
+        self._check_time()
+
+        board = self._board
+        original_alpha = alpha
+        index = board.hash & self._table_mask
+        entry = self._table[index]
+        tt_action = None
+        if entry is not None and entry[0] == board.hash:
+            _, entry_depth, value, flag, tt_action = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, value)
+                elif flag == UPPER_BOUND:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        moves = board.moves()
+        if not moves:
+            return -WIN_SCORE + ply  # Can't happen in breakthrough, but be safe
+        best_score, best_action = -WIN_SCORE - 1, None
+        for move in self._order(moves, tt_action, ply):
+            board.apply(move)
+            if board.is_win(move):
+                score = WIN_SCORE - ply - 1
+            else:
+                score = -self._search(depth - 1, -beta, -alpha, ply + 1)
+            board.undo(move)
+            if score > best_score:
+                best_score, best_action = score, move[0]
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                if not move[3]:
+                    killers = self._killers[ply]
+                    if killers[0] != move[0]:
+                        killers[1], killers[0] = killers[0], move[0]
+                    self._history[move[0]] += depth * depth
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        if entry is None or entry[0] != board.hash or entry[1] <= depth:
+            self._table[index] = (board.hash, depth, best_score, flag, best_action)
+        return best_score
+
+    def _search_root(
+        self, moves: t.List[t.Tuple[int, int, int, int]], depth: int
+    ) -> t.Tuple[int, t.Optional[int]]:
+        """
+        Searches all the root moves (already ordered) at the given depth.
+
+        Returns:
+            tuple: best score and action. If the time runs out, the action is
+                the best one among the moves searched so far (None if none).
+        """
+        board = self._board
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_action = None
+        for move in moves:
+            board.apply(move)
+            if board.is_win(move):
+                score = WIN_SCORE - 1
+            else:
+                try:
+                    score = -self._search(depth - 1, -beta, -alpha, 1)
+                except SearchTimeout:
+                    # The board is left mid-search: it's reset by the next step()
+                    return None, best_action
+            board.undo(move)
+            if score > alpha:
+                alpha, best_action = score, move[0]
+        return alpha, best_action
+
+    def step(self, state):
+        legal_actions = state.legal_actions(self._player_id)
+        if len(legal_actions) == 1:
+            return legal_actions[0]
+
+        start = time.perf_counter()
+        self._deadline = start + self._time_limit
+        self._nodes = 0
+        self._killers = [[None, None] for _ in range(MAX_PLY)]
+        self._history = [h // 8 for h in self._history]  # Age the history scores
+        board = self._board
+        board.set_state(state)
+
+        moves = self._order(board.moves(), None, 0)
+        best_action, best_score, completed_depth = moves[0][0], None, 0
+        for depth in range(1, self._max_depth + 1):
+            score, action = self._search_root(moves, depth)
+            if action is not None:
+                # The previous best move is searched first, so a better move
+                # found by an unfinished iteration can be trusted
+                best_action = action
+            if score is None:
+                break
+            best_score, completed_depth = score, depth
+            moves.sort(key=lambda move: move[0] != best_action)
+            if abs(score) >= WIN_SCORE - MAX_PLY:
+                break  # Forced win or loss found
+
+        self.last_search = {
+            "depth": completed_depth,
+            "score": best_score,
+            "nodes": self._nodes,
+            "time": time.perf_counter() - start,
+        }
+        if best_action not in legal_actions:  # Never expected: keep the game going
+            return legal_actions[0]
+        return best_action
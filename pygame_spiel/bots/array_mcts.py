@@ -0,0 +1,366 @@
+import math
+import time
+import typing as t
+
+import numpy as np
+
+import pyspiel
+from open_spiel.python.algorithms import mcts
+
+from pygame_spiel.bots.live_mcts import SearchCancelled, SearchSnapshot
+
+
+class NodePool:
+    """
+    Search tree stored in preallocated NumPy arrays, one entry per node.
+
+    The children of a node are allocated together, in consecutive entries
+    starting at first_child. The statistics of a node are from the perspective
+    of the player who moved into it (player), and solved is 1 (or -1) when
+    the game is proven won (or lost) for this player. The pool never grows: when it's
+    full, nodes are no longer expanded. compact() keeps the subtree of a node
+    and drops the rest of the tree, copying the subtree in a second set of
+    arrays, so the memory used doesn't depend on the number of searches.
+    """
+
+    FIELDS = (
+        ("action", np.int32),
+        ("player", np.int8),
+        ("visits", np.int32),
+        ("value_sum", np.float32),
+        ("first_child", np.int32),
+        ("num_children", np.int32),
+        ("solved", np.int8),
+    )
+
+    def __init__(self, capacity: int):
+        """
+        Parameters:
+            capacity (int): maximum number of nodes
+        """
+        self.capacity = capacity
+        self._arrays = [self._allocate(capacity), self._allocate(capacity)]
+        self._current = 0
+        self.size = 0
+        self._bind()
+
+    @classmethod
+    def _allocate(cls, capacity: int) -> t.Dict[str, np.ndarray]:
+        return {name: np.zeros(capacity, dtype=dtype) for name, dtype in cls.FIELDS}
+
+    def _bind(self):
+        """Exposes the arrays of the current tree as attributes (e.g. self.visits)."""
+        for name, array in self._arrays[self._current].items():
+            setattr(self, name, array)
+
+    def reset(self, player: int) -> int:
+        """
+        Empties the pool and adds a root node.
+
+        Parameters:
+            player (int): player who moved into the root
+
+        Returns:
+            int: index of the root (0)
+        """
+        self.size = 0
+        root = self.allocate(1)
+        self.action[root] = -1
+        self.player[root] = player
+        return root
+
+    def allocate(self, n: int) -> int:
+        """
+        Allocates n consecutive unexpanded nodes, with no visits.
+
+        Returns:
+            int: index of the first node, or -1 if the pool is full
+        """
+        if self.size + n > self.capacity:
+            return -1
+        start, self.size = self.size, self.size + n
+        self.visits[start : self.size] = 0
+        self.value_sum[start : self.size] = 0.0
+        self.first_child[start : self.size] = -1
+        self.num_children[start : self.size] = 0
+        self.solved[start : self.size] = 0
+        return start
+
+    def children(self, node: int) -> slice:
+        """Returns the range of the children of a node."""
+        start = self.first_child[node]
+        return slice(start, start + self.num_children[node])
+
+    def find_child(self, node: int, action: int) -> int:
+        """Returns the child of a node reached by an action, or -1."""
+        if self.first_child[node] < 0:
+            return -1
+        children = self.children(node)
+        matches = np.flatnonzero(self.action[children] == action)
+        return int(children.start + matches[0]) if len(matches) else -1
+
+    def compact(self, node: int) -> int:
+        """
+        Keeps only the subtree of a node, which becomes the root. The subtree
+        is copied level by level in the other set of arrays.
+
+        Returns:
+            int: index of the new root (0)
+        """
+        old, new = self._arrays[self._current], self._arrays[1 - self._current]
+        for name in old:
+            new[name][0] = old[name][node]
+        size = 1
+        old_level, new_level = np.array([node]), np.array([0])
+        while len(old_level):
+            expanded = old["first_child"][old_level] >= 0
+            parents_old, parents_new = old_level[expanded], new_level[expanded]
+            counts = old["num_children"][parents_old]
+            total = int(counts.sum())
+            if total == 0:
+                break
+            # Children blocks keep their order, one after the other
+            offsets = np.cumsum(counts) - counts
+            new["first_child"][parents_new] = size + offsets
+            old_level = np.repeat(old["first_child"][parents_old] - offsets, counts)
+            old_level += np.arange(total)
+            new_level = np.arange(size, size + total)
+            for name in old:
+                if name != "first_child":
+                    new[name][new_level] = old[name][old_level]
+            new["first_child"][new_level] = -1  # Set with the next level
+            size += total
+        self._current = 1 - self._current
+        self.size = size
+        self._bind()
+        return 0
+
+
+class ArrayMCTSBot(pyspiel.Bot):
+    """
+    UCT search with MCTS-Solver (as open_spiel's MCTSBot) over a tree stored
+    in a NodePool, for deterministic 2-player zero-sum games. No Python object
+    is created per node, so large simulation budgets don't slow down the
+    garbage collector, and the memory is bounded by max_nodes. Between moves,
+    the subtree of the new position is kept and the rest of the tree recycled.
+
+    Like LiveMCTSBot, the Bot publishes rate-limited snapshots of the root
+    children in the attribute snapshot while it searches, and its search can
+    be stopped with cancel().
+    """
+
+    def __init__(
+        self,
+        game: pyspiel.Game,
+        player_id: int,
+        evaluator: mcts.Evaluator,
+        max_simulations: int = 1000,
+        max_nodes: int = 1 << 18,
+        uct_c: float = 2.0,
+        snapshot_interval: float = 0.05,
+        seed: int = 42,
+    ):
+        """
+        Parameters:
+            game (pyspiel.Game): open_spiel game (2 players, deterministic)
+            player_id (int): id of the player that the bot will be driving
+            evaluator (mcts.Evaluator): evaluator of the leaves (e.g. random
+                rollouts)
+            max_simulations (int): number of simulations per move
+            max_nodes (int): maximum number of nodes of the tree (at least
+                the number of distinct actions of the game + 1, so that the
+                root can be expanded)
+            uct_c (float): UCT's exploration constant
+            snapshot_interval (float): minimum time (seconds) between two
+                snapshots of the search
+            seed (int): seed of the random generator (order of the children)
+        """
+        pyspiel.Bot.__init__(self)
+        if max_nodes < game.num_distinct_actions() + 1:
+            raise ValueError(
+                f"max_nodes ({max_nodes}) must be at least the number of distinct "
+                f"actions of the game + 1 ({game.num_distinct_actions() + 1})"
+            )
+        self._game = game
+        self._player_id = player_id
+        self._evaluator = evaluator
+        self._max_simulations = max_simulations
+        self._uct_c = uct_c
+        self._snapshot_interval = snapshot_interval
+        self._random_state = np.random.RandomState(seed)
+        self._pool = NodePool(max_nodes)
+        self._root = -1
+        self._root_history: t.List[int] = []
+        self._cancelled = False
+        self.snapshot: t.Optional[SearchSnapshot] = None
+
+    def cancel(self):
+        """Asks the running search (from another thread) to stop."""
+        self._cancelled = True
+
+    def restart_at(self, state):
+        self._cancelled = False
+        self._root = -1
+        self.snapshot = None
+
+    def _set_root(self, state: pyspiel.State) -> int:
+        """
+        Returns the root of the search from state, reusing the subtree of the
+        previous search when state follows its root.
+        """
+        history = state.history()
+        n = len(self._root_history)
+        node = self._root
+        if node >= 0 and history[:n] == self._root_history:
+            for action in history[n:]:
+                node = self._pool.find_child(node, action)
+                if node < 0:
+                    break
+        else:
+            node = -1
+        if node >= 0:
+            node = self._pool.compact(node)
+        else:
+            node = self._pool.reset(1 - state.current_player())
+        self._root, self._root_history = node, history
+        return node
+
+    def _expand(self, node: int, state: pyspiel.State) -> bool:
+        """Adds the children of a node. Returns False if the pool is full."""
+        priors = self._evaluator.prior(state)
+        start = self._pool.allocate(len(priors))
+        if start < 0:
+            return False
+        actions = np.array([action for action, _ in priors], dtype=np.int32)
+        self._random_state.shuffle(actions)  # Reduces bias of the move order
+        end = start + len(actions)
+        self._pool.action[start:end] = actions
+        self._pool.player[start:end] = state.current_player()
+        self._pool.first_child[node] = start
+        self._pool.num_children[node] = len(actions)
+        return True
+
+    def _select(self, node: int) -> int:
+        """
+        Returns a winning child if one is proven, otherwise the child
+        maximising the UCT value (unvisited children first, proven losses
+        last).
+        """
+        children = self._pool.children(node)
+        winning = np.flatnonzero(self._pool.solved[children] == 1)
+        if len(winning):
+            return children.start + int(winning[0])
+        visits = self._pool.visits[children]
+        unvisited = np.flatnonzero(visits == 0)
+        if len(unvisited):
+            return children.start + int(unvisited[0])
+        log_visits = math.log(self._pool.visits[node])
+        uct = self._pool.value_sum[children] / visits + self._uct_c * np.sqrt(
+            log_visits / visits
+        )
+        # Like open_spiel, proven losses are worth -1, without exploration
+        uct[self._pool.solved[children] == -1] = -1.0
+        return children.start + int(np.argmax(uct))
+
+    def _solve(self, path: np.ndarray, returns: np.ndarray):
+        """
+        Backs up the result of a terminal leaf (the last node of path): a node
+        is lost for the player who moved into it if one of its children is
+        won, and won if all its children are lost.
+        """
+        pool = self._pool
+        leaf = path[-1]
+        pool.solved[leaf] = np.sign(returns[pool.player[leaf]])
+        for depth in range(len(path) - 1, 0, -1):
+            child, parent = path[depth], path[depth - 1]
+            if pool.solved[child] == 1:
+                pool.solved[parent] = -1
+            elif pool.solved[child] == -1 and np.all(
+                pool.solved[pool.children(parent)] == -1
+            ):
+                pool.solved[parent] = 1
+            else:
+                break
+
+    def _publish(self, root: int, simulations: int):
+        """Replaces the snapshot with the statistics of the root children."""
+        pool = self._pool
+        children = pool.children(root)
+        visits = pool.visits[children].astype(np.int64)
+        self.snapshot = SearchSnapshot(
+            player=int(pool.player[children.start]) if visits.size else -1,
+            simulations=simulations,
+            actions=pool.action[children].astype(np.int64),
+            visits=visits,
+            values=pool.value_sum[children] / np.maximum(visits, 1),
+        )
+
+    def search(self, state: pyspiel.State) -> int:
+        """
+        Runs the simulations from state.
+
+        Returns:
+            int: index of the root in the NodePool
+        """
+        pool = self._pool
+        root = self._set_root(state)
+        next_snapshot = time.perf_counter() + self._snapshot_interval
+        path = np.empty(self._game.max_game_length() + 1, dtype=np.int64)
+        try:
+            for simulation in range(1, self._max_simulations + 1):
+                node, working_state, depth = root, state.clone(), 0
+                path[0] = root
+                while not working_state.is_terminal():
+                    if pool.first_child[node] < 0:
+                        if pool.visits[node] == 0 or not self._expand(
+                            node, working_state
+                        ):
+                            break  # Leaf: evaluated below
+                    node = self._select(node)
+                    working_state.apply_action(pool.action[node])
+                    depth += 1
+                    path[depth] = node
+
+                nodes = path[: depth + 1]
+                if working_state.is_terminal():
+                    returns = np.asarray(working_state.returns())
+                    self._solve(nodes, returns)
+                else:
+                    returns = self._evaluator.evaluate(working_state)
+                pool.visits[nodes] += 1
+                pool.value_sum[nodes] += returns[pool.player[nodes]]
+
+                if simulation % 16 == 0 and self._cancelled:
+                    raise SearchCancelled()
+                if simulation % 16 == 0 and time.perf_counter() >= next_snapshot:
+                    next_snapshot = time.perf_counter() + self._snapshot_interval
+                    self._publish(root, simulation)
+                if pool.solved[root] != 0:
+                    break
+        finally:
+            self.snapshot = None
+        return root
+
+    def step_with_policy(self, state):
+        root = self.search(state)
+        pool = self._pool
+        if pool.first_child[root] < 0:
+            # The root couldn't be expanded (pool full): random legal action
+            legal_actions = state.legal_actions(state.current_player())
+            policy = [(a, 1.0 / len(legal_actions)) for a in legal_actions]
+            return policy, int(self._random_state.choice(legal_actions))
+        children = pool.children(root)
+        visits = pool.visits[children]
+        values = pool.value_sum[children] / np.maximum(visits, 1)
+        # Proven wins first, proven losses last, then the most visited
+        solved = pool.solved[children]
+        best = children.start + int(np.lexsort((values, visits, solved))[-1])
+        total = max(int(visits.sum()), 1)
+        policy = [
+            (int(pool.action[i]), pool.visits[i] / total)
+            for i in range(children.start, children.stop)
+        ]
+        return policy, int(pool.action[best])
+
+    def step(self, state):
+        return self.step_with_policy(state)[1]
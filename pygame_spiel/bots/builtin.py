@@ -0,0 +1,322 @@
+import re
+import site
+from pathlib import Path
+
+import numpy as np
+
+import pyspiel
+
+from pygame_spiel.games.settings import (
+    MCTS_ARRAY_MAX_NODES,
+    OPENING_BOOK_CAPACITY,
+    SEARCH_SNAPSHOT_INTERVAL,
+)
+
+
+def get_opening_book_path(game: pyspiel.Game) -> Path:
+    """
+    Returns the path of the opening book of a game (one file per game and
+    set of parameters), stored next to the downloaded weights.
+
+    Parameters:
+        game (pyspiel.Game): open_spiel game
+    """
+    file_name = re.sub(r"[^A-Za-z0-9]+", "_", str(game)).strip("_") + ".book"
+    return Path(site.getsitepackages()[0], "pygame_spiel/data/opening_books", file_name)
+
+
+def rollout_evaluator(
+    game: pyspiel.Game,
+    rollouts: str,
+    rng: np.random.RandomState,
+    rollout_count: int = 1,
+):
+    """
+    Returns the MCTS evaluator playing random rollouts.
+
+    Parameters:
+        game (pyspiel.Game): open_spiel game
+        rollouts (str): "fast" for the rollouts of
+            pygame_spiel.bots.fast_rollout, "pyspiel" for open_spiel's
+            RandomRolloutEvaluator, "auto" for fast rollouts when they are
+            compiled with Numba and the game supports them
+        rng (np.random.RandomState): random generator of the evaluator
+        rollout_count (int): number of rollouts per evaluation
+    """
+    from open_spiel.python.algorithms import mcts
+
+    from pygame_spiel.bots import fast_rollout
+
+    if rollouts == "auto":
+        supported = game.get_type().short_name in fast_rollout.SUPPORTED_GAMES
+        rollouts = "fast" if supported and fast_rollout.is_compiled() else "pyspiel"
+    if rollouts == "fast":
+        seed = int(rng.randint(2**31))
+        return fast_rollout.FastRolloutEvaluator(game, rollout_count, seed=seed)
+    if rollouts == "pyspiel":
+        return mcts.RandomRolloutEvaluator(rollout_count, rng)
+    raise ValueError("Invalid rollouts: %s" % rollouts)
+
+
+def mcts_bot(
+    game: pyspiel.Game,
+    player_id: int,
+    seed: int = 42,
+    opening_book: str = None,
+    rollouts: str = "pyspiel",
+) -> pyspiel.Bot:
+    """
+    Returns a MCTS Bot using random rollouts to evaluate the leaves. The Bot
+    publishes snapshots of its search, which the games draw while it thinks
+    (see pygame_spiel.bots.live_mcts).
+
+    Parameters:
+        game (pyspiel.Game): open_spiel game
+        player_id (int): id of the player that the bot will be driving
+        seed (int): seed of the Bot's random generator
+        opening_book (str): path of a persistent opening book (optional), see
+            pygame_spiel.bots.opening_book
+        rollouts (str): "fast", "pyspiel" or "auto", see rollout_evaluator()
+    """
+    from pygame_spiel.bots.live_mcts import LiveMCTSBot
+
+    rng = np.random.RandomState(seed)
+    utc = 2  # UCT's exploration constant
+    max_simulations = 1000
+    evaluator = rollout_evaluator(game, rollouts, rng)
+    solve = True  # Whether to use MCTS-Solver.
+    verbose = False
+    if opening_book is not None:
+        from pygame_spiel.bots import opening_book as book
+
+        return book.OpeningBookMCTSBot(
+            game,
+            utc,
+            max_simulations,
+            evaluator,
+            book.OpeningBook(opening_book, capacity=OPENING_BOOK_CAPACITY),
+            snapshot_interval=SEARCH_SNAPSHOT_INTERVAL / 1000,
+            random_state=rng,
+            solve=solve,
+            verbose=verbose,
+        )
+    return LiveMCTSBot(
+        game,
+        utc,
+        max_simulations,
+        evaluator,
+        snapshot_interval=SEARCH_SNAPSHOT_INTERVAL / 1000,
+        random_state=rng,
+        solve=solve,
+        verbose=verbose,
+    )
+
+
+def mcts_book_bot(game: pyspiel.Game, player_id: int, seed: int = 42) -> pyspiel.Bot:
+    """
+    Returns a MCTS Bot which reads and updates the opening book of the game, so
+    that its first moves are nearly instant and improve across sessions.
+
+    Parameters:
+        game (pyspiel.Game): open_spiel game
+        player_id (int): id of the player that the bot will be driving
+        seed (int): seed of the Bot's random generator
+    """
+    return mcts_bot(
+        game, player_id, seed=seed, opening_book=get_opening_book_path(game)
+    )
+
+
+def mcts_fast_bot(game: pyspiel.Game, player_id: int, seed: int = 42) -> pyspiel.Bot:
+    """
+    Returns a MCTS Bot playing its rollouts with the kernels of
+    pygame_spiel.bots.fast_rollout (compiled with Numba when it's installed)
+    instead of open_spiel's RandomRolloutEvaluator.
+
+    Parameters:
+        game (pyspiel.Game): tic_tac_toe or breakthrough game
+        player_id (int): id of the player that the bot will be driving
+        seed (int): seed of the Bot's random generator
+    """
+    return mcts_bot(game, player_id, seed=seed, rollouts="fast")
+
+
+def mcts_array_bot(
+    game: pyspiel.Game,
+    player_id: int,
+    seed: int = 42,
+    max_simulations: int = 1000,
+    max_nodes: int = MCTS_ARRAY_MAX_NODES,
+    rollouts: str = "pyspiel",
+) -> pyspiel.Bot:
+    """
+    Returns a MCTS Bot whose tree is stored in preallocated NumPy arrays, with
+    a bounded number of nodes, reusing its tree between moves.
+
+    Parameters:
+        game (pyspiel.Game): open_spiel game
+        player_id (int): id of the player that the bot will be driving
+        seed (int): seed of the Bot's random generator
+        max_simulations (int): number of simulations per move
+        max_nodes (int): maximum number of nodes of the tree
+        rollouts (str): "fast", "pyspiel" or "auto", see rollout_evaluator()
+    """
+    from pygame_spiel.bots.array_mcts import ArrayMCTSBot
+
+    rng = np.random.RandomState(seed)
+    return ArrayMCTSBot(
+        game,
+        player_id,
+        rollout_evaluator(game, rollouts, rng),
+        max_simulations=max_simulations,
+        max_nodes=max_nodes,
+        snapshot_interval=SEARCH_SNAPSHOT_INTERVAL / 1000,
+        seed=seed,
+    )
+
+
+def alphabeta_bot(
+    game: pyspiel.Game, player_id: int, time_limit: float = 1.0, seed: int = 42
+) -> pyspiel.Bot:
+    """
+    Returns a Breakthrough Bot searching with iterative-deepening alpha-beta.
+
+    Parameters:
+        game (pyspiel.Game): breakthrough game
+        player_id (int): id of the player that the bot will be driving
+        time_limit (float): search time per move, in seconds
+        seed (int): seed of the Zobrist hashing keys
+    """
+    from pygame_spiel.bots.alphabeta import AlphaBetaBot
+
+    return AlphaBetaBot(game, player_id, time_limit=time_limit, seed=seed)
+
+
+def random_bot(game: pyspiel.Game, player_id: int, seed: int = 42) -> pyspiel.Bot:
+    """
+    Returns a Bot choosing uniformly at random among the legal actions.
+
+    Parameters:
+        game (pyspiel.Game): open_spiel game
+        player_id (int): id of the player that the bot will be driving
+        seed (int): seed of the Bot's random generator
+    """
+    from open_spiel.python.bots import uniform_random
+
+    rng = np.random.RandomState(seed)
+    return uniform_random.UniformRandomBot(player_id, rng)
+
+
+def dqn_bot(
+    game: pyspiel.Game,
+    player_id: int,
+    checkpoint_dir: str = None,
+    backend: str = "numpy",
+) -> pyspiel.Bot:
+    """
+    Returns a DQN Bot, optionally restored from a checkpoint.
+
+    The default "numpy" backend evaluates the Q-network with NumPy, reading
+    the open_spiel checkpoint without TensorFlow (see
+    pygame_spiel.bots.dqn_numpy). The "tensorflow" backend evaluates the same
+    Q-network with TensorFlow.
+
+    Parameters:
+        game (pyspiel.Game): open_spiel game
+        player_id (int): id of the player that the bot will be driving
+        checkpoint_dir (str): Path to the DQN weigths (optional)
+        backend (str): "numpy", "torch" or "tensorflow"
+    """
+    if backend == "numpy":
+        from pygame_spiel.bots import dqn_numpy
+
+        return dqn_numpy.DQNBot(game, player_id, checkpoint_dir=checkpoint_dir)
+    if backend == "torch":
+        return dqn_torch_bot(game, player_id, checkpoint_dir=checkpoint_dir)
+    if backend != "tensorflow":
+        raise ValueError("Invalid DQN backend: %s" % backend)
+
+    from pygame_spiel.bots import dqn
+
+    return dqn.DQNBot(game, player_id=player_id, checkpoint_dir=checkpoint_dir)
+
+
+def dqn_torch_bot(
+    game: pyspiel.Game,
+    player_id: int,
+    checkpoint_dir: str = None,
+    num_threads: int = 1,
+) -> pyspiel.Bot:
+    """
+    Returns a DQN Bot evaluating its Q-network with PyTorch (without
+    TensorFlow). The weights are loaded when the Bot plays its first move.
+
+    Parameters:
+        game (pyspiel.Game): open_spiel game
+        player_id (int): id of the player that the bot will be driving
+        checkpoint_dir (str): Path to the DQN weigths (optional)
+        num_threads (int): number of PyTorch threads. The setting is
+            process-global: it is applied when the Bot is built and also
+            affects the other PyTorch Bots of the process (the last one built
+            wins). None keeps the current setting
+    """
+    from pygame_spiel.bots import dqn_pytorch
+
+    return dqn_pytorch.DQNBot(
+        game, player_id, checkpoint_dir=checkpoint_dir, num_threads=num_threads
+    )
+
+
+def dqn_mcts_bot(
+    game: pyspiel.Game,
+    player_id: int,
+    checkpoint_dir: str = None,
+    max_simulations: int = 400,
+    batch_size: int = 16,
+) -> pyspiel.Bot:
+    """
+    Returns a MCTS Bot guided by the DQN Q-networks (priors and values), which
+    evaluates the leaves of the search in batches.
+
+    Parameters:
+        game (pyspiel.Game): open_spiel game
+        player_id (int): id of the player that the bot will be driving
+        checkpoint_dir (str): Path to the DQN weigths (optional, untrained
+            networks are used otherwise)
+        max_simulations (int): number of simulations per move
+        batch_size (int): number of leaves evaluated together
+    """
+    from pygame_spiel.bots import dqn_numpy
+    from pygame_spiel.bots.neural_mcts import BatchedMCTSBot, QNetworkEvaluator
+
+    if checkpoint_dir is not None:
+        q_networks = [
+            dqn_numpy.load_q_network(checkpoint_dir, p, game) for p in range(2)
+        ]
+    else:
+        q_networks = [
+            dqn_numpy.QNetwork.random(
+                game.observation_tensor_size(), [64, 64], game.num_distinct_actions()
+            )
+            for _ in range(2)
+        ]
+    return BatchedMCTSBot(
+        game,
+        player_id,
+        QNetworkEvaluator(q_networks),
+        max_simulations=max_simulations,
+        batch_size=batch_size,
+    )
+
+
+def human_bot(game: pyspiel.Game, player_id: int) -> pyspiel.Bot:
+    """
+    Returns a placeholder Bot for a human player (moves come from the UI).
+
+    Parameters:
+        game (pyspiel.Game): open_spiel game
+        player_id (int): id of the player that the bot will be driving
+    """
+    from open_spiel.python.bots import human
+
+    return human.HumanBot()
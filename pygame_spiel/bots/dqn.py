@@ -1,92 +1,78 @@
 import os
 import tensorflow.compat.v1 as tf
 
-from open_spiel.python import rl_environment
-from open_spiel.python.algorithms.dqn import DQN
+import numpy as np
 
 import pyspiel
 
+from pygame_spiel.bots.dqn_numpy import QNetwork, masked_argmax, read_checkpoint
+
 
 class DQNBot(pyspiel.Bot):
-    """Bot that uses DQN algorithm."""
+    """Bot that plays greedily w.r.t. the Q-network of an open_spiel DQN agent."""
 
     def __init__(
         self,
         game,
         player_id,
-        replay_buffer_capacity=int(1e5),
-        batch_size=32,
         checkpoint_dir=None,
+        hidden_layers_sizes=(64, 64),
     ):
-        """Initializes a DQN algorithm in the form of a bot.
+        """Initializes the Q-network of a DQN agent trained with open_spiel.
+
+        Only the online Q-network is built (in its own graph), for inference:
+        no replay buffer, target network, optimizer nor rl_environment. The
+        weights are read from the checkpoint of the given player, so the Bots
+        of the two players don't need to be built together (see
+        https://github.com/deepmind/open_spiel/issues/1104).
+
         Args:
           game: A pyspiel.Game to play.
           player_id: ID associated to the player.
-          replay_buffer_capacity: Replay buffer size
-          batch_size: Training batch size (not used in this Bot yet)
+          checkpoint_dir: folder with the open_spiel checkpoint (optional,
+            an untrained network is used otherwise)
+          hidden_layers_sizes: sizes of the hidden layers, only used to build
+            an untrained network when no checkpoint is given
         """
 
         pyspiel.Bot.__init__(self)
 
-        self._num_players = game.num_players()
-        self._hidden_layer_sizes = [64, 64]  # TODO add parameter in constructor
-        self._env = rl_environment.Environment(game)
-        info_state_size = self._env.observation_spec()["info_state"][0]
-        num_actions = self._env.action_spec()["num_actions"]
-        self._time_step = self._env.reset()
-
-        self._sess = tf.Session()
-        hidden_layers_sizes = [int(l) for l in self._hidden_layer_sizes]
-
-        self._agent = DQN(
-            session=self._sess,
-            player_id=player_id,
-            state_representation_size=info_state_size,
-            num_actions=num_actions,
-            hidden_layers_sizes=hidden_layers_sizes,
-            replay_buffer_capacity=replay_buffer_capacity,
-            batch_size=batch_size,
-        )
-        # self._agent.restore(checkpoint_dir)
+        self._player_id = player_id
         if checkpoint_dir is not None:
             if not os.path.exists(checkpoint_dir):
                 raise FileNotFoundError("No folder exists at the location specified")
-            self._agent.restore(checkpoint_dir)
+            weights, biases = read_checkpoint(checkpoint_dir, player_id)
         else:
-            self._sess.run(tf.global_variables_initializer())
+            q_network = QNetwork.random(
+                game.observation_tensor_size(),
+                hidden_layers_sizes,
+                game.num_distinct_actions(),
+            )
+            weights, biases = q_network.weights, q_network.biases
+
+        # Same architecture as open_spiel's simple_nets.MLP: ReLU on hidden
+        # layers, linear output. The weights are constants of the graph.
+        self._graph = tf.Graph()
+        with self._graph.as_default():
+            self._info_state_ph = tf.placeholder(
+                shape=[None, game.observation_tensor_size()], dtype=tf.float32
+            )
+            x = self._info_state_ph
+            for i, (w, b) in enumerate(zip(weights, biases)):
+                x = tf.matmul(x, tf.constant(w)) + tf.constant(b)
+                if i < len(weights) - 1:
+                    x = tf.nn.relu(x)
+            self._q_values = x
+        self._sess = tf.Session(graph=self._graph)
 
     def restart_at(self, state):
         pass
 
     def step(self, state):
         """Returns bot's action at given state."""
-
-        #  Next lines taken from https://github.com/deepmind/open_spiel/issues/896
         player_id = state.current_player()
-        legal_actions = [
-            state.legal_actions(player_id) for _ in range(self._num_players)
-        ]
-        info_state = [
-            state.observation_tensor(player_id) for _ in range(self._num_players)
-        ]
-        step_type = (
-            rl_environment.StepType.LAST
-            if state.is_terminal()
-            else rl_environment.StepType.MID
-        )
-        time_step = rl_environment.TimeStep(
-            observations={
-                "info_state": info_state,
-                "legal_actions": legal_actions,
-                "current_player": player_id,
-            },
-            rewards=state.rewards(),
-            discounts=[1.0, 1.0],
-            step_type=step_type,
-        )
-
-        agent_output = self._agent.step(time_step, is_evaluation=True)
-        action = (
-            agent_output.action
-        )  # TODO expand functionality to simultaneous games with apply_actions()
-        return action
+        info_state = np.asarray(state.observation_tensor(player_id), dtype=np.float32)
+        q_values = self._sess.run(
+            self._q_values, feed_dict={self._info_state_ph: info_state[None]}
+        )[0]
+        return masked_argmax(q_values, state.legal_actions(player_id))
@@ -0,0 +1,288 @@
+import os
+import re
+import typing as t
+from pathlib import Path
+
+import numpy as np
+
+import pyspiel
+
+
+def weights_path(checkpoint_dir: str, player_id: int) -> Path:
+    """
+    Returns the path of the .npz file holding the exported Q-network weights of
+    a player. The file is stored next to the open_spiel checkpoint.
+
+    Parameters:
+        checkpoint_dir (str): folder containing the open_spiel DQN checkpoint
+        player_id (int): id of the player the Q-network was trained for
+
+    Returns:
+        Path: path to the .npz file
+    """
+    return Path(checkpoint_dir, f"q_network_pid{player_id}.npz")
+
+
+def _natural_key(name: str) -> t.List[t.Any]:
+    """Sort key ordering "linear_2" before "linear_10"."""
+    return [int(s) if s.isdigit() else s for s in re.split(r"(\d+)", name)]
+
+
+def read_checkpoint(
+    checkpoint_dir: str, player_id: int
+) -> t.Tuple[t.List[np.ndarray], t.List[np.ndarray]]:
+    """
+    Reads the Q-network weights of a player from an open_spiel (TensorFlow)
+    DQN checkpoint.
+
+    open_spiel saves the Q-network of each player under the prefix
+    "q_network_pid<player_id>". The variables are read directly from the
+    checkpoint files (see pygame_spiel.bots.tf_checkpoint), so neither
+    TensorFlow nor a DQN graph is needed. The layers of the
+    network are ordered by their variable scope (linear, linear_1, ...),
+    and the weights/biases are told apart by their rank.
+
+    Parameters:
+        checkpoint_dir (str): folder containing the open_spiel DQN checkpoint
+        player_id (int): id of the player the Q-network was trained for
+
+    Returns:
+        tuple: weights and biases of each layer
+    """
+    from pygame_spiel.bots import tf_checkpoint
+
+    prefix = os.path.join(checkpoint_dir, f"q_network_pid{player_id}")
+    variables = tf_checkpoint.read_variables(prefix)
+
+    layers = dict()  # variable scope -> {rank: tensor}
+    for name, tensor in variables.items():
+        if tensor.ndim not in (1, 2):
+            continue  # e.g. global step or optimizer slots
+        scope = name.rsplit("/", 1)[0]
+        if tensor.ndim in layers.setdefault(scope, dict()):
+            raise ValueError(
+                f"{prefix}: more than one rank-{tensor.ndim} variable in {scope}"
+            )
+        layers[scope][tensor.ndim] = tensor
+
+    scopes = sorted(layers.keys(), key=_natural_key)
+    for scope in scopes:
+        if set(layers[scope].keys()) != {1, 2}:
+            raise ValueError(f"{prefix}: {scope} doesn't have a weight and a bias")
+    weights = [layers[scope][2].astype(np.float32) for scope in scopes]
+    biases = [layers[scope][1].astype(np.float32) for scope in scopes]
+    check_layers(weights, biases, scopes)
+    return weights, biases
+
+
+def check_layers(
+    weights: t.List[np.ndarray],
+    biases: t.List[np.ndarray],
+    names: t.List[str] = None,
+):
+    """
+    Checks that weights and biases form a multi-layer perceptron: the bias of
+    each layer matches its output size, and each layer's output size is the
+    input size of the next one. Raises a ValueError otherwise.
+
+    Parameters:
+        weights (list[np.ndarray]): weights of shape [input_size, output_size]
+        biases (list[np.ndarray]): biases of shape [output_size]
+        names (list[str]): names of the layers, used in the error messages
+            (optional)
+    """
+    names = names or [f"layer {i}" for i in range(len(weights))]
+    if not weights:
+        raise ValueError("The Q-network has no layers")
+    for i, (w, b) in enumerate(zip(weights, biases)):
+        if b.shape != (w.shape[1],):
+            raise ValueError(
+                f"{names[i]}: bias of shape {b.shape} doesn't match the "
+                f"weights of shape {w.shape}"
+            )
+        if i + 1 < len(weights) and weights[i + 1].shape[0] != w.shape[1]:
+            raise ValueError(
+                f"{names[i]} outputs {w.shape[1]} values but {names[i + 1]} "
+                f"takes {weights[i + 1].shape[0]} inputs"
+            )
+
+
+def export_checkpoint(
+    checkpoint_dir: str, player_id: int, dest_path: str = None
+) -> Path:
+    """
+    Converts the Q-network of an open_spiel (TensorFlow) DQN checkpoint to a
+    compact .npz file, which is faster to load than the checkpoint.
+
+    Parameters:
+        checkpoint_dir (str): folder containing the open_spiel DQN checkpoint
+        player_id (int): id of the player the Q-network was trained for
+        dest_path (str): destination .npz file (optional, by default the file
+            is saved in checkpoint_dir)
+
+    Returns:
+        Path: path to the .npz file
+    """
+    weights, biases = read_checkpoint(checkpoint_dir, player_id)
+    arrays = dict()
+    for i, (w, b) in enumerate(zip(weights, biases)):
+        arrays[f"w{i}"] = w
+        arrays[f"b{i}"] = b
+
+    dest_path = Path(dest_path or weights_path(checkpoint_dir, player_id))
+    np.savez_compressed(dest_path, **arrays)
+    return dest_path
+
+
+def masked_argmax(q_values: np.ndarray, legal_actions: t.List[int]) -> int:
+    """
+    Returns the legal action with the highest Q-value. Ties are broken in
+    favour of the lowest action id, as in open_spiel's DQN.
+
+    Parameters:
+        q_values (np.ndarray): Q-values of all the actions
+        legal_actions (list[int]): legal actions (sorted)
+
+    Returns:
+        action (int): greedy legal action
+    """
+    return legal_actions[int(np.argmax(q_values[legal_actions]))]
+
+
+class QNetwork:
+    """
+    Multi-layer perceptron evaluated with NumPy. Same architecture as
+    open_spiel's simple_nets.MLP: ReLU on hidden layers, linear output.
+    """
+
+    def __init__(self, weights: t.List[np.ndarray], biases: t.List[np.ndarray]):
+        self.weights = weights
+        self.biases = biases
+
+    @classmethod
+    def load(cls, path: str) -> "QNetwork":
+        """
+        Loads the weights exported by export_checkpoint().
+
+        Parameters:
+            path (str): path to the .npz file
+        """
+        with np.load(path) as data:
+            n_layers = len(data.files) // 2
+            weights = [data[f"w{i}"] for i in range(n_layers)]
+            biases = [data[f"b{i}"] for i in range(n_layers)]
+        return cls(weights, biases)
+
+    @classmethod
+    def random(
+        cls,
+        input_size: int,
+        hidden_layers_sizes: t.List[int],
+        output_size: int,
+        rng: np.random.RandomState = None,
+    ) -> "QNetwork":
+        """
+        Returns an untrained network, initialised similarly to simple_nets.MLP
+        (normal weights clipped at 2 stddev, scaled by 1/sqrt(fan_in), and
+        zero biases).
+        """
+        rng = rng or np.random.RandomState()
+        weights, biases = [], []
+        sizes = [input_size] + list(hidden_layers_sizes) + [output_size]
+        for in_size, out_size in zip(sizes[:-1], sizes[1:]):
+            w = rng.normal(0.0, 1.0, size=(in_size, out_size))
+            w = np.clip(w, -2.0, 2.0) / np.sqrt(in_size)
+            weights.append(w.astype(np.float32))
+            biases.append(np.zeros(out_size, dtype=np.float32))
+        return cls(weights, biases)
+
+    def __call__(self, info_states: np.ndarray) -> np.ndarray:
+        """
+        Returns the Q-values of a batch of information states.
+
+        Parameters:
+            info_states (np.ndarray): array of shape [batch, input_size]
+
+        Returns:
+            np.ndarray: array of shape [batch, num_actions]
+        """
+        x = np.asarray(info_states, dtype=np.float32)
+        last = len(self.weights) - 1
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            x = x @ w + b
+            if i < last:
+                np.maximum(x, 0.0, out=x)
+        return x
+
+
+def load_q_network(
+    checkpoint_dir: str, player_id: int, game: pyspiel.Game = None
+) -> QNetwork:
+    """
+    Returns the Q-network of a player stored in an open_spiel DQN checkpoint,
+    exporting it to .npz the first time.
+
+    Parameters:
+        checkpoint_dir (str): folder containing the open_spiel DQN checkpoint
+        player_id (int): id of the player the Q-network was trained for
+        game (pyspiel.Game): if given, the network is checked to fit the
+            game's observations and actions (e.g. the same board size)
+    """
+    if not os.path.exists(checkpoint_dir):
+        raise FileNotFoundError("No folder exists at the location specified")
+    path = weights_path(checkpoint_dir, player_id)
+    if not path.exists():
+        export_checkpoint(checkpoint_dir, player_id, path)
+    q_network = QNetwork.load(path)
+    if game is not None:
+        shape = (q_network.weights[0].shape[0], q_network.weights[-1].shape[1])
+        expected = (game.observation_tensor_size(), game.num_distinct_actions())
+        if shape != expected:
+            raise ValueError(
+                f"The DQN weights in {checkpoint_dir} don't fit {game} "
+                f"(network shape {shape}, game shape {expected})"
+            )
+    return q_network
+
+
+class DQNBot(pyspiel.Bot):
+    """Bot that plays greedily w.r.t. a DQN Q-network evaluated with NumPy."""
+
+    def __init__(
+        self,
+        game,
+        player_id,
+        checkpoint_dir=None,
+        hidden_layers_sizes=(64, 64),
+    ):
+        """Initializes the Q-network of a DQN agent trained with open_spiel.
+        Args:
+          game: A pyspiel.Game to play.
+          player_id: ID associated to the player.
+          checkpoint_dir: folder with the open_spiel checkpoint. The weights
+            are exported to .npz the first time.
+          hidden_layers_sizes: sizes of the hidden layers, only used to build
+            an untrained network when no checkpoint is given
+        """
+
+        pyspiel.Bot.__init__(self)
+
+        self._player_id = player_id
+        if checkpoint_dir is not None:
+            self._q_network = load_q_network(checkpoint_dir, player_id, game)
+        else:
+            self._q_network = QNetwork.random(
+                game.observation_tensor_size(),
+                hidden_layers_sizes,
+                game.num_distinct_actions(),
+            )
+
+    def restart_at(self, state):
+        pass
+
+    def step(self, state):
+        """Returns bot's action at given state."""
+        player_id = state.current_player()
+        info_state = np.asarray(state.observation_tensor(player_id), dtype=np.float32)
+        q_values = self._q_network(info_state[None])[0]
+        return masked_argmax(q_values, state.legal_actions(player_id))
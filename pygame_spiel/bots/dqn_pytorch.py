@@ -1,91 +1,177 @@
 import os
-import tensorflow.compat.v1 as tf
+import typing as t
+from pathlib import Path
 
-from open_spiel.python import rl_environment
-from open_spiel.python.pytorch import dqn as dqn_pt
+import numpy as np
+import torch
+from torch import nn
 
 import pyspiel
 
+from pygame_spiel.bots.dqn_numpy import masked_argmax
+
+
+def weights_path(checkpoint_dir: str, player_id: int) -> Path:
+    """
+    Returns the path of the Q-network saved by open_spiel's PyTorch DQN
+    (DQN.save()) for a player.
+
+    Parameters:
+        checkpoint_dir (str): folder containing the checkpoint
+        player_id (int): id of the player the Q-network was trained for
+    """
+    return Path(checkpoint_dir, f"q_network_pid{player_id}.pt")
+
+
+def build_q_network(
+    weights: t.List[torch.Tensor], biases: t.List[torch.Tensor]
+) -> nn.Sequential:
+    """
+    Builds a Q-network with the same architecture as open_spiel's PyTorch MLP
+    (ReLU on hidden layers, linear output) from the weights of each layer.
+
+    Parameters:
+        weights (list[torch.Tensor]): weights of shape [out_size, in_size]
+        biases (list[torch.Tensor]): biases of shape [out_size]
+    """
+    layers = []
+    for i, (w, b) in enumerate(zip(weights, biases)):
+        linear = nn.Linear(w.shape[1], w.shape[0])
+        with torch.no_grad():
+            linear.weight.copy_(w)
+            linear.bias.copy_(b)
+        layers.append(linear)
+        if i < len(weights) - 1:
+            layers.append(nn.ReLU())
+    return nn.Sequential(*layers)
+
+
+def load_q_network(path: str) -> nn.Sequential:
+    """
+    Loads a Q-network saved by open_spiel's PyTorch DQN, either as a whole
+    module, as a state dict, or (newer open_spiel versions) as a dict holding
+    the state dict under "model" (or "model_state_dict") next to the
+    optimizer state. Only the weights are kept: the layers are those of the
+    state dict, in order.
+
+    Parameters:
+        path (str): path to the saved Q-network
+    """
+    # Whole modules are pickled objects, which torch>=2.6 refuses to load by
+    # default (weights_only=True): the checkpoint must come from a trusted source
+    data = torch.load(path, map_location="cpu", weights_only=False)
+    for key in ("model", "model_state_dict"):
+        if isinstance(data, dict) and key in data:
+            data = data[key]
+    if isinstance(data, nn.Module):
+        data = data.state_dict()
+    weights = [v.float() for v in data.values() if v.dim() == 2]
+    biases = [v.float() for v in data.values() if v.dim() == 1]
+    return build_q_network(weights, biases)
+
+
+def set_num_threads(num_threads: t.Optional[int]):
+    """
+    Sets the number of intra-op threads used by PyTorch. The setting is
+    process-global: it applies to every Bot (and any other PyTorch code) of
+    the process, the last call winning. pygame_spiel.transport.RemoteBot runs
+    a Bot in its own process, with its own setting.
+
+    Parameters:
+        num_threads (int): number of threads (None leaves the setting as is)
+    """
+    if num_threads is not None and num_threads != torch.get_num_threads():
+        torch.set_num_threads(num_threads)
+
 
 class DQNBot(pyspiel.Bot):
-    """Bot that uses DQN algorithm."""
+    """
+    Bot that plays greedily w.r.t. a DQN Q-network evaluated with PyTorch.
+
+    TensorFlow is never imported: open_spiel TensorFlow checkpoints are read
+    by pygame_spiel.bots.tf_checkpoint (see load()).
+    """
 
     def __init__(
         self,
         game,
         player_id,
-        replay_buffer_capacity=int(1e5),
-        batch_size=32,
         checkpoint_dir=None,
+        hidden_layers_sizes=(64, 64),
+        num_threads=1,
     ):
-        """Initializes a DQN algorithm in the form of a bot.
+        """Initializes the Q-network of a DQN agent trained with open_spiel.
+
+        Only the online Q-network is built, for inference: no replay buffer,
+        target network, optimizer nor rl_environment. The checkpoint is only
+        read the first time the Bot plays (or when load() is called), so
+        creating the Bot is nearly free.
+
         Args:
           game: A pyspiel.Game to play.
           player_id: ID associated to the player.
-          replay_buffer_capacity: Replay buffer size
-          batch_size: Training batch size (not used in this Bot yet)
+          checkpoint_dir: folder with the Q-network saved by open_spiel's
+            PyTorch DQN, or with an open_spiel TensorFlow checkpoint (optional,
+            an untrained network is used otherwise)
+          hidden_layers_sizes: sizes of the hidden layers, only used to build
+            an untrained network when no checkpoint is given
+          num_threads: number of intra-op threads of PyTorch, set when the
+            Bot is built (None to keep the current setting). The setting is
+            process-global, see set_num_threads().
         """
 
         pyspiel.Bot.__init__(self)
 
-        self._num_players = game.num_players()
-        self._hidden_layer_sizes = [64, 64]  # TODO add parameter in constructor
-        self._env = rl_environment.Environment(game)
-        info_state_size = self._env.observation_spec()["info_state"][0]
-        num_actions = self._env.action_spec()["num_actions"]
-        self._time_step = self._env.reset()
-
-        self._sess = tf.Session()
-        hidden_layers_sizes = [int(l) for l in self._hidden_layer_sizes]
-
-        self._agent = dqn_pt.DQN(
-            player_id=player_id,
-            state_representation_size=info_state_size,
-            num_actions=num_actions,
-            hidden_layers_sizes=hidden_layers_sizes,
-            replay_buffer_capacity=replay_buffer_capacity,
-            batch_size=batch_size,
-        )
-        # self._agent.restore(checkpoint_dir)
-        if checkpoint_dir is not None:
-            if not os.path.exists(checkpoint_dir):
-                raise FileNotFoundError("No folder exists at the location specified")
-            self._agent.restore(checkpoint_dir)
+        if checkpoint_dir is not None and not os.path.exists(checkpoint_dir):
+            raise FileNotFoundError("No folder exists at the location specified")
+        self._game = game
+        self._player_id = player_id
+        self._checkpoint_dir = checkpoint_dir
+        self._hidden_layers_sizes = hidden_layers_sizes
+        self._q_network = None
+        set_num_threads(num_threads)
+
+    def load(self) -> nn.Sequential:
+        """
+        Returns the Q-network, loading it the first time. Weights saved by
+        open_spiel's PyTorch DQN are used if present, otherwise the ones of
+        the TensorFlow checkpoint (read and exported to .npz by dqn_numpy,
+        without TensorFlow).
+        """
+        if self._q_network is not None:
+            return self._q_network
+
+        game, checkpoint_dir = self._game, self._checkpoint_dir
+        if checkpoint_dir is None:
+            sizes = [game.observation_tensor_size()] + list(self._hidden_layers_sizes)
+            sizes.append(game.num_distinct_actions())
+            weights = [
+                nn.Linear(in_size, out_size).weight.detach()
+                for in_size, out_size in zip(sizes[:-1], sizes[1:])
+            ]
+            biases = [torch.zeros(w.shape[0]) for w in weights]
+            q_network = build_q_network(weights, biases)
+        elif weights_path(checkpoint_dir, self._player_id).exists():
+            q_network = load_q_network(weights_path(checkpoint_dir, self._player_id))
         else:
-            self._sess.run(tf.global_variables_initializer())
+            from pygame_spiel.bots import dqn_numpy
+
+            network = dqn_numpy.load_q_network(checkpoint_dir, self._player_id, game)
+            q_network = build_q_network(
+                [torch.from_numpy(w.T.copy()) for w in network.weights],
+                [torch.from_numpy(b) for b in network.biases],
+            )
+        self._q_network = q_network.eval()
+        return self._q_network
 
     def restart_at(self, state):
         pass
 
     def step(self, state):
         """Returns bot's action at given state."""
-
-        #  Next lines taken from https://github.com/deepmind/open_spiel/issues/896
+        q_network = self.load()
         player_id = state.current_player()
-        legal_actions = [
-            state.legal_actions(player_id) for _ in range(self._num_players)
-        ]
-        info_state = [
-            state.observation_tensor(player_id) for _ in range(self._num_players)
-        ]
-        step_type = (
-            rl_environment.StepType.LAST
-            if state.is_terminal()
-            else rl_environment.StepType.MID
-        )
-        time_step = rl_environment.TimeStep(
-            observations={
-                "info_state": info_state,
-                "legal_actions": legal_actions,
-                "current_player": player_id,
-            },
-            rewards=state.rewards(),
-            discounts=[1.0, 1.0],
-            step_type=step_type,
-        )
-
-        agent_output = self._agent.step(time_step, is_evaluation=True)
-        action = (
-            agent_output.action
-        )  # TODO expand functionality to simultaneous games with apply_actions()
-        return action
+        info_state = np.asarray(state.observation_tensor(player_id), dtype=np.float32)
+        with torch.inference_mode():
+            q_values = q_network(torch.from_numpy(info_state)[None])[0]
+        return masked_argmax(q_values.numpy(), state.legal_actions(player_id))
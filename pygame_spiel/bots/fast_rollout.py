@@ -0,0 +1,262 @@
+"""
+Random rollouts over compact array boards, compiled with Numba when it's
+installed (pip install 'pygame_spiel[jit]').
+
+The kernels play random games on a flat board (one integer per cell: 0 for
+empty cells, player + 1 for pieces) without calling pyspiel, which makes the
+rollouts about an order of magnitude faster than open_spiel's
+RandomRolloutEvaluator. Without Numba, the same kernels run as plain Python
+(on lists), at about the speed of open_spiel's evaluator.
+
+Each evaluator has its own random generator (a xorshift32 state given to the
+kernels), so evaluators never reseed each other, and the same seed plays the
+same rollouts with and without Numba.
+"""
+
+import typing as t
+
+import numpy as np
+
+import pyspiel
+from open_spiel.python.algorithms import mcts
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+SUPPORTED_GAMES = ("tic_tac_toe", "breakthrough")
+
+# Cells of the rows, columns and diagonals of tic-tac-toe
+TIC_TAC_TOE_LINES = (
+    (0, 1, 2),
+    (3, 4, 5),
+    (6, 7, 8),
+    (0, 3, 6),
+    (1, 4, 7),
+    (2, 5, 8),
+    (0, 4, 8),
+    (2, 4, 6),
+)
+
+
+def _jit(function: t.Callable) -> t.Callable:
+    """Compiles a kernel with Numba, or returns it unchanged without Numba."""
+    if numba is None:
+        return function
+    return numba.njit(cache=True)(function)
+
+
+def is_compiled() -> bool:
+    """Returns True if the kernels are compiled (Numba is installed)."""
+    return numba is not None
+
+
+def _rng_state(seed: int) -> int:
+    """Returns the (non-zero, 32 bits) xorshift32 state derived from a seed."""
+    return (seed & 0xFFFFFFFF) or 0x9E3779B9
+
+
+@_jit
+def _randrange(rng, n):
+    # Returns a random integer in [0, n), advancing the xorshift32 state rng[0]
+    x = rng[0]
+    x ^= (x << 13) & 0xFFFFFFFF
+    x ^= x >> 17
+    x ^= (x << 5) & 0xFFFFFFFF
+    rng[0] = x
+    return x % n
+
+
+@_jit
+def _tic_tac_toe_rollout(board, player, lines, empty, rng):
+    """
+    Plays random moves until the end of a tic-tac-toe game.
+
+    Parameters:
+        board: 9 cells, modified in place
+        player: player to move
+        lines: TIC_TAC_TOE_LINES
+        empty: buffer of 9 cells
+        rng: random generator state (see _randrange)
+
+    Returns:
+        winner (-1 for a draw)
+    """
+    n_empty = 0
+    for cell in range(9):
+        if board[cell] == 0:
+            empty[n_empty] = cell
+            n_empty += 1
+    while n_empty > 0:
+        i = _randrange(rng, n_empty)
+        cell = empty[i]
+        n_empty -= 1
+        empty[i] = empty[n_empty]
+        token = player + 1
+        board[cell] = token
+        for line in range(8):
+            if (
+                board[lines[line][0]] == token
+                and board[lines[line][1]] == token
+                and board[lines[line][2]] == token
+            ):
+                return player
+        player = 1 - player
+    return -1
+
+
+@_jit
+def _breakthrough_rollout(board, rows, cols, player, pieces, counts, moves, rng):
+    """
+    Plays random moves until the end of a Breakthrough game. Player 0 moves
+    towards the last row, player 1 towards the first one.
+
+    Parameters:
+        board: rows * cols cells, modified in place
+        rows: number of rows
+        cols: number of columns
+        player: player to move
+        pieces: buffer of 2 * rows * cols cells, the cells of the pieces of
+            player p start at p * rows * cols
+        counts: buffer of 2 values, number of pieces of each player
+        moves: buffer of 3 * rows * cols moves
+        rng: random generator state (see _randrange)
+
+    Returns:
+        winner
+    """
+    size = rows * cols
+    counts[0] = 0
+    counts[1] = 0
+    for cell in range(size):
+        if board[cell] != 0:
+            p = board[cell] - 1
+            pieces[p * size + counts[p]] = cell
+            counts[p] += 1
+
+    while True:
+        token = player + 1
+        direction = 1 if player == 0 else -1
+        goal = rows - 1 if player == 0 else 0
+        base = player * size
+
+        # Moves are encoded as piece index * 3 + column offset + 1
+        n_moves = 0
+        for k in range(counts[player]):
+            cell = pieces[base + k]
+            row = cell // cols + direction
+            col = cell % cols
+            for dc in range(-1, 2):
+                if 0 <= col + dc < cols:
+                    target = board[row * cols + col + dc]
+                    if (dc == 0 and target == 0) or (dc != 0 and target != token):
+                        moves[n_moves] = k * 3 + dc + 1
+                        n_moves += 1
+        if n_moves == 0:
+            return 1 - player
+
+        move = moves[_randrange(rng, n_moves)]
+        k = move // 3
+        cell = pieces[base + k]
+        target_cell = (cell // cols + direction) * cols + cell % cols + move % 3 - 1
+        if board[target_cell] != 0:
+            # Capture: the opponent's piece is removed from its list
+            opponent = 1 - player
+            opponent_base = opponent * size
+            for j in range(counts[opponent]):
+                if pieces[opponent_base + j] == target_cell:
+                    counts[opponent] -= 1
+                    pieces[opponent_base + j] = pieces[opponent_base + counts[opponent]]
+                    break
+            if counts[opponent] == 0:
+                return player
+        board[cell] = 0
+        board[target_cell] = token
+        pieces[base + k] = target_cell
+        if target_cell // cols == goal:
+            return player
+        player = 1 - player
+
+
+class FastRolloutEvaluator(mcts.Evaluator):
+    """
+    Drop-in replacement of open_spiel's RandomRolloutEvaluator for tic_tac_toe
+    and Breakthrough, running the rollouts with the kernels of this module.
+    """
+
+    def __init__(self, game: pyspiel.Game, n_rollouts: int = 1, seed: int = 42):
+        """
+        Parameters:
+            game (pyspiel.Game): tic_tac_toe or breakthrough game
+            n_rollouts (int): number of rollouts averaged by each evaluation
+            seed (int): seed of the evaluator's random generator
+        """
+        self._game_name = game.get_type().short_name
+        if self._game_name not in SUPPORTED_GAMES:
+            raise ValueError(f"Fast rollouts not available for {self._game_name}")
+        params = game.get_parameters()
+        self._rows, self._cols = params.get("rows", 3), params.get("columns", 3)
+        self._n_rollouts = n_rollouts
+
+        # Buffers of the kernels: arrays for Numba, lists for plain Python
+        size = self._rows * self._cols
+        buffer = (
+            (lambda n: np.zeros(n, dtype=np.int64)) if numba else (lambda n: [0] * n)
+        )
+        self._lines = np.array(TIC_TAC_TOE_LINES) if numba else TIC_TAC_TOE_LINES
+        self._pieces = buffer(2 * size)
+        self._counts = buffer(2)
+        self._moves = buffer(3 * size)
+        self._rng = buffer(1)
+        self._rng[0] = _rng_state(seed)
+
+    def board(self, state: pyspiel.State) -> np.ndarray:
+        """
+        Returns the compact board of a state: one integer per cell, 0 for empty
+        cells and player + 1 for pieces.
+        """
+        planes = np.asarray(state.observation_tensor(0)).reshape(3, -1)
+        if self._game_name == "tic_tac_toe":
+            # Planes: empty, o (player 1), x (player 0)
+            board = planes[2] + 2 * planes[1]
+        else:
+            # Planes: black (player 0), white (player 1), empty
+            board = planes[0] + 2 * planes[1]
+        return board.astype(np.int64)
+
+    def _rollout(self, board: t.Any, player: int) -> int:
+        """Plays a random game from a board (modified) and returns the winner."""
+        if self._game_name == "tic_tac_toe":
+            return _tic_tac_toe_rollout(
+                board, player, self._lines, self._moves, self._rng
+            )
+        return _breakthrough_rollout(
+            board,
+            self._rows,
+            self._cols,
+            player,
+            self._pieces,
+            self._counts,
+            self._moves,
+            self._rng,
+        )
+
+    def evaluate(self, state):
+        """Returns the average returns of random games played from state."""
+        board = self.board(state)
+        if numba is None:
+            board = board.tolist()
+        player = state.current_player()
+        returns = np.zeros(2)
+        for _ in range(self._n_rollouts):
+            winner = self._rollout(board.copy(), player)
+            if winner >= 0:
+                returns[winner] += 1
+                returns[1 - winner] -= 1
+        return returns / self._n_rollouts
+
+    def prior(self, state):
+        """Returns equal probability for all actions."""
+        legal_actions = state.legal_actions(state.current_player())
+        return [(action, 1.0 / len(legal_actions)) for action in legal_actions]
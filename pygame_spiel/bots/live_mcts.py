@@ -0,0 +1,102 @@
+import time
+import typing as t
+
+import numpy as np
+
+import pyspiel
+from open_spiel.python.algorithms import mcts
+
+
+class SearchSnapshot(t.NamedTuple):
+    """
+    Statistics of the root children during a search. Values are the average
+    returns of each move for the player to move at the root (-1 to 1).
+    """
+
+    player: int
+    simulations: int
+    actions: np.ndarray
+    visits: np.ndarray
+    values: np.ndarray
+
+
+class SearchCancelled(Exception):
+    """Raised by a search stopped with cancel()."""
+
+
+class LiveMCTSBot(mcts.MCTSBot):
+    """
+    MCTS Bot which publishes snapshots of the root children statistics while
+    it searches, so that the UI can draw them (e.g. from another thread).
+
+    The latest snapshot is in the attribute snapshot, which is replaced by a
+    new immutable SearchSnapshot (a single attribute assignment, so readers
+    need no lock). Snapshots are rate-limited: the clock is only read every
+    check_every simulations, and a snapshot is taken when at least
+    snapshot_interval seconds passed since the previous one. The attribute is
+    None outside of searches, so a reader never gets a snapshot of a previous
+    search.
+
+    cancel() stops the running search (e.g. when the UI takes back moves):
+    the flag is checked with the clock, and step() raises SearchCancelled.
+    The flag is cleared by restart_at().
+    """
+
+    def __init__(
+        self,
+        game: pyspiel.Game,
+        uct_c: float,
+        max_simulations: int,
+        evaluator: mcts.Evaluator,
+        snapshot_interval: float = 0.05,
+        check_every: int = 16,
+        **kwargs,
+    ):
+        super().__init__(game, uct_c, max_simulations, evaluator, **kwargs)
+        self._snapshot_interval = snapshot_interval
+        self._check_every = check_every
+        self._simulations = 0
+        self._next_snapshot = 0.0
+        self._cancelled = False
+        self.snapshot: t.Optional[SearchSnapshot] = None
+
+    def _publish(self, root: mcts.SearchNode) -> None:
+        """Replaces the snapshot with the statistics of the root children."""
+        children = root.children or []
+        visits = np.array([c.explore_count for c in children], dtype=np.int64)
+        rewards = np.array([c.total_reward for c in children], dtype=np.float64)
+        self.snapshot = SearchSnapshot(
+            player=root.player,
+            simulations=self._simulations,
+            actions=np.array([c.action for c in children], dtype=np.int64),
+            visits=visits,
+            values=rewards / np.maximum(visits, 1),
+        )
+
+    def _apply_tree_policy(self, root, state):
+        # Called once per simulation, with the root of the search
+        self._simulations += 1
+        if self._simulations % self._check_every == 0:
+            if self._cancelled:
+                raise SearchCancelled()
+            now = time.perf_counter()
+            if now >= self._next_snapshot:
+                self._next_snapshot = now + self._snapshot_interval
+                self._publish(root)
+        return super()._apply_tree_policy(root, state)
+
+    def mcts_search(self, state):
+        self._simulations = 0
+        self._next_snapshot = time.perf_counter() + self._snapshot_interval
+        try:
+            return super().mcts_search(state)
+        finally:
+            self.snapshot = None
+
+    def cancel(self):
+        """Asks the running search (from another thread) to stop."""
+        self._cancelled = True
+
+    def restart_at(self, state):
+        self._cancelled = False
+        self.snapshot = None
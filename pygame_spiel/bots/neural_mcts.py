@@ -0,0 +1,241 @@
+import math
+import typing as t
+
+import numpy as np
+
+import pyspiel
+from open_spiel.python.algorithms import mcts
+
+from pygame_spiel.bots.dqn_numpy import QNetwork
+
+
+class QNetworkEvaluator(mcts.Evaluator):
+    """
+    MCTS evaluator using the DQN Q-networks (one per player) instead of random
+    rollouts.
+
+    The prior of a move is the softmax of the Q-values of the legal actions,
+    and the value of a position is the highest legal Q-value of the player to
+    move (DQN agents are trained with rewards of +1/-1 at the end of the game,
+    so Q-values estimate the outcome). evaluate_batch() evaluates many states
+    with a single forward pass per network. evaluate() and prior() make the
+    evaluator usable by open_spiel's MCTSBot as well.
+    """
+
+    def __init__(self, q_networks: t.List[QNetwork], temperature: float = 0.1):
+        """
+        Parameters:
+            q_networks (list[QNetwork]): Q-network of each player
+            temperature (float): temperature of the softmax of the priors
+        """
+        self._q_networks = q_networks
+        self._temperature = temperature
+
+    def evaluate_batch(
+        self, states: t.List[pyspiel.State]
+    ) -> t.List[t.Tuple[float, t.List[t.Tuple[int, float]]]]:
+        """
+        Evaluates non-terminal states, grouping them by player to move.
+
+        Parameters:
+            states (list[pyspiel.State]): states to evaluate
+
+        Returns:
+            list[tuple]: value (for the player to move) and priors (list of
+                (action, probability)) of each state
+        """
+        results = [None] * len(states)
+        by_player = dict()
+        for i, state in enumerate(states):
+            by_player.setdefault(state.current_player(), []).append(i)
+        for player, indices in by_player.items():
+            observations = np.array(
+                [states[i].observation_tensor(player) for i in indices],
+                dtype=np.float32,
+            )
+            q_values = self._q_networks[player](observations)
+            for i, q in zip(indices, q_values):
+                legal_actions = states[i].legal_actions(player)
+                legal_q = q[legal_actions]
+                logits = (legal_q - legal_q.max()) / self._temperature
+                probabilities = np.exp(logits)
+                probabilities /= probabilities.sum()
+                value = float(np.clip(legal_q.max(), -1.0, 1.0))
+                results[i] = (value, list(zip(legal_actions, probabilities)))
+        return results
+
+    def evaluate(self, state):
+        value, _ = self.evaluate_batch([state])[0]
+        player = state.current_player()
+        return np.array([value if p == player else -value for p in range(2)])
+
+    def prior(self, state):
+        return self.evaluate_batch([state])[0][1]
+
+
+class _Node:
+    """Search tree node. Statistics are from the perspective of the player who moved into the node."""
+
+    __slots__ = ("action", "player", "prior", "visits", "value_sum", "children")
+
+    def __init__(self, action: int, player: int, prior: float):
+        self.action = action
+        self.player = player
+        self.prior = prior
+        self.visits = 0
+        self.value_sum = 0.0
+        self.children = None  # Not expanded yet
+
+
+class BatchedMCTSBot(pyspiel.Bot):
+    """
+    MCTS Bot guided by a QNetworkEvaluator, evaluating leaves in batches.
+
+    Each round of the search descends the tree batch_size times with the PUCT
+    rule. Every descent adds a virtual loss to the nodes it visits, so the
+    following descents of the round explore other branches. The leaves
+    collected in the round are then evaluated together (one forward pass per
+    network), expanded, and their values backed up, removing the virtual
+    losses. A descent ending on a leaf already collected in the round is
+    skipped; after max_collisions such descents, the next one ends the round.
+
+    The tree isn't kept between moves: every search builds a new tree from
+    the given state, so restart_at() and inform_action() have nothing to do.
+    """
+
+    def __init__(
+        self,
+        game: pyspiel.Game,
+        player_id: int,
+        evaluator: QNetworkEvaluator,
+        max_simulations: int = 400,
+        batch_size: int = 16,
+        puct_c: float = 2.0,
+        virtual_loss: float = 1.0,
+        max_collisions: int = 8,
+    ):
+        """
+        Parameters:
+            game (pyspiel.Game): open_spiel game (2 players, zero sum)
+            player_id (int): id of the player that the bot will be driving
+            evaluator (QNetworkEvaluator): evaluator of the leaves
+            max_simulations (int): number of simulations per move
+            batch_size (int): number of leaves evaluated together
+            puct_c (float): exploration constant of the PUCT rule
+            virtual_loss (float): virtual loss added to the nodes of a path
+                while its leaf waits to be evaluated
+            max_collisions (int): number of descents per round which may end
+                on a leaf already waiting to be evaluated: the next one ends
+                the round, which is evaluated with a smaller batch
+        """
+        pyspiel.Bot.__init__(self)
+        self._game = game
+        self._player_id = player_id
+        self._evaluator = evaluator
+        self._max_simulations = max_simulations
+        self._batch_size = batch_size
+        self._puct_c = puct_c
+        self._virtual_loss = virtual_loss
+        self._max_collisions = max_collisions
+
+    def restart_at(self, state):
+        # Nothing to restart: each search builds its own tree
+        pass
+
+    def _select_child(self, node: _Node) -> _Node:
+        """Returns the child maximising the PUCT score."""
+        sqrt_visits = math.sqrt(node.visits + 1)
+        best_score, best_child = -math.inf, None
+        for child in node.children:
+            q = child.value_sum / child.visits if child.visits else 0.0
+            score = q + self._puct_c * child.prior * sqrt_visits / (1 + child.visits)
+            if score > best_score:
+                best_score, best_child = score, child
+        return best_child
+
+    def _backup(self, path: t.List[_Node], returns: t.List[float], virtual: bool):
+        """Adds a result to the nodes of a path, removing its virtual loss."""
+        loss = self._virtual_loss if virtual else 0.0
+        for node in path:
+            node.visits += 1 - loss
+            node.value_sum += returns[node.player] + loss
+
+    def _apply_virtual_loss(self, path: t.List[_Node], sign: float = 1.0):
+        """
+        Counts a lost visit in the nodes of a path, until its leaf is evaluated
+        (sign=-1 removes it).
+        """
+        for node in path:
+            node.visits += sign * self._virtual_loss
+            node.value_sum -= sign * self._virtual_loss
+
+    def _expand(self, node: _Node, player: int, priors: t.List[t.Tuple[int, float]]):
+        node.children = [_Node(action, player, prior) for action, prior in priors]
+
+    def search(self, state: pyspiel.State) -> _Node:
+        """
+        Runs the simulations from state.
+
+        Returns:
+            _Node: root of the search tree
+        """
+        root = _Node(None, None, 1.0)
+        _, priors = self._evaluator.evaluate_batch([state])[0]
+        self._expand(root, state.current_player(), priors)
+        root.visits = 1
+
+        simulations = 0
+        while simulations < self._max_simulations:
+            pending = []  # (leaf, state, path) waiting to be evaluated
+            pending_leaves = set()
+            collided = []  # Paths of the skipped descents
+            descents = min(self._batch_size, self._max_simulations - simulations)
+            collisions = 0
+            while descents > 0:
+                node, leaf_state, path = root, state.clone(), []
+                while node.children:
+                    node = self._select_child(node)
+                    leaf_state.apply_action(node.action)
+                    path.append(node)
+                if leaf_state.is_terminal():
+                    self._backup(path, leaf_state.returns(), virtual=False)
+                    root.visits += 1
+                elif id(node) in pending_leaves:
+                    # Already waiting for evaluation: the descent is skipped,
+                    # unless too many descents collided. One more virtual
+                    # loss on its path steers the next descents elsewhere
+                    collisions += 1
+                    if collisions > self._max_collisions:
+                        break
+                    self._apply_virtual_loss(path)
+                    collided.append(path)
+                    continue
+                else:
+                    self._apply_virtual_loss(path)
+                    pending.append((node, leaf_state, path))
+                    pending_leaves.add(id(node))
+                simulations += 1
+                descents -= 1
+
+            for path in collided:
+                self._apply_virtual_loss(path, sign=-1.0)
+            if not pending:
+                continue
+            results = self._evaluator.evaluate_batch([p[1] for p in pending])
+            for (leaf, leaf_state, path), (value, priors) in zip(pending, results):
+                player = leaf_state.current_player()
+                self._expand(leaf, player, priors)
+                returns = [value if p == player else -value for p in range(2)]
+                self._backup(path, returns, virtual=True)
+                root.visits += 1
+        return root
+
+    def step_with_policy(self, state):
+        root = self.search(state)
+        total = sum(child.visits for child in root.children)
+        policy = [(child.action, child.visits / total) for child in root.children]
+        best = max(root.children, key=lambda child: (child.visits, child.prior))
+        return policy, best.action
+
+    def step(self, state):
+        return self.step_with_policy(state)[1]
@@ -0,0 +1,258 @@
+import hashlib
+import os
+import struct
+import typing as t
+import weakref
+from pathlib import Path
+
+import numpy as np
+
+import pyspiel
+from open_spiel.python.algorithms import mcts
+
+from pygame_spiel.bots.live_mcts import LiveMCTSBot
+
+MAGIC = b"PSOB"
+VERSION = 1
+HEADER = struct.Struct("<4sII")  # magic, version, capacity
+HEADER_SIZE = 16
+
+#  Each record holds the statistics of one position, from the perspective of
+#  the player who moved into it (as open_spiel's SearchNode.total_reward).
+#  A key equal to 0 marks an empty slot.
+RECORD_DTYPE = np.dtype(
+    [
+        ("key", "<u8"),
+        ("visits", "<u4"),
+        ("value_sum", "<f4"),
+        ("last_used", "<u4"),
+        ("ply", "<u2"),
+        ("_padding", "<u2"),
+    ]
+)
+
+
+def state_key(state: pyspiel.State) -> int:
+    """
+    Returns a 64-bit hash of a position (board and player to move), so that
+    transpositions share the same record. The value 0 is reserved.
+    """
+    text = f"{state.current_player()}|{state.to_string()}".encode()
+    key = int.from_bytes(hashlib.blake2b(text, digest_size=8).digest(), "little")
+    return key or 1
+
+
+class OpeningBook:
+    """
+    Fixed-size hash table of position statistics, memory-mapped from a file.
+
+    The file is created (with the given capacity) the first time, and shared
+    by all the games played afterwards. Positions are stored with open
+    addressing: a key can only live in the probe_length slots following its
+    hash. When all of them are taken, the least recently used record (fewest
+    visits among equals) is evicted, so the file never grows.
+
+    Writes go straight to the mapped memory; the OS persists them, and flush()
+    forces them to disk. Concurrent writers (e.g. several processes) aren't
+    synchronized: at worst some statistics are lost.
+    """
+
+    def __init__(self, path: str, capacity: int = 1 << 18, probe_length: int = 8):
+        """
+        Parameters:
+            path (str): path of the book file
+            capacity (int): number of records (24 bytes each), used only when
+                the file is created
+            probe_length (int): number of slots where a key can be stored
+        """
+        self._path = Path(path)
+        self._probe_length = probe_length
+        if not self._path.exists():
+            self._create(capacity)
+        with open(self._path, "rb") as f:
+            magic, version, capacity = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self._path} is not an opening book (version {VERSION})")
+        self._capacity = capacity
+        self._records = np.memmap(
+            self._path,
+            dtype=RECORD_DTYPE,
+            mode="r+",
+            offset=HEADER_SIZE,
+            shape=(capacity,),
+        )
+        # Number of games recorded so far, used as clock for the LRU eviction
+        self._clock = int(self._records["last_used"].max()) + 1
+        self._dirty = False  # Whether records changed since the last flush
+        # Flushes the records when the book is garbage collected, closed, or
+        # at the latest when the interpreter exits (without keeping it alive)
+        self._finalizer = weakref.finalize(self, self._records.flush)
+
+    def _create(self, capacity: int):
+        """Creates an empty book file."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, capacity).ljust(HEADER_SIZE, b"\0"))
+            f.truncate(HEADER_SIZE + capacity * RECORD_DTYPE.itemsize)
+        os.replace(tmp_path, self._path)
+
+    def _slots(self, key: int) -> np.ndarray:
+        start = key % self._capacity
+        return (start + np.arange(self._probe_length)) % self._capacity
+
+    def lookup(self, key: int) -> t.Optional[t.Tuple[int, float]]:
+        """
+        Returns the statistics of a position.
+
+        Parameters:
+            key (int): position key (see state_key())
+
+        Returns:
+            tuple: visits and average value, or None if the position is unknown
+        """
+        slots = self._slots(key)
+        found = np.nonzero(self._records["key"][slots] == key)[0]
+        if len(found) == 0:
+            return None
+        record = self._records[slots[found[0]]]
+        visits = int(record["visits"])
+        return visits, float(record["value_sum"]) / max(visits, 1)
+
+    def update(self, key: int, visits: int, value_sum: float, ply: int):
+        """
+        Adds visits and rewards to the statistics of a position, inserting it
+        (and evicting another one if needed) when it's unknown.
+
+        Parameters:
+            key (int): position key (see state_key())
+            visits (int): number of visits to add
+            value_sum (float): sum of rewards to add
+            ply (int): number of moves played to reach the position
+        """
+        slots = self._slots(key)
+        keys = self._records["key"][slots]
+        found = np.nonzero(keys == key)[0]
+        if len(found):
+            slot = slots[found[0]]
+        else:
+            empty = np.nonzero(keys == 0)[0]
+            if len(empty):
+                slot = slots[empty[0]]
+            else:
+                candidates = self._records[slots]
+                victim = np.lexsort((candidates["visits"], candidates["last_used"]))[0]
+                slot = slots[victim]
+            self._records[slot] = (key, 0, 0.0, 0, ply, 0)
+        self._records["visits"][slot] += visits
+        self._records["value_sum"][slot] += value_sum
+        self._records["last_used"][slot] = self._clock
+        self._dirty = True
+
+    def new_game(self):
+        """Advances the clock used to evict the least recently used positions."""
+        self._clock += 1
+
+    def flush(self):
+        """Writes the changes to disk (nothing to do if no record changed)."""
+        if self._dirty:
+            self._records.flush()
+            self._dirty = False
+
+    def close(self):
+        """Writes the changes to disk and unmaps the file."""
+        self._finalizer()
+        self._records = None
+
+
+class OpeningBookMCTSBot(LiveMCTSBot):
+    """
+    MCTS Bot which remembers the search statistics of the first moves of a game.
+
+    For the first max_ply moves, the root children statistics of every search
+    are added to the opening book. When the book already contains at least
+    min_visits visits for the moves of a position, the most visited move is
+    played without searching. With probability refresh_probability the search
+    is run anyway, so that the book keeps improving over time.
+    """
+
+    def __init__(
+        self,
+        game: pyspiel.Game,
+        uct_c: float,
+        max_simulations: int,
+        evaluator: mcts.Evaluator,
+        book: OpeningBook,
+        max_ply: int = 8,
+        min_visits: int = 2000,
+        refresh_probability: float = 0.1,
+        **kwargs,
+    ):
+        super().__init__(game, uct_c, max_simulations, evaluator, **kwargs)
+        self._book = book
+        self._max_ply = max_ply
+        self._min_visits = min_visits
+        self._refresh_probability = refresh_probability
+        # Whether the next search starts a new game for the book's clock
+        self._new_game = True
+
+    def restart_at(self, state):
+        # Called on every new game, undo and redo: only a restart from the
+        # initial state starts a new game, and the book's clock advances
+        # when the first search of that game runs (see step_with_policy())
+        super().restart_at(state)
+        if not state.history():
+            self._new_game = True
+        self._book.flush()
+
+    def _child_keys(self, state: pyspiel.State) -> t.Dict[int, int]:
+        """Returns the book key of the position reached by each legal action."""
+        keys = dict()
+        for action in state.legal_actions():
+            child = state.child(action)
+            keys[action] = state_key(child)
+        return keys
+
+    def _book_action(self, state: pyspiel.State) -> t.Optional[int]:
+        """Returns the most visited move in the book, if known well enough."""
+        stats = dict()
+        for action, key in self._child_keys(state).items():
+            entry = self._book.lookup(key)
+            if entry is not None:
+                stats[action] = entry
+        if sum(visits for visits, _ in stats.values()) < self._min_visits:
+            return None
+        return max(stats.keys(), key=lambda a: (stats[a][0], stats[a][1]))
+
+    def step_with_policy(self, state):
+        ply = len(state.history())
+        if state.is_chance_node() or ply >= self._max_ply:
+            return super().step_with_policy(state)
+
+        if self._random_state.rand() >= self._refresh_probability:
+            action = self._book_action(state)
+            if action is not None:
+                policy = [
+                    (a, 1.0 if a == action else 0.0)
+                    for a in state.legal_actions(state.current_player())
+                ]
+                return policy, action
+
+        root = self.mcts_search(state)
+        if self._new_game:
+            self._book.new_game()
+            self._new_game = False
+        for child in root.children:
+            if child.explore_count > 0:
+                self._book.update(
+                    state_key(state.child(child.action)),
+                    child.explore_count,
+                    child.total_reward,
+                    ply + 1,
+                )
+        action = root.best_child().action
+        policy = [
+            (a, 1.0 if a == action else 0.0)
+            for a in state.legal_actions(state.current_player())
+        ]
+        return policy, action
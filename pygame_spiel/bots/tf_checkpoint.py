@@ -0,0 +1,178 @@
+"""
+Reader of TensorFlow checkpoints (the "V2" tensor bundle format written by
+tf.train.Saver and tf.train.Checkpoint) without TensorFlow.
+
+A checkpoint "<prefix>" is made of an index file, "<prefix>.index", and one
+or more data files, "<prefix>.data-<shard>-of-<num_shards>". The index is an
+uncompressed LevelDB table mapping each variable name to a BundleEntryProto
+(dtype, shape, shard, offset and size of the tensor bytes in the data file).
+Only the few protobuf fields needed to locate dense tensors are decoded.
+"""
+
+import struct
+import typing as t
+from pathlib import Path
+
+import numpy as np
+
+_TABLE_MAGIC = 0xDB4775248B80FB57
+_FOOTER_SIZE = 48
+_BLOCK_TRAILER_SIZE = 5  # Compression type and checksum
+
+# TensorFlow DataType enum values of the supported dense dtypes
+_DTYPES = {
+    1: np.float32,
+    2: np.float64,
+    3: np.int32,
+    4: np.uint8,
+    5: np.int16,
+    6: np.int8,
+    9: np.int64,
+    10: np.bool_,
+    17: np.uint16,
+    19: np.float16,
+    22: np.uint32,
+    23: np.uint64,
+}
+
+
+def _varint(data: bytes, pos: int) -> t.Tuple[int, int]:
+    """Decodes a base-128 varint. Returns its value and the next position."""
+    result, shift = 0, 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _proto_fields(data: bytes) -> t.Iterator[t.Tuple[int, t.Any]]:
+    """
+    Iterates over the fields of a serialized protobuf message. Yields the
+    field number and its value: an int for varint and fixed-size fields, the
+    raw bytes for length-delimited fields (strings and sub-messages).
+    """
+    pos = 0
+    while pos < len(data):
+        key, pos = _varint(data, pos)
+        field, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, pos = _varint(data, pos)
+        elif wire_type == 1:
+            value = struct.unpack_from("<Q", data, pos)[0]
+            pos += 8
+        elif wire_type == 2:
+            length, pos = _varint(data, pos)
+            value = data[pos : pos + length]
+            pos += length
+        elif wire_type == 5:
+            value = struct.unpack_from("<I", data, pos)[0]
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+        yield field, value
+
+
+def _block(data: bytes, handle: bytes) -> t.Iterator[t.Tuple[bytes, bytes]]:
+    """
+    Iterates over the (key, value) entries of the table block located by a
+    serialized BlockHandle (varint offset and size).
+    """
+    offset, pos = _varint(handle, 0)
+    size, _ = _varint(handle, pos)
+    if data[offset + size] != 0:
+        raise ValueError("Compressed checkpoint index blocks aren't supported")
+    block = data[offset : offset + size]
+    num_restarts = struct.unpack_from("<I", block, size - 4)[0]
+    end = size - 4 - 4 * num_restarts
+    pos, key = 0, b""
+    while pos < end:
+        shared, pos = _varint(block, pos)
+        non_shared, pos = _varint(block, pos)
+        value_length, pos = _varint(block, pos)
+        key = key[:shared] + block[pos : pos + non_shared]
+        pos += non_shared
+        yield key, block[pos : pos + value_length]
+        pos += value_length
+
+
+def _read_index(index_path: Path) -> t.Dict[str, bytes]:
+    """Returns the serialized BundleEntryProto of each key of an index file."""
+    data = index_path.read_bytes()
+    if len(data) < _FOOTER_SIZE:
+        raise ValueError(f"{index_path} is not a TensorFlow checkpoint index")
+    footer = data[-_FOOTER_SIZE:]
+    if struct.unpack_from("<Q", footer, 40)[0] != _TABLE_MAGIC:
+        raise ValueError(f"{index_path} is not a TensorFlow checkpoint index")
+    _, pos = _varint(footer, 0)  # Metaindex handle (unused)
+    _, pos = _varint(footer, pos)
+    index_handle = footer[pos:40]
+
+    entries = dict()
+    for _, block_handle in _block(data, index_handle):
+        for key, value in _block(data, block_handle):
+            entries[key.decode()] = value
+    return entries
+
+
+def _shape(data: bytes) -> t.Tuple[int, ...]:
+    """Decodes a TensorShapeProto."""
+    dims = []
+    for field, value in _proto_fields(data):
+        if field == 2:  # dim
+            size = 0
+            for dim_field, dim_value in _proto_fields(value):
+                if dim_field == 1:
+                    size = dim_value
+            dims.append(size)
+    return tuple(dims)
+
+
+def read_variables(prefix: str) -> t.Dict[str, np.ndarray]:
+    """
+    Reads the dense tensors of a checkpoint. Tensors of other types (e.g.
+    strings) and partitioned variables are skipped.
+
+    Parameters:
+        prefix (str): checkpoint prefix (e.g. "path/q_network_pid0")
+
+    Returns:
+        dict: variable name -> array
+    """
+    entries = _read_index(Path(f"{prefix}.index"))
+    num_shards = 1
+    for field, value in _proto_fields(entries.pop("", b"")):
+        if field == 1:  # BundleHeaderProto.num_shards
+            num_shards = value
+
+    variables = dict()
+    shards = dict()
+    for name, entry in entries.items():
+        fields = dict(dtype=0, shape=b"", shard_id=0, offset=0, size=0)
+        sliced = False
+        for field, value in _proto_fields(entry):
+            if field == 1:
+                fields["dtype"] = value
+            elif field == 2:
+                fields["shape"] = value
+            elif field == 3:
+                fields["shard_id"] = value
+            elif field == 4:
+                fields["offset"] = value
+            elif field == 5:
+                fields["size"] = value
+            elif field == 7:
+                sliced = True
+        if sliced or fields["dtype"] not in _DTYPES:
+            continue
+        shard_id = fields["shard_id"]
+        if shard_id not in shards:
+            shard_path = f"{prefix}.data-{shard_id:05d}-of-{num_shards:05d}"
+            shards[shard_id] = np.memmap(shard_path, dtype=np.uint8, mode="r")
+        raw = shards[shard_id][fields["offset"] : fields["offset"] + fields["size"]]
+        dtype = np.dtype(_DTYPES[fields["dtype"]]).newbyteorder("<")
+        array = np.frombuffer(raw.tobytes(), dtype=dtype)
+        variables[name] = array.reshape(_shape(fields["shape"]))
+    return variables
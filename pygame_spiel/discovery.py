@@ -0,0 +1,121 @@
+import ast
+import os
+import typing as t
+
+from pygame_spiel.utils import register_classes
+
+
+class BotDiscovery:
+    """
+    Cached discovery of directories and Bot definitions for the menu.
+
+    Directory listings are cached by path and keyed by the directory's mtime,
+    so browsing back and forth through the filesystem only hits the disk when
+    a directory actually changed. Python modules are cached by path and keyed
+    by their mtime and size: selecting an unchanged file again returns the Bot
+    classes found the first time, without executing the module a second time.
+    """
+
+    def __init__(self):
+        self._listings = dict()  # path -> (mtime_ns, [entry names])
+        self._modules = dict()  # path -> ((mtime_ns, size), {name: class})
+
+    def _scan_directory(self, path: str) -> t.Iterator[str]:
+        """
+        Lazily yields the entries of a directory which are relevant for the menu.
+
+        Only sub-directories and Python files (*.py) are returned. The type of
+        each entry is taken from os.scandir, which on most platforms doesn't
+        require an extra stat() call per entry.
+
+        Parameters:
+            path (str): directory to scan
+
+        Returns:
+            Iterator[str]: names of sub-directories and Python files
+        """
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir or entry.name.endswith(".py"):
+                    yield entry.name
+
+    def list_directory(self, path: str) -> t.List[str]:
+        """
+        Returns the sorted sub-directories and Python files of a directory.
+
+        The result is cached and only refreshed when the directory's mtime
+        changes (i.e. when an entry is added, removed or renamed).
+
+        Parameters:
+            path (str): directory to list
+
+        Returns:
+            list[str]: sorted names of sub-directories and Python files
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return []
+        cached = self._listings.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            names = sorted(self._scan_directory(path))
+        except OSError:
+            names = []
+        self._listings[path] = (mtime, names)
+        return names
+
+    def _may_define_bots(self, file_path: str) -> bool:
+        """
+        Cheap static check telling whether a module can contain a Bot definition.
+
+        The module is parsed (not executed): only files that define at least one
+        class with a base class can possibly define a pyspiel.Bot subclass.
+        Files which can't be parsed are reported as candidates, so that the
+        actual error is raised when the module is executed.
+
+        Parameters:
+            file_path (str): path to a Python file (*.py)
+
+        Returns:
+            bool: False if the module surely doesn't define any Bot
+        """
+        try:
+            with open(file_path, "rb") as f:
+                tree = ast.parse(f.read(), filename=file_path)
+        except (SyntaxError, ValueError):
+            return True
+        return any(
+            isinstance(node, ast.ClassDef) and node.bases for node in ast.walk(tree)
+        )
+
+    def find_bots(self, file_path: str) -> t.Dict[str, type]:
+        """
+        Returns the pyspiel.Bot subclasses defined in a Python file.
+
+        The module is only executed the first time it is selected, or when it
+        has been modified since the last time (mtime or size changed).
+
+        Parameters:
+            file_path (str): path to a Python file (*.py)
+
+        Returns:
+            dict[str, type]: dictionary with class name and class definition
+        """
+        stat = os.stat(file_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._modules.get(file_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if self._may_define_bots(file_path):
+            classes = register_classes(file_path=file_path)
+        else:
+            classes = dict()
+        self._modules[file_path] = (key, classes)
+        return classes
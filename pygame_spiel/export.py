@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+"""
+Headless export of recorded games to images.
+
+A game is replayed from its list of actions with the same rendering code as
+the UI, but under SDL's dummy video driver, so no display server is needed.
+Only the frames where the state changes are written (one per move), either
+as a sequence of full PNG images or as dirty-region deltas: a full keyframe
+from time to time and, in between, only the rectangle of the frame which
+changed. A manifest.json file describes the frames of each export.
+
+Example:
+    python -m pygame_spiel.export --game breakthrough --actions_file games.jsonl \
+        --output_dir exports --format delta
+"""
+
+import abc
+import argparse
+import json
+import os
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+import pyspiel
+
+MANIFEST_FILE = "manifest.json"
+
+_games = dict()  # Game UIs of the process, reused across exports
+
+
+def _get_game(game_string: str):
+    """
+    Returns the Game UI of a game string (e.g. "breakthrough(rows=6)"),
+    creating it the first time. The dummy video driver is used unless a
+    display has already been opened.
+    """
+    if game_string not in _games:
+        if not pygame.display.get_init():
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        from pygame_spiel.games.factory import GameFactory
+
+        game = pyspiel.load_game(game_string)
+        _games[game_string] = GameFactory.get_game(
+            game.get_type().short_name,
+            current_player=0,
+            params=game.get_parameters(),
+        )
+    game = _games[game_string]
+    game.reset()
+    return game
+
+
+class FrameWriter(metaclass=abc.ABCMeta):
+    """Writes the frames of a game to a folder, with a manifest.json file."""
+
+    FORMAT = None
+
+    def __init__(self, output_dir: str, game_string: str, actions: t.List[int]):
+        """
+        Parameters:
+            output_dir (str): destination folder (created if needed)
+            game_string (str): open_spiel game string
+            actions (list[int]): actions of the game
+        """
+        self._output_dir = Path(output_dir)
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._manifest = {
+            "game": game_string,
+            "format": self.FORMAT,
+            "actions": list(actions),
+            "frames": [],
+        }
+
+    def _save(self, surface: pygame.Surface, ply: int) -> str:
+        file_name = f"{ply:04d}.png"
+        pygame.image.save(surface, str(self._output_dir / file_name))
+        return file_name
+
+    @abc.abstractmethod
+    def write(self, ply: int, frame: pygame.Surface):
+        """
+        Writes the frame displayed after a number of moves.
+
+        Parameters:
+            ply (int): number of moves played
+            frame (pygame.Surface): rendered frame
+        """
+
+    def close(self):
+        """Writes the manifest."""
+        with open(self._output_dir / MANIFEST_FILE, "w") as f:
+            json.dump(self._manifest, f)
+
+
+class PngSequenceWriter(FrameWriter):
+    """Writes every frame as a full PNG image."""
+
+    FORMAT = "png"
+
+    def write(self, ply, frame):
+        if not self._manifest["frames"]:
+            self._manifest["size"] = frame.get_size()
+        file_name = self._save(frame, ply)
+        self._manifest["frames"].append({"ply": ply, "file": file_name})
+
+
+class DeltaWriter(FrameWriter):
+    """
+    Writes a full keyframe every keyframe_interval frames and, for the other
+    frames, only the bounding rectangle of the pixels which changed since the
+    previous frame (frames without changes have no image).
+    """
+
+    FORMAT = "delta"
+
+    def __init__(self, output_dir, game_string, actions, keyframe_interval=32):
+        super().__init__(output_dir, game_string, actions)
+        self._keyframe_interval = keyframe_interval
+        self._previous = None
+
+    def write(self, ply, frame):
+        # Mapped pixels: one integer per pixel, indexed [x, y]
+        pixels = pygame.surfarray.pixels2d(frame)
+        index = len(self._manifest["frames"])
+        if self._previous is None or index % self._keyframe_interval == 0:
+            del pixels  # Unlock the surface before saving it
+            self._manifest.setdefault("size", frame.get_size())
+            entry = {"ply": ply, "file": self._save(frame, ply), "x": 0, "y": 0}
+            entry["keyframe"] = True
+            self._previous = pygame.surfarray.array2d(frame)
+        else:
+            changed = pixels != self._previous
+            self._previous[...] = pixels
+            del pixels
+            xs = np.flatnonzero(changed.any(axis=1))
+            ys = np.flatnonzero(changed.any(axis=0))
+            entry = {"ply": ply, "file": None, "x": 0, "y": 0}
+            if len(xs):
+                rect = pygame.Rect(
+                    int(xs[0]),
+                    int(ys[0]),
+                    int(xs[-1] - xs[0] + 1),
+                    int(ys[-1] - ys[0] + 1),
+                )
+                entry["file"] = self._save(frame.subsurface(rect), ply)
+                entry["x"], entry["y"] = rect.x, rect.y
+        self._manifest["frames"].append(entry)
+
+
+WRITERS = {"png": PngSequenceWriter, "delta": DeltaWriter}
+
+
+def export_game(
+    game_string: str,
+    actions: t.List[int],
+    output_dir: str,
+    encoding: str = "png",
+    **writer_params,
+) -> int:
+    """
+    Replays a game and writes its frames (one per state).
+
+    Parameters:
+        game_string (str): open_spiel game string (e.g. "breakthrough")
+        actions (list[int]): actions of the game
+        output_dir (str): destination folder
+        encoding (str): "png" (full frames) or "delta" (dirty regions)
+        writer_params: extra parameters of the writer (e.g. keyframe_interval)
+
+    Returns:
+        int: number of frames written
+    """
+    game = _get_game(game_string)
+    writer = WRITERS[encoding](output_dir, game_string, actions, **writer_params)
+    n_frames = 0
+    for ply, frame in game.replay(actions):
+        writer.write(ply, frame)
+        n_frames += 1
+    writer.close()
+    return n_frames
+
+
+def read_frames(export_dir: str) -> t.Iterator[t.Tuple[int, pygame.Surface]]:
+    """
+    Rebuilds the frames of an export (png or delta).
+
+    Parameters:
+        export_dir (str): folder written by export_game()
+
+    Returns:
+        iterator: ply and frame. The frame surface is reused between frames
+    """
+    export_dir = Path(export_dir)
+    with open(export_dir / MANIFEST_FILE) as f:
+        manifest = json.load(f)
+    frame = pygame.Surface(manifest["size"])
+    for entry in manifest["frames"]:
+        if entry["file"] is not None:
+            image = pygame.image.load(str(export_dir / entry["file"]))
+            frame.blit(image, (entry.get("x", 0), entry.get("y", 0)))
+        yield entry["ply"], frame
+
+
+def _read_games(args: argparse.Namespace) -> t.List[t.List[int]]:
+    """Returns the action lists given on the command line or in a file."""
+    if args.actions is not None:
+        return [[int(a) for a in args.actions.split(",") if a.strip()]]
+    games = []
+    with open(args.actions_file) as f:
+        for line in f:
+            if line.strip():
+                data = json.loads(line)
+                games.append(data["actions"] if isinstance(data, dict) else data)
+    return games
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export recorded games to images.")
+    parser.add_argument(
+        "--game",
+        default="breakthrough",
+        help='open_spiel game string, e.g. "breakthrough(rows=6)"',
+    )
+    actions = parser.add_mutually_exclusive_group(required=True)
+    actions.add_argument("--actions", help="comma-separated actions of one game")
+    actions.add_argument(
+        "--actions_file",
+        help="JSON lines file, one game per line (list of actions, or object "
+        'with an "actions" list)',
+    )
+    parser.add_argument("--output_dir", default="exports")
+    parser.add_argument("--format", choices=sorted(WRITERS.keys()), default="png")
+    parser.add_argument("--keyframe_interval", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    games = _read_games(args)
+    writer_params = dict()
+    if args.format == "delta":
+        writer_params["keyframe_interval"] = args.keyframe_interval
+    output_dirs = [Path(args.output_dir, f"game_{i:05d}") for i in range(len(games))]
+    if len(games) == 1:
+        output_dirs = [Path(args.output_dir)]
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            executor.submit(
+                export_game,
+                args.game,
+                actions,
+                output_dir,
+                args.format,
+                **writer_params,
+            )
+            for actions, output_dir in zip(games, output_dirs)
+        ]
+        n_frames = sum(future.result() for future in futures)
+    print(f"Exported {len(games)} games ({n_frames} frames) to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
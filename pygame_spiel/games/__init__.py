@@ -1,4 +1,16 @@
-import sys
 import importlib
-from pygame_spiel.games.tic_tac_toe import TicTacToe
-from pygame_spiel.games.breakthrough import Breakthrough
+
+#  Game classes are imported lazily (PEP 562), so that importing a submodule
+#  (e.g. pygame_spiel.games.settings) doesn't load pygame and every game.
+_GAME_CLASSES = {
+    "TicTacToe": "pygame_spiel.games.tic_tac_toe",
+    "Breakthrough": "pygame_spiel.games.breakthrough",
+}
+
+__all__ = list(_GAME_CLASSES.keys())
+
+
+def __getattr__(name):
+    if name in _GAME_CLASSES:
+        return getattr(importlib.import_module(_GAME_CLASSES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,32 +5,178 @@ import typing as t
 import site
 from pathlib import Path
 import os
-import numpy as np
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
-from pygame_spiel.games.settings import SCREEN_SIZE, BREAKPOINTS_DRIVE_IDS
+from pygame_spiel import registry, telemetry
+from pygame_spiel.games.history import MoveHistory
+from pygame_spiel.games.inputs import InputEvent
+from pygame_spiel.games.rendering import GridLayout, LayeredRenderer
+from pygame_spiel.games.state import CachedState
+from pygame_spiel.games.settings import (
+    SCREEN_SIZE,
+    BREAKPOINTS_DRIVE_IDS,
+    BOTS_WEIGHTS,
+)
 from pygame_spiel.utils import download_weights
-from pygame_spiel.bots import dqn
 
-from open_spiel.python.bots import uniform_random, human
-from open_spiel.python.algorithms import mcts
+
+def get_breakpoint_dir(game_name: str, bot_type: str) -> t.Optional[Path]:
+    """
+    Returns the folder containing the weights of a Bot for a game, downloading
+    them the first time. Bots which don't need weights get None.
+
+    Parameters:
+        game_name (str): name of the game
+        bot_type (str): Bot type
+
+    Returns:
+        Path: folder containing the weights (or None)
+    """
+    weights_type = BOTS_WEIGHTS.get(bot_type, bot_type)
+    if weights_type not in BREAKPOINTS_DRIVE_IDS.get(game_name, {}):
+        return None
+    breakpoint_dest_dir = Path(
+        site.getsitepackages()[0],
+        "pygame_spiel/data/breakpoints",
+        weights_type,
+        game_name,
+    )
+    file_id = BREAKPOINTS_DRIVE_IDS[game_name][weights_type]
+    if not os.path.exists(breakpoint_dest_dir):
+        print(f"Downloading breakpoints for bot {weights_type} and game {game_name}")
+        download_weights(file_id=file_id, dest_folder=str(breakpoint_dest_dir))
+    return Path(breakpoint_dest_dir, "weights_default")
+
+
+def init_bot(
+    bot_type: str,
+    game: pyspiel.Game,
+    player_id: int,
+    breakpoint_dir: str = None,
+    registered_bots: t.Dict[str, type] = None,
+    **bot_params,
+) -> pyspiel.Bot:
+    """
+    Returns a bot of type bot_type for the player specified by player_id.
+    This function doesn't need a Game (nor a display), so it's also used to
+    build bots outside of the UI (e.g. by pygame_spiel.ladder).
+
+    Parameters:
+        bot_type (str): Bot type (mcts, random, dqn, human, or any Bot
+            available in pygame_spiel.registry or in registered_bots)
+        game (pyspiel.Game): open_spiel game
+        player_id (int): id of the player that the bot will be driving
+        breakpoint_dir (str): Path to the DQN weigths (optional)
+        registered_bots (dict[str, type]): Bots registered at runtime (optional)
+        bot_params: extra parameters passed to the Bot factory
+
+    Returns:
+        pyspiel.Bot: the new bot
+    """
+    if registered_bots and bot_type in registered_bots:
+        return registered_bots[bot_type](game=game, player_id=player_id)
+    if bot_type not in registry.bots:
+        raise ValueError("Invalid bot type: %s" % bot_type)
+
+    # Only the selected Bot's module is imported (e.g. TensorFlow for dqn)
+    bot_factory = registry.bots.load(bot_type)
+    if breakpoint_dir is not None:
+        bot_params["checkpoint_dir"] = breakpoint_dir
+    return bot_factory(game=game, player_id=player_id, **bot_params)
+
+
+def warm_up_bot(
+    game_name: str,
+    bot_type: str,
+    player_id: int,
+    params: t.Optional[dict] = None,
+    registered_bots: t.Dict[str, type] = None,
+) -> pyspiel.Bot:
+    """
+    Builds a Bot ahead of time (e.g. in a background thread while the menu is
+    shown), so that Game.set_bots() can use it right away: the Bot's modules
+    are imported, its weights are downloaded if needed, and Bots which load
+    their model lazily (those with a load() method) load it.
+
+    Parameters:
+        game_name (str): name of the game
+        bot_type (str): Bot type
+        player_id (int): id of the player that the bot will be driving
+        params (dict): open_spiel game parameters (optional)
+        registered_bots (dict[str, type]): Bots registered at runtime (optional)
+
+    Returns:
+        pyspiel.Bot: the new bot
+    """
+    game = pyspiel.load_game(game_name, params or {})
+    bot = init_bot(
+        bot_type,
+        game,
+        player_id,
+        breakpoint_dir=get_breakpoint_dir(game_name, bot_type),
+        registered_bots=registered_bots,
+    )
+    if callable(getattr(bot, "load", None)):
+        bot.load()
+    return bot
 
 
 class Game(metaclass=abc.ABCMeta):
-    def __init__(self, name, current_player):
+    def __init__(self, name, current_player, params=None):
         self._name = name
         self._current_player = current_player
 
-        #  Initialise game
-        self._game = pyspiel.load_game(name)
-        self._state = self._game.new_initial_state()
+        #  Initialise game (params are open_spiel's game parameters, e.g. rows)
+        self._game = pyspiel.load_game(name, params or {})
+        # The derived views of the state (string, legal actions...) are cached
+        # until the next action, for the game, its Bots and the renderers
+        self._state = CachedState(self._game.new_initial_state())
         self._state_string = self._state.to_string()
+        self._history = MoveHistory(self._state)
+        self._bots = []
+        self._bot_types = []
+        self._human_players = set()
         pygame.init()
 
-        self._screen = pygame.display.set_mode(SCREEN_SIZE[name])
+        screen_size = self._screen_size()
+        self._screen = pygame.display.set_mode(screen_size)
         pygame.display.set_caption(name)
 
         self._package_path = site.getsitepackages()[0]
-        self._registered_bots = []
+        self._registered_bots = dict()
+
+        # Board geometry, which subclasses set in their constructor
+        self._layout: GridLayout = None
+        self._text_font = pygame.font.SysFont("Arial", 30)
+        self._search_font = pygame.font.SysFont("Arial", 18)
+        self._last_render_updated = False
+
+        # Bots think in a background thread, so the window stays responsive
+        # and the search of Bots publishing snapshots (see
+        # pygame_spiel.bots.live_mcts) is drawn while they think
+        self._bot_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pygame_spiel-bot"
+        )
+        self._pending_move: t.Optional[Future] = None
+        self._search_snapshot = None
+        self._renderer = LayeredRenderer(
+            screen_size,
+            {
+                "board": self._draw_board,
+                "pieces": self._draw_pieces,
+                "highlights": self._draw_highlights,
+                "search": self._draw_search,
+                "text": self._draw_status,
+            },
+        )
+
+    def _screen_size(self) -> t.Tuple[int, int]:
+        """
+        Returns the size of the window. Subclasses override it when the size
+        depends on the game parameters (e.g. the number of rows).
+        """
+        return tuple(SCREEN_SIZE[self._name])
 
     @abc.abstractmethod
     def play(
@@ -40,76 +186,431 @@ class Game(metaclass=abc.ABCMeta):
         Abstract interface of the function play(). At each iteration, it requires the mouse position
         and state (which button was pressed, if any).
 
+        Clicks are edge-triggered (see process_input()): mouse_pressed is only
+        set in the call delivering a click, so holding a button down doesn't
+        repeat it, and mouse_pos is the hover position otherwise.
+
         Parameters:
             mouse_pos (tuple): Position of the mouse (X,Y coordinates)
             mouse_pressed (tuple): 1 if the i-th button is pressed
         """
 
+    def process_input(
+        self, events: t.List[InputEvent], hover: t.Tuple[int, int]
+    ) -> t.Tuple[bool, t.List[float]]:
+        """
+        Feeds buffered input events to the game, in the order they happened.
+        play() is called once for each click, and Ctrl+Z / Ctrl+Y undo and redo
+        moves. When the last event isn't a click (or there's no event), play()
+        is called once more with the hover position and no button pressed,
+        which draws the current state and lets the bots move.
+
+        Parameters:
+            events (list[InputEvent]): events buffered since the last call
+            hover (tuple): current position of the mouse
+
+        Returns:
+            tuple: True if the screen has been updated, and the timestamps of
+                the events that have been handled (other events, e.g. mouse
+                releases, are ignored)
+        """
+        updated = False
+        played = False
+        handled = []
+        for event in events:
+            if event.type == "click" and 1 <= event.button <= 3:
+                mouse_pressed = tuple(event.button == i for i in (1, 2, 3))
+                self.play(mouse_pos=event.pos, mouse_pressed=mouse_pressed)
+                updated |= self._last_render_updated
+                played = True
+                handled.append(event.time)
+            elif event.type == "key" and event.mod & pygame.KMOD_CTRL:
+                if event.key == pygame.K_z:
+                    self.undo()
+                    played = False
+                    handled.append(event.time)
+                elif event.key == pygame.K_y:
+                    self.redo()
+                    played = False
+                    handled.append(event.time)
+        if not played:
+            self.play(mouse_pos=hover, mouse_pressed=(False, False, False))
+            updated |= self._last_render_updated
+        return updated, handled
+
+    def awaiting_human_input(self) -> bool:
+        """Returns True if nothing happens until a human player acts (or the game is over)."""
+        return (
+            self._state.is_terminal()
+            or self._state.current_player() in self._human_players
+        )
+
+    def _draw_board(self, surface: pygame.Surface) -> None:
+        """
+        Draws the static part of the board (bottom layer). This layer is drawn
+        once, unless invalidated.
+
+        Parameters:
+            surface (pygame.Surface): surface of the layer
+        """
+
+    def _draw_pieces(self, surface: pygame.Surface) -> None:
+        """
+        Draws the pieces on the board. This layer is redrawn when the state changes.
+
+        Parameters:
+            surface (pygame.Surface): surface of the layer (transparent)
+        """
+
+    def _draw_highlights(self, surface: pygame.Surface) -> None:
+        """
+        Draws highlighted cells or pieces (e.g. the selected pawn). Subclasses
+        invalidate this layer when the highlighted cells change.
+
+        Parameters:
+            surface (pygame.Surface): surface of the layer (transparent)
+        """
+
+    def _action_cell(self, action: int) -> t.Optional[t.Tuple[int, int]]:
+        """
+        Returns the cell where an action puts a piece, used to draw the search
+        overlay (subclasses override it; None if the action isn't drawn).
+
+        Parameters:
+            action (int): action id
+
+        Returns:
+            tuple: cell's row and column, or None
+        """
+        return None
+
+    def _draw_search(self, surface: pygame.Surface) -> None:
+        """
+        Draws the search of the Bot thinking, from its last snapshot: the
+        destination cell of each explored move is colored from red (losing)
+        to green (winning), more opaque the more it has been visited, with the
+        share of visits of the move.
+
+        Parameters:
+            surface (pygame.Surface): surface of the layer (transparent)
+        """
+        snapshot = self._search_snapshot
+        if snapshot is None or snapshot.visits.sum() == 0:
+            return
+        cells = dict()  # Moves to the same cell (e.g. from two pawns) are summed
+        for action, visits, value in zip(
+            snapshot.actions, snapshot.visits, snapshot.values
+        ):
+            cell = self._action_cell(int(action))
+            if cell is not None and visits > 0:
+                cell_visits, cell_value = cells.get(cell, (0, 0.0))
+                cells[cell] = (cell_visits + visits, cell_value + value * visits)
+        if not cells:
+            return
+        total_visits = snapshot.visits.sum()
+        max_visits = max(visits for visits, _ in cells.values())
+        for (row, col), (visits, value_sum) in cells.items():
+            value = min(max(value_sum / visits, -1.0), 1.0)
+            color = (
+                int(220 * (1 - value) / 2),
+                int(200 * (1 + value) / 2),
+                40,
+                int(40 + 140 * visits / max_visits),
+            )
+            rect = self._layout.cell_rect(row, col)
+            surface.fill(color, rect)
+            img = self._search_font.render(
+                f"{100 * visits / total_visits:.0f}%", True, (0, 0, 0)
+            )
+            surface.blit(img, img.get_rect(center=rect.center))
+        img = self._search_font.render(
+            f"{snapshot.simulations} simulations", True, (0, 0, 0), (255, 255, 255)
+        )
+        surface.blit(img, (4, 4))
+
+    def _draw_status(self, surface: pygame.Surface) -> None:
+        """
+        Draws the outcome of the game once it's over. This layer is redrawn when
+        the state changes.
+
+        Parameters:
+            surface (pygame.Surface): surface of the layer (transparent)
+        """
+        if not self._state.is_terminal():
+            return
+        rewards = self._state.rewards()
+        if all(reward == 0 for reward in rewards):
+            text = "DRAW"
+        else:
+            text = f"Winner: player {rewards.index(max(rewards))}"
+        img = self._text_font.render(text, True, (0, 0, 0))
+        x = (surface.get_width() - img.get_width()) // 2
+        y = (surface.get_height() - img.get_height()) // 2
+        surface.blit(img, (x, y))
+
+    def _refresh_state(self) -> None:
+        """
+        Updates the information derived from the state after an action has been
+        applied, and invalidates the layers which depend on the state.
+        """
+        self._current_player = self._state.current_player()
+        state_string = self._state.to_string()
+        if state_string != self._state_string:
+            self._state_string = state_string
+            self._renderer.invalidate("pieces", "text")
+
+    def _emit_game_start(self) -> None:
+        """Sends a game_start telemetry event."""
+        telemetry.emit(
+            "game_start",
+            game=str(self._game),
+            bots=self._bot_types,
+            ply=len(self._history.actions),
+        )
+
+    def _emit_game_end(self) -> None:
+        """Sends a game_end telemetry event with the outcome of the game."""
+        rewards = self._state.rewards()
+        if all(reward == 0 for reward in rewards):
+            outcome = "draw"
+        else:
+            outcome = f"player{rewards.index(max(rewards))}"
+        telemetry.emit(
+            "game_end",
+            game=str(self._game),
+            bots=self._bot_types,
+            outcome=outcome,
+            returns=list(rewards),
+            ply=len(self._history.actions),
+        )
+
+    def _timed_bot_step(self, player_id: int, state: pyspiel.State) -> int:
+        """
+        Asks the Bot of a player for its action (in the Bot thread), sending
+        its think time to the telemetry.
+        """
+        start = time.perf_counter()
+        action = self._bots[player_id].step(state)
+        telemetry.emit(
+            "bot_latency",
+            bot=self._bot_types[player_id] if self._bot_types else "unknown",
+            player=player_id,
+            ply=len(self._history.actions),
+            ms=(time.perf_counter() - start) * 1000,
+        )
+        return action
+
+    def _bot_step(self, player_id: int) -> t.Optional[int]:
+        """
+        Asks the Bot of a player for its action, without blocking: the Bot
+        thinks in a background thread, and this method returns None until it
+        has chosen. Meanwhile the search overlay follows the Bot's snapshots.
+
+        Parameters:
+            player_id (int): id of the player whose Bot has to move
+
+        Returns:
+            int: action chosen by the Bot, or None if it's still thinking
+        """
+        if self._pending_move is None:
+            self._pending_move = self._bot_executor.submit(
+                self._timed_bot_step, player_id, self._state.state
+            )
+            # Wake up the main loop (see InputBuffer.wait) when the Bot is done
+            self._pending_move.add_done_callback(
+                lambda _: pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+            )
+        if not self._pending_move.done():
+            snapshot = getattr(self._bots[player_id], "snapshot", None)
+            if snapshot is not self._search_snapshot:
+                self._search_snapshot = snapshot
+                self._renderer.invalidate("search")
+            return None
+        return self._collect_bot_move()
+
+    def _collect_bot_move(self) -> t.Optional[int]:
+        """
+        Waits for the Bot thinking (if any) and returns its action, clearing
+        the search overlay.
+
+        Returns:
+            int: action chosen by the Bot, or None if no Bot was thinking
+        """
+        if self._pending_move is None:
+            return None
+        future, self._pending_move = self._pending_move, None
+        if self._search_snapshot is not None:
+            self._search_snapshot = None
+            self._renderer.invalidate("search")
+        return future.result()
+
+    def is_bot_thinking(self) -> bool:
+        """Returns True while a Bot is choosing its action in the background."""
+        return self._pending_move is not None and not self._pending_move.done()
+
+    def _apply_action(self, action: int) -> None:
+        """
+        Applies an action of the current player to the state, records it in the
+        history and informs the other players' bots.
+
+        Parameters:
+            action (int): action of the current player
+        """
+        player = self._state.current_player()
+        self._state.apply_action(action)
+        self._history.record(action, self._state)
+        for player_id, bot in enumerate(self._bots):
+            if player_id != player:
+                bot.inform_action(self._state.state, player, action)
+        self._refresh_state()
+        telemetry.emit(
+            "move", player=player, action=action, ply=len(self._history.actions)
+        )
+        if self._state.is_terminal():
+            self._emit_game_end()
+
+    def _set_state(self, state: pyspiel.State) -> None:
+        """
+        Replaces the current state (e.g. after undo/redo), restarting the bots
+        from the new state.
+
+        Parameters:
+            state (pyspiel.State): new state
+        """
+        self._state = CachedState(state)
+        if self._pending_move is None:
+            self._restart_bots(self._state.state)
+        else:
+            # The Bot was thinking on the previous state: its move is discarded
+            # without waiting, and its search cancelled if it supports it. The
+            # Bots restart in the Bot thread, once the search has stopped.
+            future, self._pending_move = self._pending_move, None
+            if not future.cancel():
+                for bot in self._bots:
+                    if hasattr(bot, "cancel"):
+                        bot.cancel()
+            if self._search_snapshot is not None:
+                self._search_snapshot = None
+                self._renderer.invalidate("search")
+            self._bot_executor.submit(self._restart_bots, self._state.state)
+        self._refresh_state()
+
+    def _restart_bots(self, state: pyspiel.State) -> None:
+        """Restarts all the bots from a state."""
+        for bot in self._bots:
+            bot.restart_at(state)
+
+    def undo(self) -> None:
+        """
+        Takes back the last move of the human player, together with the bots'
+        moves played after it.
+        """
+        if not self._history.can_undo():
+            return
+        state = self._history.undo()
+        while self._history.can_undo() and state.current_player() not in (
+            self._human_players
+        ):
+            state = self._history.undo()
+        self._set_state(state)
+
+    def redo(self) -> None:
+        """Replays the moves taken back by undo(), up to the next human turn."""
+        if not self._history.can_redo():
+            return
+        state = self._history.redo(self._state.clone())
+        while self._history.can_redo() and state.current_player() not in (
+            self._human_players
+        ):
+            state = self._history.redo(state)
+        self._set_state(state)
+
+    def reset(self) -> None:
+        """Starts a new game from the initial state (the history is cleared)."""
+        state = self._game.new_initial_state()
+        self._history = MoveHistory(state)
+        self._set_state(state)
+        if self._bots:
+            self._emit_game_start()
+
+    def replay(
+        self, actions: t.Iterable[int]
+    ) -> t.Iterator[t.Tuple[int, pygame.Surface]]:
+        """
+        Plays a list of actions from the current state, without bots, and
+        yields the rendered frame of the current state and of every new state.
+        Only the layers invalidated by each move are redrawn.
+
+        Parameters:
+            actions (list[int]): actions to play
+
+        Returns:
+            iterator: ply (0 for the current state) and frame. The frame surface
+                is reused: copy it to keep it after the next iteration
+        """
+        self._render()
+        yield 0, self._renderer.frame
+        for ply, action in enumerate(actions, start=1):
+            state_string = self._state_string
+            self._apply_action(action)
+            if self._state_string != state_string:
+                self._render()
+                yield ply, self._renderer.frame
+
+    def get_history(self) -> t.List[int]:
+        """
+        Returns the actions played so far (moves taken back are excluded).
+
+        Returns:
+            list[int]: action ids, in the order they have been played
+        """
+        return self._history.actions
+
+    def _render(self) -> None:
+        """Draws the current frame on screen, redrawing only the invalidated layers."""
+        self._last_render_updated = self._renderer.render(self._screen)
+
     def _init_bot(
         self,
         bot_type: str,
         game: pyspiel.Game,
         player_id: int,
         breakpoint_dir: str = None,
-    ) -> None:
+    ) -> pyspiel.Bot:
         """
         Returns a bot of type bot_type for the player specified by player_id.
+        See init_bot().
 
         Parameters:
-            bot_type (str): Bot type (mcts, random or dqn)
+            bot_type (str): Bot type (mcts, random, dqn, human, or any Bot
+                available in pygame_spiel.registry or registered at runtime)
             game (pyspiel.Game): open_spiel game
             player_id (int): id of the player that the bot will be driving
             breakpoint_dir (str): Path to the DQN weigths (optional)
 
         Returns:
-            None
-        """
-        if bot_type not in list(self._registered_bots.keys()) + [
-            "mcts",
-            "random",
-            "dqn",
-            "human",
-        ]:
-            ValueError("Invalid bot type: %s" % bot_type)
-        rng = np.random.RandomState(42)
-        if bot_type == "mcts":
-            utc = 2  # UCT's exploration constant
-            max_simulations = 1000
-            rollout_count = 1
-            evaluator = mcts.RandomRolloutEvaluator(rollout_count, rng)
-            solve = True  # Whether to use MCTS-Solver.
-            verbose = False
-            bot = mcts.MCTSBot(
-                game,
-                utc,
-                max_simulations,
-                evaluator,
-                random_state=rng,
-                solve=solve,
-                verbose=verbose,
-            )
-            return bot
-        if bot_type == "random":
-            bot = uniform_random.UniformRandomBot(1, rng)
-            return bot
-        if bot_type == "dqn":
-            # We need to load bots for both players, because the models have been trained
-            # using the script breakthrough_dqn.py, causing the issue reported in
-            # https://github.com/deepmind/open_spiel/issues/1104.
-            # Only the Bot related to the specified player is returned.
-            bot0 = dqn.DQNBot(game, player_id=0, checkpoint_dir=breakpoint_dir)
-            bot1 = dqn.DQNBot(game, player_id=1, checkpoint_dir=breakpoint_dir)
-            return bot0 if player_id == 0 else bot1
-        if bot_type == "human":
-            return human.HumanBot()
-
-        return self._registered_bots[bot_type](game=game, player_id=player_id)
+            pyspiel.Bot: the new bot
+        """
+        return init_bot(
+            bot_type,
+            game,
+            player_id,
+            breakpoint_dir=breakpoint_dir,
+            registered_bots=self._registered_bots,
+        )
 
     def set_bots(
-        self, bot1_type: str, bot1_params: str, bot2_type: str, bot2_params: str
+        self,
+        bot1_type: str,
+        bot1_params: str,
+        bot2_type: str,
+        bot2_params: str,
+        bot1: pyspiel.Bot = None,
+        bot2: pyspiel.Bot = None,
     ) -> None:
         """
-        Set a Bot for each player. Available bots are: random, human, mcts, dqn.
+        Set a Bot for each player. Available bots are: random, human, mcts, dqn,
+        plus the Bots from installed plugins and the ones registered at runtime.
         Only 2-players game currently supported (so only two bots are set)
 
         Parameters:
@@ -117,32 +618,31 @@ class Game(metaclass=abc.ABCMeta):
             bot1_params (str): Bot's parameters (e.g., neural network breakpoints)
             bot2_type (str): Bot type of player 1
             bot2_params (str): Bot's parameters (e.g., neural network breakpoints)
+            bot1 (pyspiel.Bot): Bot of player 0, already built (e.g. by
+                warm_up_bot()), optional
+            bot2 (pyspiel.Bot): Bot of player 1, already built, optional
         """
         self._bots = []
+        self._human_players = {
+            i
+            for i, bot_type in enumerate([bot1_type, bot2_type])
+            if bot_type == "human"
+        }
 
-        for i, bot_type in enumerate([bot1_type, bot2_type]):
-            bot_breakpoint_dir = None
-            if bot_type in ["dqn"]:  # TODO move next code inside DQN bot definition
-                breakpoint_dest_dir = Path(
-                    self._package_path,
-                    "pygame_spiel/data/breakpoints",
+        for i, (bot_type, bot) in enumerate([(bot1_type, bot1), (bot2_type, bot2)]):
+            if bot is None:
+                bot_breakpoint_dir = get_breakpoint_dir(self._name, bot_type)
+                bot = self._init_bot(
                     bot_type,
-                    self._name,
+                    self._game,
+                    player_id=i,
+                    breakpoint_dir=bot_breakpoint_dir,
                 )
-                file_id = BREAKPOINTS_DRIVE_IDS[self._name][bot_type]
-                print(breakpoint_dest_dir)
-                if not os.path.exists(breakpoint_dest_dir):
-                    print(
-                        f"Downloading breakpoints for bot {bot_type} and game {self._name}"
-                    )
-                    download_weights(
-                        file_id=file_id, dest_folder=str(breakpoint_dest_dir)
-                    )
-                bot_breakpoint_dir = Path(breakpoint_dest_dir, "weights_default")
-            bot = self._init_bot(
-                bot_type, self._game, player_id=i, breakpoint_dir=bot_breakpoint_dir
-            )
+            else:
+                bot.restart_at(self._state.state)
             self._bots.append(bot)
+        self._bot_types = [bot1_type, bot2_type]
+        self._emit_game_start()
 
     def register_bots(self, registered_bots: dict[str, type]):
         """
@@ -1,40 +1,41 @@
 import pygame
 import typing as t
-import math
 import site
 from pathlib import Path
 
 from pygame_spiel.games import base
+from pygame_spiel.games.rendering import GridLayout, load_scaled_image
+from pygame_spiel.games.settings import BREAKTHROUGH_MAX_BOARD_SIZE, SCREEN_SIZE
 
 
 class Breakthrough(base.Game):
-    def __init__(self, name, current_player):
-        super().__init__(name, current_player)
+    def __init__(self, name, current_player, params=None):
+        super().__init__(name, current_player, params=params)
 
         self._player_color = "b" if self._current_player == 0 else "w"
-        self._n_rows, self._n_cols, self._n_directions = 8, 8, 6
-        package_path = site.getsitepackages()[0]
-
-        # Load images
-        self._background = pygame.image.load(
-            Path(package_path) / "pygame_spiel/images/breakthrough/chess_board.png"
-        ).convert_alpha()
-        self._pawn_white = pygame.image.load(
-            Path(package_path) / "pygame_spiel/images/breakthrough/pawn_white.png"
-        ).convert_alpha()
-        self._pawn_white_selected = pygame.image.load(
-            Path(package_path)
-            / "pygame_spiel/images/breakthrough/pawn_white_selected.png"
-        ).convert_alpha()
-        self._pawn_black = pygame.image.load(
-            Path(package_path) / "pygame_spiel/images/breakthrough/pawn_black.png"
-        ).convert_alpha()
-
-        self._pawn_white = pygame.transform.scale(self._pawn_white, (95, 95))
-        self._pawn_white_selected = pygame.transform.scale(
-            self._pawn_white_selected, (95, 95)
+        self._n_rows, self._n_cols = self._board_shape()
+        self._n_directions = 6
+        self._layout = self._board_layout()
+        images_path = (
+            Path(site.getsitepackages()[0]) / "pygame_spiel/images/breakthrough"
         )
-        self._pawn_black = pygame.transform.scale(self._pawn_black, (95, 95))
+
+        # Load images. The chess board image only fits the default 8x8 board,
+        # other sizes are drawn procedurally. Pawns are slightly larger than
+        # the cells (95 pixels for 89 pixels wide cells).
+        if self._is_default_board():
+            self._background = load_scaled_image(
+                images_path / "chess_board.png", tuple(SCREEN_SIZE[name])
+            )
+        else:
+            self._background = None
+        pawn_size = round(self._layout.cell_size[0] * 95 / 89)
+        pawn_size = (pawn_size, pawn_size)
+        self._pawn_white = load_scaled_image(images_path / "pawn_white.png", pawn_size)
+        self._pawn_white_selected = load_scaled_image(
+            images_path / "pawn_white_selected.png", pawn_size
+        )
+        self._pawn_black = load_scaled_image(images_path / "pawn_black.png", pawn_size)
 
         self._selected_row, self._selected_col = None, None
 
@@ -43,35 +44,33 @@ class Breakthrough(base.Game):
         self._k_dir_row_offsets = [1, 1, 1, -1, -1, -1]
         self._k_dir_col_offsets = [-1, 0, 1, -1, 0, 1]
 
-    def _convert_mouse_position_to_grid(
-        self, mouse_pos: t.Tuple[int, int]
-    ) -> t.Tuple[int, int]:
-        """
-        Maps mouse x/y position to cell's row/column coordinates on the board.
-
-        This function is used to retrieve the coordinates of the mouse position, which
-        is used to determine whether the mouse's arrow is touching a selected token or
-        empty cell.
+    def _board_shape(self) -> t.Tuple[int, int]:
+        """Returns the number of rows and columns, from the game parameters."""
+        params = self._game.get_parameters()
+        return params.get("rows", 8), params.get("columns", 8)
 
-        Parameters:
-            mouse_pos (tuple): contains the x/y position of the mouse (0: X, 1: Y)
+    def _is_default_board(self) -> bool:
+        return self._board_shape() == (8, 8)
 
-        Returns:
-            row (int): cell's row
-            col (int): cell's column
+    def _board_layout(self) -> GridLayout:
         """
-
-        offset = 246
-        cell_size = 84
-        border_size = 6
-
-        row = math.floor(
-            (mouse_pos[1] - offset + border_size) / (cell_size + border_size)
-        )
-        col = math.floor(
-            (mouse_pos[0] - offset + border_size) / (cell_size + border_size)
-        )
-        return row, col
+        Returns the grid of the board. The default board uses the grid of
+        chess_board.png (cells are 89 pixels wide). Other boards use the same
+        cell size when they fit in BREAKTHROUGH_MAX_BOARD_SIZE pixels (smaller
+        cells otherwise), with a margin of one cell around the board.
+        """
+        n_rows, n_cols = self._board_shape()
+        if self._is_default_board():
+            return GridLayout(n_rows, n_cols, origin=(240, 240), cell_size=(89, 89))
+        cell = min(89, BREAKTHROUGH_MAX_BOARD_SIZE // max(n_rows, n_cols))
+        return GridLayout(n_rows, n_cols, origin=(cell, cell), cell_size=(cell, cell))
+
+    def _screen_size(self) -> t.Tuple[int, int]:
+        if self._is_default_board():
+            return super()._screen_size()
+        layout = self._board_layout()
+        width, height = layout.size
+        return width + 2 * layout.origin[0], height + 2 * layout.origin[1]
 
     def _get_token_by_position(self, row: int, col: int) -> int:
         """
@@ -90,7 +89,8 @@ class Breakthrough(base.Game):
             res (int): token's position id
         """
 
-        return row * 10 + col + 1
+        # Each line of the state string is: row label, cells, newline
+        return row * (self._n_cols + 2) + col + 1
 
     def _get_direction(
         self, selected_pawn_col: int, dest_col: int, player_color: str
@@ -130,7 +130,6 @@ class Breakthrough(base.Game):
         Example: _unrank_action_mixed_base(2) = [1, 0, 1, 0]
         Example: _unrank_action_mixed_base(100) = [1, 0, 2, 0]
 
-        This function is currently not used, but it's useful for debugging purposes, which is why is kept in this file.
         This function is a copy of:
         https://github.com/google-deepmind/open_spiel/blob/efa004d8c5f5088224e49fdc198c5d74b6b600d0/open_spiel/spiel_utils.cc#L69
 
@@ -141,13 +140,29 @@ class Breakthrough(base.Game):
             digits (list): list containing 4 values
         """
 
-        action_bases = [self._n_rows, self._n_rows, self._n_directions, 2]
+        action_bases = [self._n_rows, self._n_cols, self._n_directions, 2]
         digits = [0] * len(action_bases)
         for i in range(len(action_bases) - 1, -1, -1):
             digits[i] = action % action_bases[i]
             action //= action_bases[i]
         return digits
 
+    def _action_cell(self, action: int) -> t.Tuple[int, int]:
+        """
+        Returns the destination cell of the pawn moved by an action.
+
+        Parameters:
+            action (int): player's action
+
+        Returns:
+            tuple: destination row and column
+        """
+        row, col, direction, _ = self._unrank_action_mixed_base(action)
+        return (
+            row + self._k_dir_row_offsets[direction],
+            col + self._k_dir_col_offsets[direction],
+        )
+
     def _action_to_string(self, action: int) -> str:
         """
         Converts the action value to a string representing start and end position.
@@ -224,7 +239,7 @@ class Breakthrough(base.Game):
             # Pawns cannot jump for more than 1 step
             return None
 
-        action_bases = [self._n_rows, self._n_rows, self._n_directions, 2]
+        action_bases = [self._n_rows, self._n_cols, self._n_directions, 2]
 
         dir = self._get_direction(selected_pawn_col, dest_col, self._player_color)
 
@@ -251,74 +266,91 @@ class Breakthrough(base.Game):
 
         return action
 
-    def _get_coordinates_by_position(self, row: int, col: int) -> t.Tuple[int, int]:
+    def _select(self, row: int, col: int) -> None:
         """
-        Maps token's row/column coordinates to real coordinates in 2D plan (pygame screen).
-
-        This function is used to retrieve the coordinates of a token on the screen,
-        which are used to draw the token on the screen with PyGame.
+        Selects the pawn in a cell (or de-selects the current one if row and col
+        are None). The selected pawn is drawn in the highlights layer.
 
         Parameters:
-            row (int): Token's row
-            col (int): Token's column
+            row (int): pawn's row
+            col (int): pawn's column
+        """
+        self._selected_row, self._selected_col = row, col
+        self._renderer.invalidate("pieces", "highlights")
+
+    def _set_state(self, state) -> None:
+        self._select(None, None)
+        super()._set_state(state)
+
+    def _draw_board(self, surface: pygame.Surface) -> None:
+        if self._background is not None:
+            surface.blit(self._background, (0, 0))
+            return
+        # Checkerboard with the colors of chess_board.png
+        surface.fill((70, 73, 78))
+        border = pygame.Rect(self._layout.origin, self._layout.size)
+        pygame.draw.rect(surface, (252, 251, 254), border.inflate(16, 16))
+        for row in range(self._n_rows):
+            for col in range(self._n_cols):
+                color = (115, 126, 131) if (row + col) % 2 == 0 else (254, 255, 249)
+                surface.fill(color, self._layout.cell_rect(row, col))
+        pygame.draw.rect(surface, (221, 220, 222), border.inflate(2, 2), width=1)
+
+    def _draw_pieces(self, surface: pygame.Surface) -> None:
+        for row in range(self._n_rows):
+            for col in range(self._n_cols):
+                if row == self._selected_row and col == self._selected_col:
+                    continue  # Drawn in the highlights layer
+                token = self._state_string[self._get_token_by_position(row, col)]
+                if token == "b":
+                    surface.blit(self._pawn_black, self._layout.cell_origin(row, col))
+                elif token == "w":
+                    surface.blit(self._pawn_white, self._layout.cell_origin(row, col))
 
-        Returns:
-            x (int): token's X position on the screen
-            y (int): token's Y position on the screen
+    def _draw_highlights(self, surface: pygame.Surface) -> None:
+        if self._selected_row is not None:
+            surface.blit(
+                self._pawn_white_selected,
+                self._layout.cell_origin(self._selected_row, self._selected_col),
+            )
+
+    def _handle_click(self, row: int, col: int) -> None:
         """
+        Handles a click of the human player on a cell: the first click selects
+        a pawn, the second one moves it (if the move is legal).
 
-        offset = 240
-        unit = 89
-        x = col * unit + offset
-        y = row * unit + offset
-        return x, y
+        Parameters:
+            row (int): clicked cell's row
+            col (int): clicked cell's column
+        """
+        token = self._state_string[self._get_token_by_position(row, col)]
+        if self._selected_row is None and token == self._player_color:
+            self._select(row, col)
+        elif self._selected_row is not None and token == self._player_color:
+            self._select(None, None)
+        elif self._selected_row is not None and token != self._player_color:
+            # A pawn has been selected. If no other pawn is chosen, do not change assignment.
+            action = self._from_action_string_to_int(
+                self._selected_row, self._selected_col, row, col, token
+            )
+            if action is not None and action in self._state.legal_actions():
+                self._select(None, None)
+                self._apply_action(action)
 
     def play(self, mouse_pos, mouse_pressed):
         if (
             (self._current_player == 0 and self._player_color == "b")
             or (self._current_player == 1 and self._player_color == "w")
         ) and (mouse_pressed[0]):
-            row, col = self._convert_mouse_position_to_grid(mouse_pos)
-            token = self._state_string[self._get_token_by_position(row, col)]
-            if self._selected_row is None and token == self._player_color:
-                self._selected_row, self._selected_col = row, col
-            elif self._selected_row is not None and token == self._player_color:
-                self._selected_row, self._selected_col = None, None
-            elif self._selected_row is not None and token != self._player_color:
-                # A pawn has been selected. If no other pawn is chosen, do not change assignment.
-                action = self._from_action_string_to_int(
-                    self._selected_row, self._selected_col, row, col, token
-                )
-                if action is not None and action in self._state.legal_actions():
-                    self._state.apply_action(action)
-                    self._bots[1].inform_action(
-                        self._state, self._current_player, action
-                    )
-                    self._selected_row, self._selected_col = None, None
+            cell = self._layout.cell_at(mouse_pos)
+            if cell is not None:
+                self._handle_click(*cell)
         elif (self._current_player == 1 and self._player_color == "b") or (
             self._current_player == 0 and self._player_color == "w"
         ):
-            action = self._bots[1].step(self._state)
-            self._state.apply_action(action)
-
-        self._current_player = self._state.current_player()
-        self._state_string = self._state.to_string()
+            action = self._bot_step(1)
+            if action is not None:
+                self._apply_action(action)
 
         # Visualization
-        self._screen.blit(self._background, (0, 0))
-
-        for row in range(8):
-            for col in range(8):
-                token = self._state_string[self._get_token_by_position(row, col)]
-                x, y = self._get_coordinates_by_position(row, col)
-
-                if token == "b":
-                    if row == self._selected_row and col == self._selected_col:
-                        self._screen.blit(self._pawn_white_selected, (x, y))
-                    else:
-                        self._screen.blit(self._pawn_black, (x, y))
-                elif token == "w":
-                    if row == self._selected_row and col == self._selected_col:
-                        self._screen.blit(self._pawn_white_selected, (x, y))
-                    else:
-                        self._screen.blit(self._pawn_white, (x, y))
+        self._render()
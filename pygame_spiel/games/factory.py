@@ -1,14 +1,21 @@
-from pygame_spiel.games import *
-
-DICT_GAMES = {"tic_tac_toe": "TicTacToe", "breakthrough": "Breakthrough"}
+from pygame_spiel import registry
 
 
 class GameFactory:
     @classmethod
-    def get_game(cls, name, current_player):
+    def get_game(cls, name, current_player, params=None):
+        """
+        Returns the UI of a game.
+
+        Parameters:
+            name (str): name of the game (e.g. "breakthrough")
+            current_player (int): id of the human player
+            params (dict): open_spiel game parameters (e.g. {"rows": 12}),
+                the defaults of the game are used otherwise
+        """
         assert (
-            name in DICT_GAMES.keys()
-        ), f"Game {name} not in list of available games: {DICT_GAMES.keys()}"
-        Game_product = globals()[DICT_GAMES[name]]
-        game = Game_product(name, current_player)
+            name in registry.games
+        ), f"Game {name} not in list of available games: {registry.available_games()}"
+        Game_product = registry.games.load(name)
+        game = Game_product(name, current_player, params=params)
         return game
@@ -0,0 +1,116 @@
+import typing as t
+from array import array
+
+import pyspiel
+
+
+class MoveHistory:
+    """
+    History of the actions played in a game, supporting undo and redo.
+
+    Only the action ids are stored (8 bytes per move), plus a few snapshots of
+    the state taken every snapshot_interval moves. A past state is rebuilt by
+    cloning the nearest snapshot before it and replaying the actions after the
+    snapshot. When there are more than max_snapshots snapshots, the interval
+    is doubled and every other snapshot is dropped, so the memory used by
+    snapshots stays bounded however long the game is.
+    """
+
+    def __init__(
+        self,
+        initial_state: pyspiel.State,
+        snapshot_interval: int = 16,
+        max_snapshots: int = 32,
+    ):
+        """
+        Parameters:
+            initial_state (pyspiel.State): state at the beginning of the history
+            snapshot_interval (int): number of moves between two snapshots
+            max_snapshots (int): maximum number of snapshots kept in memory
+        """
+        self._actions = array("q")
+        self._ply = 0  # Number of actions applied (the rest can be redone)
+        self._snapshot_interval = snapshot_interval
+        self._max_snapshots = max_snapshots
+        self._snapshots = {0: initial_state.clone()}
+
+    @property
+    def ply(self) -> int:
+        """Number of actions applied to reach the current state."""
+        return self._ply
+
+    @property
+    def actions(self) -> t.List[int]:
+        """Actions applied to reach the current state."""
+        return self._actions[: self._ply].tolist()
+
+    def can_undo(self) -> bool:
+        return self._ply > 0
+
+    def can_redo(self) -> bool:
+        return self._ply < len(self._actions)
+
+    def record(self, action: int, state: pyspiel.State) -> None:
+        """
+        Records an action just applied. Actions which could be redone are
+        discarded, since the game took a different path.
+
+        Parameters:
+            action (int): applied action
+            state (pyspiel.State): state after the action
+        """
+        if self.can_redo():
+            del self._actions[self._ply :]
+            for ply in [p for p in self._snapshots if p > self._ply]:
+                del self._snapshots[ply]
+        self._actions.append(action)
+        self._ply += 1
+        if self._ply % self._snapshot_interval == 0:
+            self._snapshots[self._ply] = state.clone()
+            if len(self._snapshots) > self._max_snapshots:
+                self._thin_snapshots()
+
+    def _thin_snapshots(self) -> None:
+        """Doubles the snapshot interval, dropping the snapshots off the new grid."""
+        self._snapshot_interval *= 2
+        for ply in [p for p in self._snapshots if p % self._snapshot_interval]:
+            del self._snapshots[ply]
+
+    def state_at(self, ply: int) -> pyspiel.State:
+        """
+        Rebuilds the state reached after ply actions.
+
+        Parameters:
+            ply (int): number of actions from the beginning of the history
+
+        Returns:
+            pyspiel.State: new state object
+        """
+        snapshot_ply = max(p for p in self._snapshots if p <= ply)
+        state = self._snapshots[snapshot_ply].clone()
+        for action in self._actions[snapshot_ply:ply]:
+            state.apply_action(action)
+        return state
+
+    def undo(self) -> pyspiel.State:
+        """Steps one action back and returns the state reached."""
+        if not self.can_undo():
+            raise IndexError("Nothing to undo")
+        self._ply -= 1
+        return self.state_at(self._ply)
+
+    def redo(self, state: pyspiel.State) -> pyspiel.State:
+        """
+        Re-applies the next undone action to state, and returns it.
+
+        Parameters:
+            state (pyspiel.State): current state (modified in place)
+        """
+        if not self.can_redo():
+            raise IndexError("Nothing to redo")
+        action = self._actions[self._ply]
+        state.apply_action(action)
+        self._ply += 1
+        if self._ply % self._snapshot_interval == 0:
+            self._snapshots.setdefault(self._ply, state.clone())
+        return state
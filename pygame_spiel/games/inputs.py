@@ -0,0 +1,140 @@
+import time
+import typing as t
+from collections import deque
+
+import numpy as np
+import pygame
+
+
+class InputEvent(t.NamedTuple):
+    """
+    Timestamped input event.
+
+    type is "click" (mouse button pressed), "release" (mouse button released)
+    or "key" (key pressed). time is the time.perf_counter() value at which the
+    event has been read from pygame's queue.
+    """
+
+    type: str
+    time: float
+    pos: t.Tuple[int, int] = None
+    button: int = None
+    key: int = None
+    mod: int = 0
+
+
+class InputBuffer:
+    """
+    Buffers mouse and keyboard events, independently of the frame rate.
+
+    Events are read from pygame's queue as soon as they arrive (wait() blocks
+    until the next event rather than polling once per frame), timestamped and
+    stored until the game consumes them. Clicks are edge-triggered: holding a
+    button down produces a single "click" event. Mouse motions aren't stored:
+    they only update the hover position, so moving the mouse costs the same
+    whatever the frame rate.
+    """
+
+    def __init__(self, maxlen: int = 256):
+        """
+        Parameters:
+            maxlen (int): maximum number of buffered events (the oldest ones
+                are dropped first)
+        """
+        self._events = deque(maxlen=maxlen)
+        self.hover: t.Tuple[int, int] = pygame.mouse.get_pos()
+        self.quit_requested = False
+
+    def _add(self, event: pygame.event.Event, now: float):
+        """Buffers an event (other event types than the ones below are ignored)."""
+        if event.type == pygame.QUIT:
+            self.quit_requested = True
+        elif event.type == pygame.MOUSEMOTION:
+            self.hover = event.pos
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.hover = event.pos
+            self._events.append(
+                InputEvent("click", now, pos=event.pos, button=event.button)
+            )
+        elif event.type == pygame.MOUSEBUTTONUP:
+            self.hover = event.pos
+            self._events.append(
+                InputEvent("release", now, pos=event.pos, button=event.button)
+            )
+        elif event.type == pygame.KEYDOWN:
+            self._events.append(InputEvent("key", now, key=event.key, mod=event.mod))
+
+    def poll(self):
+        """Moves the pending pygame events to the buffer, without blocking."""
+        now = time.perf_counter()
+        for event in pygame.event.get():
+            self._add(event, now)
+
+    def wait(self, timeout: int):
+        """
+        Blocks until an input event arrives (or timeout milliseconds have
+        passed), then buffers all the pending events.
+
+        Parameters:
+            timeout (int): maximum waiting time, in milliseconds
+        """
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            self._add(event, time.perf_counter())
+        self.poll()
+
+    def drain(self) -> t.List[InputEvent]:
+        """
+        Returns the buffered events (oldest first) and empties the buffer.
+
+        Returns:
+            list[InputEvent]: buffered events
+        """
+        events = list(self._events)
+        self._events.clear()
+        return events
+
+
+class LatencyMeter:
+    """
+    Measures the time between an input event and the display of the first
+    frame rendered after it (input-to-display latency).
+    """
+
+    def __init__(self, window: int = 256):
+        """
+        Parameters:
+            window (int): number of latest measurements used by summary()
+        """
+        self._samples = deque(maxlen=window)
+        self._pending: t.Optional[float] = None
+
+    def input_received(self, timestamp: float):
+        """Records an input event (only the oldest one until the next frame counts)."""
+        if self._pending is None:
+            self._pending = timestamp
+
+    def frame_displayed(self):
+        """Records that a frame has been displayed (after pygame.display.flip())."""
+        if self._pending is not None:
+            self._samples.append(time.perf_counter() - self._pending)
+            self._pending = None
+
+    def summary(self) -> t.Dict[str, float]:
+        """
+        Returns statistics of the latest measurements, in milliseconds.
+
+        Returns:
+            dict: count, mean, p50, p95 and max latency (empty if no
+                measurement has been recorded)
+        """
+        if not self._samples:
+            return dict()
+        samples = np.array(self._samples) * 1000
+        return {
+            "count": len(samples),
+            "mean": float(samples.mean()),
+            "p50": float(np.percentile(samples, 50)),
+            "p95": float(np.percentile(samples, 95)),
+            "max": float(samples.max()),
+        }
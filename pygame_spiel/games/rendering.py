@@ -0,0 +1,177 @@
+import functools
+import typing as t
+
+import pygame
+
+
+@functools.lru_cache(maxsize=64)
+def load_scaled_image(path: str, size: t.Tuple[int, int]) -> pygame.Surface:
+    """
+    Loads an image and scales it to size. Results are cached, so that games
+    with the same board size share the scaled sprites.
+
+    Parameters:
+        path (str): path to the image
+        size (tuple): width/height of the scaled image
+
+    Returns:
+        pygame.Surface: scaled image (with alpha channel)
+    """
+    image = pygame.image.load(str(path)).convert_alpha()
+    if image.get_size() != tuple(size):
+        image = pygame.transform.smoothscale(image, size)
+    return image
+
+
+class GridLayout:
+    """
+    Geometry of a board made of a grid of equally sized cells.
+
+    The layout is the single source for the mapping between board cells
+    (row/column) and screen pixels, in both directions. Rows are counted from
+    the top of the screen and columns from the left.
+    """
+
+    def __init__(
+        self,
+        n_rows: int,
+        n_cols: int,
+        origin: t.Tuple[int, int],
+        cell_size: t.Tuple[int, int],
+    ):
+        """
+        Parameters:
+            n_rows (int): number of rows of the board
+            n_cols (int): number of columns of the board
+            origin (tuple): x/y position of the top-left corner of the grid
+            cell_size (tuple): width/height of a cell (including its border)
+        """
+        self.n_rows, self.n_cols = n_rows, n_cols
+        self.origin = origin
+        self.cell_size = cell_size
+
+    def cell_at(self, pos: t.Tuple[int, int]) -> t.Optional[t.Tuple[int, int]]:
+        """
+        Maps a x/y position on the screen to the row/column of the cell below it.
+
+        Parameters:
+            pos (tuple): x/y position (e.g. mouse position)
+
+        Returns:
+            tuple: cell's row and column, or None if pos is outside the grid
+        """
+        col = (pos[0] - self.origin[0]) // self.cell_size[0]
+        row = (pos[1] - self.origin[1]) // self.cell_size[1]
+        if 0 <= row < self.n_rows and 0 <= col < self.n_cols:
+            return int(row), int(col)
+        return None
+
+    def cell_origin(self, row: int, col: int) -> t.Tuple[int, int]:
+        """Returns the x/y position of the top-left corner of a cell."""
+        return (
+            self.origin[0] + col * self.cell_size[0],
+            self.origin[1] + row * self.cell_size[1],
+        )
+
+    def cell_center(self, row: int, col: int) -> t.Tuple[int, int]:
+        """Returns the x/y position of the center of a cell."""
+        x, y = self.cell_origin(row, col)
+        return x + self.cell_size[0] // 2, y + self.cell_size[1] // 2
+
+    def cell_rect(self, row: int, col: int) -> pygame.Rect:
+        """Returns the rectangle covered by a cell."""
+        return pygame.Rect(self.cell_origin(row, col), self.cell_size)
+
+    @property
+    def size(self) -> t.Tuple[int, int]:
+        """Width and height of the whole grid."""
+        return self.n_cols * self.cell_size[0], self.n_rows * self.cell_size[1]
+
+
+class LayeredRenderer:
+    """
+    Composes a frame from cached layers, redrawing only the invalidated ones.
+
+    Each layer is drawn by a callback on its own surface, from the bottom
+    (first layer) to the top (last layer). The bottom layer is opaque, the
+    others are transparent. A layer is only redrawn after invalidate() has been
+    called for it, and the composed frame is only rebuilt (and copied on
+    screen) when at least one layer changed.
+    """
+
+    LAYERS = ("board", "pieces", "highlights", "search", "text")
+
+    def __init__(
+        self,
+        size: t.Tuple[int, int],
+        draw_callbacks: t.Dict[str, t.Callable[[pygame.Surface], None]],
+        layers: t.Sequence[str] = LAYERS,
+    ):
+        """
+        Parameters:
+            size (tuple): width/height of the frame
+            draw_callbacks (dict): layer name -> function drawing the layer on
+                the surface passed as argument
+            layers (list): layer names, from bottom to top
+        """
+        self._size = tuple(size)
+        self._layers = list(layers)
+        self._draw_callbacks = draw_callbacks
+        self._surfaces = dict()
+        for i, layer in enumerate(self._layers):
+            if i == 0:
+                self._surfaces[layer] = pygame.Surface(self._size).convert()
+            else:
+                self._surfaces[layer] = pygame.Surface(
+                    self._size, pygame.SRCALPHA
+                ).convert_alpha()
+        self._frame = pygame.Surface(self._size).convert()
+        self._dirty = set(self._layers)
+        self._frame_presented = False
+
+    def invalidate(self, *layers: str):
+        """
+        Marks layers to be redrawn at the next render() call.
+
+        Parameters:
+            layers (str): names of the layers (all the layers if none is given)
+        """
+        self._dirty.update(layers or self._layers)
+
+    def render(self, screen: pygame.Surface) -> bool:
+        """
+        Redraws the invalidated layers and copies the frame on screen if it
+        changed since the last call.
+
+        Parameters:
+            screen (pygame.Surface): destination surface
+
+        Returns:
+            bool: True if the screen has been updated
+        """
+        if not self._dirty and self._frame_presented:
+            return False
+
+        for layer in self._layers:
+            if layer not in self._dirty:
+                continue
+            surface = self._surfaces[layer]
+            surface.fill((0, 0, 0, 0) if layer != self._layers[0] else (0, 0, 0))
+            callback = self._draw_callbacks.get(layer)
+            if callback is not None:
+                callback(surface)
+
+        if self._dirty:
+            self._frame.blit(self._surfaces[self._layers[0]], (0, 0))
+            for layer in self._layers[1:]:
+                self._frame.blit(self._surfaces[layer], (0, 0))
+            self._dirty.clear()
+
+        screen.blit(self._frame, (0, 0))
+        self._frame_presented = True
+        return True
+
+    @property
+    def frame(self) -> pygame.Surface:
+        """Last composed frame."""
+        return self._frame
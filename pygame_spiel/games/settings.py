@@ -1,8 +1,55 @@
 GAMES_BOTS = {
-    "tic_tac_toe": {"mcts": []},
-    "breakthrough": {"mcts": [], "dqn": ["breakthrough_weights"]},
+    "tic_tac_toe": {"mcts": [], "mcts_book": [], "mcts_array": [], "mcts_fast": []},
+    "breakthrough": {
+        "mcts": [],
+        "mcts_book": [],
+        "mcts_array": [],
+        "mcts_fast": [],
+        "dqn": ["breakthrough_weights"],
+        "alphabeta": [],
+        "dqn_mcts": ["breakthrough_weights"],
+        "dqn_torch": ["breakthrough_weights"],
+    },
 }
 
 SCREEN_SIZE = {"tic_tac_toe": [600, 600], "breakthrough": [1200, 1200]}
 
+# Board sizes selectable in the menu (open_spiel game parameters)
+GAMES_PARAMS = {
+    "breakthrough": {
+        "8x8": {},
+        "6x6": {"rows": 6, "columns": 6},
+        "10x10": {"rows": 10, "columns": 10},
+        "12x12": {"rows": 12, "columns": 12},
+    },
+}
+# Maximum width/height (pixels) of Breakthrough boards other than 8x8
+BREAKTHROUGH_MAX_BOARD_SIZE = 960
+
 BREAKPOINTS_DRIVE_IDS = {"breakthrough": {"dqn": "1c7y-vFezKvNF6qT3kGgEodkv0z6kvwPZ"}}
+
+# Bots using the weights downloaded for another Bot type
+BOTS_WEIGHTS = {"dqn_mcts": "dqn", "dqn_torch": "dqn"}
+
+# Number of positions (24 bytes each) stored in each opening book file
+OPENING_BOOK_CAPACITY = 1 << 18
+
+# Maximum number of nodes of the tree of the mcts_array Bot (22 bytes each,
+# allocated twice)
+MCTS_ARRAY_MAX_NODES = 1 << 18
+
+# Maximum number of buffered input events, and maximum time (milliseconds) the
+# main loop sleeps waiting for input when the human player has to move
+INPUT_BUFFER_SIZE = 256
+INPUT_WAIT_TIMEOUT = 100
+
+# Minimum time (milliseconds) between two snapshots of a MCTS search, which is
+# also the refresh interval of the search overlay while a Bot thinks
+SEARCH_SNAPSHOT_INTERVAL = 50
+
+# Telemetry (enabled with the PYGAME_SPIEL_TELEMETRY environment variable, see
+# pygame_spiel.telemetry): maximum number of queued events (newer events are
+# dropped when full), events sent per batch, and maximum seconds before sending
+TELEMETRY_QUEUE_SIZE = 10000
+TELEMETRY_BATCH_SIZE = 256
+TELEMETRY_FLUSH_INTERVAL = 1.0
@@ -0,0 +1,95 @@
+import typing as t
+
+import numpy as np
+
+import pyspiel
+
+
+class CachedState:
+    """
+    Wrapper of a pyspiel.State which computes the views derived from the state
+    (string, observation tensor, legal actions, rewards...) at most once, until
+    the next apply_action(). Every other method is forwarded to the wrapped
+    state, so the wrapper can be given to the UI code (renderers, history) in
+    place of the state. Bots are given the wrapped pyspiel.State instead: the
+    C++ Bots of pyspiel only accept genuine states.
+
+    The cached values are shared by all callers: observation tensors are
+    read-only NumPy arrays, and legal actions are returned as a new list at
+    every call.
+    """
+
+    __slots__ = ("_state", "_cache")
+
+    def __init__(self, state: pyspiel.State):
+        """
+        Parameters:
+            state (pyspiel.State): state to wrap (unwrapped if it's a CachedState)
+        """
+        if isinstance(state, CachedState):
+            state = state.state
+        self._state = state
+        self._cache = dict()
+
+    @property
+    def state(self) -> pyspiel.State:
+        """The wrapped pyspiel.State."""
+        return self._state
+
+    def _cached(self, key: t.Hashable, compute: t.Callable[[], t.Any]) -> t.Any:
+        value = self._cache.get(key)
+        if value is None:
+            value = self._cache[key] = compute()
+        return value
+
+    def apply_action(self, action: int) -> None:
+        self._cache.clear()
+        self._state.apply_action(action)
+
+    def clone(self) -> pyspiel.State:
+        """Returns a copy of the wrapped state (a plain pyspiel.State)."""
+        return self._state.clone()
+
+    def to_string(self) -> str:
+        return self._cached("string", self._state.to_string)
+
+    def __str__(self) -> str:
+        return self.to_string()
+
+    def current_player(self) -> int:
+        return self._cached("current_player", self._state.current_player)
+
+    def is_terminal(self) -> bool:
+        return self._cached("is_terminal", self._state.is_terminal)
+
+    def observation_tensor(self, player: t.Optional[int] = None) -> np.ndarray:
+        """Returns the observation tensor of a player (current one by default) as a float32 array."""
+        if player is None:
+            player = self.current_player()
+
+        def compute():
+            observation = np.asarray(
+                self._state.observation_tensor(player), dtype=np.float32
+            )
+            observation.flags.writeable = False
+            return observation
+
+        return self._cached(("observation", player), compute)
+
+    def legal_actions(self, player: t.Optional[int] = None) -> t.List[int]:
+        if player is None:
+            return list(self._cached("legal_actions", self._state.legal_actions))
+        return list(
+            self._cached(
+                ("legal_actions", player), lambda: self._state.legal_actions(player)
+            )
+        )
+
+    def rewards(self) -> t.List[float]:
+        return self._cached("rewards", self._state.rewards)
+
+    def returns(self) -> t.List[float]:
+        return self._cached("returns", self._state.returns)
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._state, name)
@@ -1,26 +1,24 @@
-import typing as t
 import pygame
 import site
+import typing as t
 from pathlib import Path
 
 from pygame_spiel.games import base
+from pygame_spiel.games.rendering import GridLayout
 
 
 class TicTacToe(base.Game):
-    def __init__(self, name, current_player):
-        super().__init__(name, current_player)
-
-        self._text_font = pygame.font.SysFont("Arial", 30)
-
-        # TicTacToe vertical/horizontal lines
-        self._line_h1_x_start, self._line_h1_y_start = 0, 200
-        self._line_h1_x_end, self._line_h1_y_end = 600, 200
-        self._line_h2_x_start, self._line_h2_y_start = 0, 400
-        self._line_h2_x_end, self._line_h2_y_end = 600, 400
-        self._line_v1_x_start, self._line_v1_y_start = 200, 0
-        self._line_v1_x_end, self._line_v1_y_end = 200, 600
-        self._line_v2_x_start, self._line_v2_y_start = 400, 0
-        self._line_v2_x_end, self._line_v2_y_end = 400, 600
+    def __init__(self, name, current_player, params=None):
+        super().__init__(name, current_player, params=params)
+
+        # 3x3 grid covering the whole screen. Cells are numbered 0 to 8 starting
+        # from top-left to bottom-right, as the actions in open_spiel:
+        # 0 1 2
+        # 3 4 5
+        # 6 7 8
+        self._layout = GridLayout(3, 3, origin=(0, 0), cell_size=(200, 200))
+        self._x_image_offset = 20  # Offset of the X image from the cell's corner
+        self._circle_radius = 60
 
         package_path = site.getsitepackages()[0]
 
@@ -28,146 +26,69 @@ class TicTacToe(base.Game):
             Path(package_path) / "pygame_spiel/images/tic_tac_toe/x_image.png"
         ).convert_alpha()
 
-        self._quadrant_pos_map_x = [
-            (20, 20),
-            (220, 20),
-            (420, 20),
-            (20, 220),
-            (220, 220),
-            (420, 220),
-            (20, 420),
-            (220, 420),
-            (420, 420),
-        ]
-        self._quadrant_pos_map_circle = [
-            (100, 100),
-            (300, 100),
-            (500, 100),
-            (100, 300),
-            (300, 300),
-            (500, 300),
-            (100, 500),
-            (300, 500),
-            (500, 500),
-        ]
-
-        self._list_x_pos, self._list_o_pos = [], []
-
-    def _get_quadrant(self, x: int, y: int) -> int:
+    def _get_token(self, row: int, col: int) -> str:
         """
-        Returns the quadrant index given the x,y coordinates in the board.
-        The quandrand indices are numbered 0 to 9 starting from top-left to
-        bottom-right:
-        0 1 2
-        3 4 5
-        6 7 8
-
-        Examples:
-            _get_quadrant(1, 1) -> 0
-            _get_quadrant(220, 420) -> 7
+        Returns the token in a cell ("x", "o" or "."), read from the state string.
 
         Parameters:
-            x (int): x coordinate
-            y (int): y coordinate
+            row (int): cell's row
+            col (int): cell's column
 
         Returns:
-            index (int): quadrant index at the x,y coordinates
+            token (str): token in the cell
         """
-        if y <= 200:
-            if x <= 200:
-                return 0
-            elif x > 200 and x <= 400:
-                return 1
-            else:
-                return 2
-        elif y > 200 and y <= 400:
-            if x <= 200:
-                return 3
-            elif x > 200 and x <= 400:
-                return 4
-            else:
-                return 5
-        else:
-            if x <= 200:
-                return 6
-            elif x > 200 and x <= 400:
-                return 7
-            else:
-                return 8
-
-    def _draw_text(self, text: str, text_col: t.Tuple[int, int, int], x: int, y: int):
+        return self._state_string[row * (self._layout.n_cols + 1) + col]
+
+    def _action_cell(self, action: int) -> t.Tuple[int, int]:
         """
-        Draws a text on the board. Used to write whether the player has won or
-        lost the game
+        Returns the cell marked by an action.
 
         Parameters:
-            text (str): text to visualize
-            text_col (tuple): text's color in the format (red, blue, green)
-            x (int): x coordinate
-            y (int): y coordinate
+            action (int): player's action
+
+        Returns:
+            tuple: row and column of the cell
         """
-        img = self._text_font.render(text, True, text_col)
-        self._screen.blit(img, (x, y))
+        return divmod(action, self._layout.n_cols)
+
+    def _draw_board(self, surface: pygame.Surface) -> None:
+        surface.fill("white")
+        width, height = self._layout.size
+        x0, y0 = self._layout.origin
+        for row in range(1, self._layout.n_rows):
+            y = self._layout.cell_origin(row, 0)[1]
+            pygame.draw.line(surface, "black", (x0, y), (x0 + width, y), 2)
+        for col in range(1, self._layout.n_cols):
+            x = self._layout.cell_origin(0, col)[0]
+            pygame.draw.line(surface, "black", (x, y0), (x, y0 + height), 2)
+
+    def _draw_pieces(self, surface: pygame.Surface) -> None:
+        for row in range(self._layout.n_rows):
+            for col in range(self._layout.n_cols):
+                token = self._get_token(row, col)
+                if token == "x":
+                    x, y = self._layout.cell_origin(row, col)
+                    surface.blit(
+                        self._x_image,
+                        (x + self._x_image_offset, y + self._x_image_offset),
+                    )
+                elif token == "o":
+                    center = self._layout.cell_center(row, col)
+                    pygame.draw.circle(
+                        surface, "black", center, self._circle_radius, width=4
+                    )
 
     def play(self, mouse_pos, mouse_pressed):
         if self._current_player == 0 and (mouse_pressed[0]):
-            action = self._get_quadrant(mouse_pos[0], mouse_pos[1])
-            if self._quadrant_pos_map_x[action] not in self._list_x_pos:
-                self._state.apply_action(action)
-                self._bots[1].inform_action(self._state, self._current_player, action)
-                if self._quadrant_pos_map_x[action] not in self._list_x_pos:
-                    self._list_x_pos.append(self._quadrant_pos_map_x[action])
+            cell = self._layout.cell_at(mouse_pos)
+            if cell is not None:
+                action = cell[0] * self._layout.n_cols + cell[1]
+                if action in self._state.legal_actions():
+                    self._apply_action(action)
         elif self._current_player == 1:
-            action = self._bots[1].step(self._state)
-            if self._quadrant_pos_map_circle[action] not in self._list_o_pos:
-                self._state.apply_action(action)
-                if self._quadrant_pos_map_circle[action] not in self._list_o_pos:
-                    self._list_o_pos.append(self._quadrant_pos_map_circle[action])
-
-        self._current_player = self._state.current_player()
+            action = self._bot_step(1)
+            if action is not None:
+                self._apply_action(action)
 
         # Visualization
-        self._screen.fill("white")
-
-        pygame.draw.line(
-            self._screen,
-            "black",
-            (self._line_h1_x_start, self._line_h1_y_start),
-            (self._line_h1_x_end, self._line_h1_y_end),
-            2,
-        )
-        pygame.draw.line(
-            self._screen,
-            "black",
-            (self._line_h2_x_start, self._line_h2_y_start),
-            (self._line_h2_x_end, self._line_h2_y_end),
-            2,
-        )
-        pygame.draw.line(
-            self._screen,
-            "black",
-            (self._line_v1_x_start, self._line_v1_y_start),
-            (self._line_v1_x_end, self._line_v1_y_end),
-            2,
-        )
-        pygame.draw.line(
-            self._screen,
-            "black",
-            (self._line_v2_x_start, self._line_v2_y_start),
-            (self._line_v2_x_end, self._line_v2_y_end),
-            2,
-        )
-
-        for x_pos in self._list_x_pos:
-            self._screen.blit(self._x_image, x_pos)
-        for o_pos in self._list_o_pos:
-            pygame.draw.circle(self._screen, "black", o_pos, 60, width=4)
-
-        if self._current_player == -4:
-            rewards = self._state.rewards()
-            if rewards[0] == 0 and rewards[1] == 0:
-                self._draw_text(f"DRAW", (0, 0, 0), 220, 300)
-            elif rewards[0] == 1:
-                self._draw_text(f"Winner: player 0", (0, 0, 0), 220, 300)
-            else:
-                self._draw_text(f"Winner: player 1", (0, 0, 0), 220, 300)
+        self._render()
@@ -0,0 +1,398 @@
+#!/usr/bin/env python
+"""
+Ladder comparing Bots on an open_spiel game.
+
+Every pair of Bots plays games in parallel (one process per CPU by default).
+Elo ratings are updated after each game, and each pairing stops as soon as a
+sequential probability ratio test (SPRT) tells which of the two Bots is the
+strongest. Results are saved to a JSON file, so that running the ladder again
+(e.g. with a new Bot) only plays the pairings which are still undecided.
+
+Example:
+    python -m pygame_spiel.ladder --game breakthrough --bots mcts random dqn
+"""
+
+import argparse
+import collections
+import inspect
+import itertools
+import json
+import math
+import os
+import typing as t
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+
+import pyspiel
+
+from pygame_spiel import registry
+from pygame_spiel.games.base import get_breakpoint_dir, init_bot
+
+ELO_K = 16
+INITIAL_ELO = 1500.0
+
+
+def _make_bot(game_name: str, bot_type: str, player_id: int, seed: int):
+    """Builds a bot as the UI does, seeding it when its factory accepts a seed."""
+    game = pyspiel.load_game(game_name)
+    bot_params = dict()
+    if bot_type in registry.bots:
+        factory = registry.bots.load(bot_type)
+        if "seed" in inspect.signature(factory).parameters:
+            bot_params["seed"] = seed
+    return init_bot(
+        bot_type,
+        game,
+        player_id,
+        breakpoint_dir=get_breakpoint_dir(game_name, bot_type),
+        **bot_params,
+    )
+
+
+def play_game(
+    game_name: str, bot_types: t.Tuple[str, str], seed: int, opening_plies: int
+) -> float:
+    """
+    Plays one game between two bots and returns the score of the first one.
+
+    The first opening_plies moves are played at random (with the given seed),
+    so that games between deterministic bots are not all identical.
+
+    Parameters:
+        game_name (str): name of the open_spiel game
+        bot_types (tuple): bot types of player 0 and player 1
+        seed (int): seed of the opening moves and of the bots
+        opening_plies (int): number of random moves at the beginning
+
+    Returns:
+        float: 1 if player 0 won, 0.5 for a draw, 0 if player 1 won
+    """
+    game = pyspiel.load_game(game_name)
+    bots = [
+        _make_bot(game_name, bot_type, player_id, seed + player_id)
+        for player_id, bot_type in enumerate(bot_types)
+    ]
+    rng = np.random.RandomState(seed)
+    state = game.new_initial_state()
+    for _ in range(opening_plies):
+        if state.is_terminal():
+            break
+        state.apply_action(rng.choice(state.legal_actions()))
+    for bot in bots:
+        bot.restart_at(state)
+
+    while not state.is_terminal():
+        player = state.current_player()
+        action = bots[player].step(state)
+        state.apply_action(action)
+        for other, bot in enumerate(bots):
+            if other != player:
+                bot.inform_action(state, player, action)
+
+    returns = state.returns()
+    if returns[0] > returns[1]:
+        return 1.0
+    if returns[0] < returns[1]:
+        return 0.0
+    return 0.5
+
+
+def elo_to_score(elo_diff: float) -> float:
+    """Expected score of a player rated elo_diff points above the opponent."""
+    return 1.0 / (1.0 + 10.0 ** (-elo_diff / 400.0))
+
+
+class Pairing:
+    """
+    Results of the games between two bots, with the SPRT deciding when to stop.
+
+    The test is H0: bot_a is elo_margin points weaker than bot_b, against
+    H1: bot_a is elo_margin points stronger, using the normal approximation
+    of the log-likelihood ratio on the game scores.
+    """
+
+    def __init__(self, bot_a: str, bot_b: str, wins=0, draws=0, losses=0, status=None):
+        self.bot_a, self.bot_b = bot_a, bot_b
+        self.wins, self.draws, self.losses = wins, draws, losses
+        self.status = status  # None (running), "H0", "H1" or "max_games"
+
+    @property
+    def n_games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    def add(self, score: float):
+        """Adds the result of a game, as score of bot_a."""
+        if score == 1.0:
+            self.wins += 1
+        elif score == 0.0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def llr(self, elo_margin: float) -> float:
+        """Log-likelihood ratio of H1 against H0."""
+        n = self.n_games
+        if n < 2:
+            return 0.0
+        mean = (self.wins + 0.5 * self.draws) / n
+        variance = (self.wins + 0.25 * self.draws) / n - mean**2
+        # Avoid a degenerate variance while all the games have the same result
+        variance = max(variance, 0.25 / n)
+        s0, s1 = elo_to_score(-elo_margin), elo_to_score(elo_margin)
+        return n * (s1 - s0) * (2 * mean - s0 - s1) / (2 * variance)
+
+    def update_status(
+        self, elo_margin: float, alpha: float, beta: float, max_games: int
+    ):
+        """Decides whether the pairing can stop."""
+        llr = self.llr(elo_margin)
+        if llr >= math.log((1 - beta) / alpha):
+            self.status = "H1"
+        elif llr <= math.log(beta / (1 - alpha)):
+            self.status = "H0"
+        elif self.n_games >= max_games:
+            self.status = "max_games"
+
+    def to_dict(self) -> dict:
+        return dict(
+            bot_a=self.bot_a,
+            bot_b=self.bot_b,
+            wins=self.wins,
+            draws=self.draws,
+            losses=self.losses,
+            status=self.status,
+        )
+
+
+def bradley_terry(pairings: t.List[Pairing], iterations: int = 100) -> dict:
+    """
+    Fits Bradley-Terry strengths to all the results (draws count as half a win)
+    with the minorization-maximization algorithm, and returns them on the Elo
+    scale (anchored to an average of INITIAL_ELO).
+
+    Parameters:
+        pairings (list[Pairing]): results of the ladder
+
+    Returns:
+        dict: bot name -> rating
+    """
+    bots = sorted({p.bot_a for p in pairings} | {p.bot_b for p in pairings})
+    wins = {bot: 0.0 for bot in bots}
+    games = dict()
+    for p in pairings:
+        wins[p.bot_a] += p.wins + 0.5 * p.draws
+        wins[p.bot_b] += p.losses + 0.5 * p.draws
+        key = frozenset((p.bot_a, p.bot_b))
+        games[key] = games.get(key, 0) + p.n_games
+
+    strength = {bot: 1.0 for bot in bots}
+    for _ in range(iterations):
+        for bot in bots:
+            denominator = sum(
+                n / (strength[bot] + strength[other])
+                for key, n in games.items()
+                if bot in key
+                for other in key - {bot}
+            )
+            # A virtual draw against a reference bot (strength 1) keeps the
+            # strength of bots without wins (or losses) finite
+            denominator += 1.0 / (strength[bot] + 1.0)
+            strength[bot] = (wins[bot] + 0.5) / denominator
+        mean_log = np.mean([math.log(s) for s in strength.values()])
+        strength = {bot: s / math.exp(mean_log) for bot, s in strength.items()}
+    return {bot: INITIAL_ELO + 400.0 * math.log10(strength[bot]) for bot in bots}
+
+
+class Ladder:
+    """Schedules the games of all the pairings and keeps the results on disk."""
+
+    def __init__(
+        self,
+        game_name: str,
+        bot_types: t.List[str],
+        results_path: str,
+        elo_margin: float = 30.0,
+        alpha: float = 0.05,
+        beta: float = 0.05,
+        max_games: int = 400,
+        opening_plies: int = 2,
+    ):
+        for bot_type in bot_types:
+            if bot_type not in registry.bots:
+                raise ValueError("Invalid bot type: %s" % bot_type)
+        self._game_name = game_name
+        self._results_path = Path(results_path)
+        self._elo_margin, self._alpha, self._beta = elo_margin, alpha, beta
+        self._max_games = max_games
+        self._opening_plies = opening_plies
+        self._pairings = dict()
+        self._elo = dict()
+        self._load()
+        for bot_a, bot_b in itertools.combinations(bot_types, 2):
+            if (bot_a, bot_b) not in self._pairings:
+                self._pairings[(bot_a, bot_b)] = Pairing(bot_a, bot_b)
+        for bot in bot_types:
+            self._elo.setdefault(bot, INITIAL_ELO)
+
+    def _load(self):
+        """Loads the results of a previous run (same game), if any."""
+        if not self._results_path.exists():
+            return
+        with open(self._results_path) as f:
+            data = json.load(f)
+        if data.get("game") != self._game_name:
+            raise ValueError(
+                f"{self._results_path} contains results for game {data.get('game')}"
+            )
+        self._elo = data["elo"]
+        for pairing in data["pairings"]:
+            pairing = Pairing(**pairing)
+            self._pairings[(pairing.bot_a, pairing.bot_b)] = pairing
+
+    def save(self):
+        """Writes the results to disk (atomically, to survive interruptions)."""
+        pairings = list(self._pairings.values())
+        data = dict(
+            game=self._game_name,
+            elo=self._elo,
+            bradley_terry=bradley_terry(pairings),
+            pairings=[p.to_dict() for p in pairings],
+        )
+        tmp_path = self._results_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self._results_path)
+
+    def _update_elo(self, bot_a: str, bot_b: str, score: float):
+        """Online Elo update after a game of bot_a against bot_b."""
+        expected = elo_to_score(self._elo[bot_a] - self._elo[bot_b])
+        self._elo[bot_a] += ELO_K * (score - expected)
+        self._elo[bot_b] -= ELO_K * (score - expected)
+
+    def run(self, workers: int = None, save_every: int = 10):
+        """
+        Plays the games of the undecided pairings until all of them stop.
+
+        Parameters:
+            workers (int): number of processes (default: number of CPUs)
+            save_every (int): number of games between two saves
+        """
+        workers = workers or os.cpu_count() or 1
+        running = [p for p in self._pairings.values() if p.status is None]
+        scheduled = {id(p): p.n_games for p in running}
+        in_flight = dict()
+        games_since_save = 0
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Round-robin over the pairings which still have games to schedule
+            queue = collections.deque(running)
+            while queue or in_flight:
+                # Keep every worker busy
+                while queue and len(in_flight) < 2 * workers:
+                    pairing = queue.popleft()
+                    if (
+                        pairing.status is not None
+                        or scheduled[id(pairing)] >= self._max_games
+                    ):
+                        continue  # Leaves the round-robin
+                    game_index = scheduled[id(pairing)]
+                    scheduled[id(pairing)] += 1
+                    # Alternate colors: bot_a moves first in even games
+                    swap = game_index % 2 == 1
+                    bot_types = (pairing.bot_a, pairing.bot_b)
+                    future = executor.submit(
+                        play_game,
+                        self._game_name,
+                        bot_types[::-1] if swap else bot_types,
+                        game_index,
+                        self._opening_plies,
+                    )
+                    in_flight[future] = (pairing, swap)
+                    queue.append(pairing)
+
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    pairing, swap = in_flight.pop(future)
+                    if pairing.status is not None:
+                        # Scheduled before the SPRT stopped the pairing
+                        continue
+                    score = future.result()
+                    score = 1.0 - score if swap else score
+                    pairing.add(score)
+                    self._update_elo(pairing.bot_a, pairing.bot_b, score)
+                    pairing.update_status(
+                        self._elo_margin, self._alpha, self._beta, self._max_games
+                    )
+                    if pairing.status is not None:
+                        print(self._describe(pairing))
+                        self._cancel(in_flight, pairing)
+                    games_since_save += 1
+                    if games_since_save >= save_every:
+                        self.save()
+                        games_since_save = 0
+        self.save()
+
+    @staticmethod
+    def _cancel(in_flight: dict, pairing: Pairing):
+        """
+        Cancels the games of a stopped pairing which haven't started yet. The
+        results of the games already running are ignored.
+        """
+        for future, (other, _) in list(in_flight.items()):
+            if other is pairing and future.cancel():
+                del in_flight[future]
+
+    def _describe(self, pairing: Pairing) -> str:
+        outcome = {
+            "H1": f"{pairing.bot_a} is stronger",
+            "H0": f"{pairing.bot_b} is stronger",
+            "max_games": "undecided",
+        }[pairing.status]
+        return (
+            f"{pairing.bot_a} vs {pairing.bot_b}: +{pairing.wins} "
+            f"={pairing.draws} -{pairing.losses} ({outcome})"
+        )
+
+    def print_ratings(self):
+        ratings = bradley_terry(list(self._pairings.values()))
+        for bot, elo in sorted(self._elo.items(), key=lambda item: -item[1]):
+            print(
+                f"{bot:>20s}  Elo {elo:7.1f}  Bradley-Terry {ratings.get(bot, 0):7.1f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Bots with an Elo ladder.")
+    parser.add_argument("--game", default="breakthrough")
+    parser.add_argument("--bots", nargs="+", required=True, help="Bot types")
+    parser.add_argument("--results", default="ladder.json", help="results file")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--elo_margin", type=float, default=30.0)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--beta", type=float, default=0.05)
+    parser.add_argument("--max_games", type=int, default=400)
+    parser.add_argument("--opening_plies", type=int, default=2)
+    args = parser.parse_args()
+
+    ladder = Ladder(
+        args.game,
+        args.bots,
+        args.results,
+        elo_margin=args.elo_margin,
+        alpha=args.alpha,
+        beta=args.beta,
+        max_games=args.max_games,
+        opening_plies=args.opening_plies,
+    )
+    ladder.run(workers=args.workers)
+    ladder.print_ratings()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,17 @@
 #!/usr/bin/env python
 
+import time
+
 import pygame
 
-from pygame_spiel.games.settings import GAMES_BOTS
+from pygame_spiel import registry, telemetry
 from pygame_spiel.games.factory import GameFactory
+from pygame_spiel.games.inputs import InputBuffer, LatencyMeter
+from pygame_spiel.games.settings import (
+    INPUT_BUFFER_SIZE,
+    INPUT_WAIT_TIMEOUT,
+    SEARCH_SNAPSHOT_INTERVAL,
+)
 from pygame_spiel.menu import Menu
 
 
@@ -12,15 +20,18 @@ def select_game(game, index):
 
 
 def pygame_spiel():
+    sink = telemetry.configure_from_env()
     menu = Menu()
     menu.display()
     game_name = menu.get_selected_game()
+    game_params = menu.get_selected_game_params()
     bot_type = menu.get_selected_opponent()
     registered_bots = menu.get_registered_bots()
+    warm_bot = menu.get_warm_bot()
 
     player_id = 0
 
-    list_available_bots = list(GAMES_BOTS[game_name].keys()) + list(
+    list_available_bots = registry.available_bots(game_name) + list(
         registered_bots.keys()
     )
     assert (
@@ -28,29 +39,47 @@ def pygame_spiel():
     ), f"""Bot type {bot_type} not available for game {game_name}. List of 
         available bots: {list_available_bots}"""
 
-    game = GameFactory.get_game(game_name, current_player=player_id)
+    game = GameFactory.get_game(game_name, current_player=player_id, params=game_params)
     game.register_bots(registered_bots)
     game.set_bots(
         bot1_type="human",
         bot1_params=None,
         bot2_type=bot_type,
         bot2_params=None,
+        bot2=warm_bot,
     )
 
-    done = False
-    clock = pygame.time.Clock()
-
-    while not done:
-        clock.tick(10)
-
-        events = pygame.event.get()
-        for event in events:
-            if event.type == pygame.QUIT:
-                done = True
+    input_buffer = InputBuffer(maxlen=INPUT_BUFFER_SIZE)
+    latency = LatencyMeter()
 
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()
+    while not input_buffer.quit_requested:
+        # Sleep until the next input when only a human can move the game
+        # forward, or until the next search snapshot while a Bot thinks (the
+        # Bot wakes the loop up when done), otherwise just collect the events
+        # received meanwhile
+        if game.awaiting_human_input():
+            input_buffer.wait(timeout=INPUT_WAIT_TIMEOUT)
+        elif game.is_bot_thinking():
+            input_buffer.wait(timeout=SEARCH_SNAPSHOT_INTERVAL)
+        else:
+            input_buffer.poll()
 
-        game.play(mouse_pos=mouse_pos, mouse_pressed=mouse_pressed)
+        start = time.perf_counter()
+        updated, handled = game.process_input(input_buffer.drain(), input_buffer.hover)
+        # Only the events the game acted upon count for the latency
+        for timestamp in handled:
+            latency.input_received(timestamp)
+        if updated:
+            pygame.display.flip()
+            latency.frame_displayed()
+            telemetry.emit("frame", ms=(time.perf_counter() - start) * 1000)
 
-        pygame.display.flip()
+    stats = latency.summary()
+    if stats:
+        print(
+            "Input-to-display latency: mean {mean:.1f} ms, p95 {p95:.1f} ms, "
+            "max {max:.1f} ms ({count} events)".format(**stats)
+        )
+    sink.close()
+    if sink.dropped:
+        print(f"Telemetry: {sink.dropped} events dropped")
@@ -1,12 +1,16 @@
 import os
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import pygame
 import pygame_menu
+import pyspiel
 from pygame_menu import themes
 
-from pygame_spiel.games.settings import GAMES_BOTS
-from pygame_spiel.utils import register_classes
+from pygame_spiel import registry
+from pygame_spiel.discovery import BotDiscovery
+from pygame_spiel.games.base import warm_up_bot
+from pygame_spiel.games.settings import GAMES_BOTS, GAMES_PARAMS
 
 
 class Menu:
@@ -17,13 +21,21 @@ class Menu:
 
         self._selected_game = "breakthrough"
         self._selected_opponent_type = "mcts"
+        self._selected_board = self._get_boards(self._selected_game)[0][0]
         self._list_opponent_types = self._get_game_available_bots(self._selected_game)
-        self._list_opponents = [
-            (opp_type, i) for i, opp_type in enumerate(self._list_opponent_types)
-        ]
         self._current_path = os.getcwd()
         self._bot_path = None
         self._registered_bots = dict()
+        self._discovery = BotDiscovery()
+        self._list_opponents = self._get_opponents()
+
+        # The Bot of the selected game/opponent is built in the background while
+        # the menu is shown (see _warm_up()), so the game starts right away
+        self._warm_up_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pygame_spiel-warm-up"
+        )
+        self._warm_ups: t.Dict[tuple, Future] = dict()
+        self._warm_up()
 
         self._mainmenu = pygame_menu.Menu(
             "Pygame spiel", 600, 600, theme=themes.THEME_SOLARIZED
@@ -37,10 +49,16 @@ class Menu:
         self._mainmenu.add.label("", label_id="path_display", max_char=-1, font_size=20)
         self._menu_dropselect_game = self._mainmenu.add.dropselect(
             "Game :",
-            [("breakthrough", 1), ("tic_tac_toe", 2)],
+            [(game, i + 1) for i, game in enumerate(registry.available_games())],
             onchange=self._select_game,
             default=0,
         )
+        self._menu_dropselect_board = self._mainmenu.add.dropselect(
+            "Board :",
+            self._get_boards(self._selected_game),
+            onchange=self._select_board,
+            default=0,
+        )
         self._menu_dropselect_opponent = self._mainmenu.add.dropselect(
             "Opponent :",
             self._list_opponents,
@@ -69,9 +87,42 @@ class Menu:
             list[tuple[str, str]]: list containing files and folder names
         """
         items = [".."]  # Add option to go up one directory
-        items.extend(sorted(os.listdir(path)))
+        items.extend(self._discovery.list_directory(path))
         return [(item, item) for item in items]
 
+    def _get_opponents(self) -> list[tuple[str, t.Any]]:
+        """
+        Returns the items of the opponents dropdown: the Bots available for the
+        selected game, followed by the Bots registered from custom modules.
+        Bots registered more than once (e.g. selecting the same module twice)
+        only appear once.
+
+        Returns:
+            list[tuple[str, Any]]: list containing opponents names and ids
+        """
+        opponents = [
+            (opp_type, i) for i, opp_type in enumerate(self._list_opponent_types)
+        ]
+        for class_name in self._registered_bots.keys():
+            if class_name not in self._list_opponent_types:
+                opponents.append((class_name, class_name))
+        return opponents
+
+    def _update_opponents_dropdown(self):
+        """
+        Helper function to visualize new information in the opponents dropdown.
+        The selected opponent stays selected if it's still available, otherwise
+        the first opponent is selected.
+        """
+        self._list_opponents = self._get_opponents()
+        self._menu_dropselect_opponent.update_items(self._list_opponents)
+        names = [name for name, _ in self._list_opponents]
+        if self._selected_opponent_type not in names:
+            self._selected_opponent_type = names[0]
+        self._menu_dropselect_opponent.set_value(
+            names.index(self._selected_opponent_type)
+        )
+
     def _update_modules_dropdown(self):
         """Helper function to visualize new information in the modules dropdown."""
         items = self._get_files_and_folders(self._current_path)
@@ -97,27 +148,57 @@ class Menu:
             if new_path.endswith(".py"):
                 self._bot_path = new_path
                 file_name = Path(new_path).name
-                self._registered_bots = register_classes(file_path=self._bot_path)
-                for class_name in self._registered_bots.keys():
-                    self._list_opponents.append((class_name, class_name))
-                self._menu_dropselect_opponent.update_items(self._list_opponents)
+                self._registered_bots = self._discovery.find_bots(self._bot_path)
+                self._update_opponents_dropdown()
                 str_registered_bots = ", ".join(self._registered_bots.keys())
                 self._mainmenu.get_widget("path_display").set_title(
                     f"Selected file: {file_name} (new Bots: {str_registered_bots})"
                 )
+                self._warm_up()
         self._update_modules_dropdown()
 
-    def _get_game_available_bots(self, game: str) -> t.List:
+    def _get_game_available_bots(self, game: str, params: dict = None) -> t.List:
         """
         Returns the list of available bots for a specified game.
         Example: _get_game_available_bots('breaktrhough') -> ['mcts', 'dqn']
 
+        Bots relying on downloaded weights (see GAMES_BOTS) are only available
+        on the default board, which their weights were trained for.
+
         Parameters:
             game (str): selected game
+            params (dict): open_spiel parameters of the selected board (empty
+                or None for the default board)
+        """
+        bots = registry.available_bots(game)
+        if params:
+            bots = [bot for bot in bots if not GAMES_BOTS.get(game, {}).get(bot)]
+        return bots
+
+    def _get_boards(self, game: str) -> list[tuple[str, str]]:
+        """
+        Returns the items of the board dropdown: the board sizes available for
+        a game (see GAMES_PARAMS), or only "default".
+
+        Parameters:
+            game (str): selected game
+        """
+        return [(board, board) for board in GAMES_PARAMS.get(game, {"default": {}})]
+
+    def _select_board(self, board: str, board_index: int):
         """
-        dict_game_info = GAMES_BOTS[game]
-        list_bot_types = list(dict_game_info.keys())
-        return list_bot_types
+        Callback function for the Dropselect menu used to select the board size.
+
+        Parameters:
+            board (str): board selected in the drop-select menu
+            board_index (int): index of the selected board
+        """
+        self._selected_board = board[0][0]
+        self._list_opponent_types = self._get_game_available_bots(
+            self._selected_game, self.get_selected_game_params()
+        )
+        self._update_opponents_dropdown()
+        self._warm_up()
 
     def _select_game(self, game: str, game_index: int):
         """
@@ -129,11 +210,12 @@ class Menu:
         """
         self._selected_game = game[0][0]
         self._list_opponent_types = self._get_game_available_bots(self._selected_game)
-
-        drop_select_items = [
-            (opp_type, i) for i, opp_type in enumerate(self._list_opponent_types)
-        ]
-        self._menu_dropselect_opponent.update_items(drop_select_items)
+        self._update_opponents_dropdown()
+        boards = self._get_boards(self._selected_game)
+        self._selected_board = boards[0][0]
+        self._menu_dropselect_board.update_items(boards)
+        self._menu_dropselect_board.set_value(0)
+        self._warm_up()
 
     def _select_opponent(self, bot_type: str, opp_index: int):
         """
@@ -144,6 +226,45 @@ class Menu:
             opp_index (int): index of the selected opponent type
         """
         self._selected_opponent_type = bot_type[0][0]
+        self._warm_up()
+
+    def _warm_up_key(self) -> tuple:
+        """Returns the key identifying the selected game, board and opponent."""
+        params = self.get_selected_game_params()
+        return (
+            self._selected_game,
+            tuple(sorted(params.items())),
+            self._selected_opponent_type,
+        )
+
+    def _warm_up(self):
+        """
+        Starts building the Bot of the selected opponent in the background
+        (see pygame_spiel.games.base.warm_up_bot), replacing the warm-ups of
+        previous selections: the ones which haven't started yet are cancelled,
+        and the result of the running one is discarded.
+        """
+        key = self._warm_up_key()
+        for other_key in list(self._warm_ups.keys()):
+            if other_key != key:
+                self._warm_ups.pop(other_key).cancel()
+        if key in self._warm_ups:
+            return
+
+        bot_type = self._selected_opponent_type
+        available_bots = self._get_game_available_bots(
+            self._selected_game, self.get_selected_game_params()
+        )
+        if bot_type not in available_bots and bot_type not in self._registered_bots:
+            return  # The opponent dropdown hasn't been updated yet
+        self._warm_ups[key] = self._warm_up_executor.submit(
+            warm_up_bot,
+            self._selected_game,
+            bot_type,
+            player_id=1,
+            params=self.get_selected_game_params(),
+            registered_bots=dict(self._registered_bots),
+        )
 
     def _start_game(self):
         """Callback function used when the button Play is selected, which turns off the menu."""
@@ -158,6 +279,17 @@ class Menu:
         """
         return self._selected_game
 
+    def get_selected_game_params(self) -> dict:
+        """
+        Getter which returns the open_spiel parameters of the selected board.
+
+        Returns:
+            params (dict): game parameters (empty for the default board)
+        """
+        return dict(
+            GAMES_PARAMS.get(self._selected_game, {}).get(self._selected_board, {})
+        )
+
     def get_selected_opponent(self) -> str:
         """
         Getter which returns the current selected opponent's Bot type.
@@ -167,6 +299,27 @@ class Menu:
         """
         return self._selected_opponent_type
 
+    def get_warm_bot(self) -> t.Optional[pyspiel.Bot]:
+        """
+        Returns the opponent's Bot built in the background for the current
+        selection, waiting for it if it's still being built, and stops the
+        warm-up thread. Returns None if the warm-up failed (the Bot is then
+        built by Game.set_bots(), which reports the error).
+
+        Returns:
+            bot (pyspiel.Bot): opponent's Bot (player 1), or None
+        """
+        future = self._warm_ups.pop(self._warm_up_key(), None)
+        for other in self._warm_ups.values():
+            other.cancel()
+        self._warm_ups.clear()
+        # The selected warm-up may still be queued behind a discarded one, so
+        # it must not be cancelled with the other futures
+        self._warm_up_executor.shutdown(wait=False)
+        if future is None or future.cancelled() or future.exception() is not None:
+            return None
+        return future.result()
+
     def get_selected_bot_file(self) -> str:
         """
         Getter which returns path to a file containing a new Bot definition.
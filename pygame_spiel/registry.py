@@ -0,0 +1,240 @@
+import importlib
+import typing as t
+from importlib import metadata
+
+from pygame_spiel.games.settings import GAMES_BOTS
+
+GAMES_ENTRY_POINT_GROUP = "pygame_spiel.games"
+BOTS_ENTRY_POINT_GROUP = "pygame_spiel.bots"
+
+
+class Registration:
+    """
+    Metadata of a game or Bot made available to pygame_spiel.
+
+    A registration only stores where the implementation lives, either as an
+    import path in the form "package.module:attribute", as an entry point or as
+    the object itself. The implementation is imported the first time load() is
+    called, so registering (or installing) many plugins doesn't slow down the
+    startup.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        target: t.Any,
+        games: t.Optional[t.List[str]] = None,
+        selectable: bool = True,
+        source: str = "builtin",
+    ):
+        """
+        Parameters:
+            name (str): name used to select the game or Bot
+            target (Any): "module:attribute" string, entry point or object
+            games (list[str]): games supported by a Bot (None means all games)
+            selectable (bool): whether the Bot is listed in the menu
+            source (str): where the registration comes from (e.g. "builtin",
+                "entry_point" or "runtime")
+        """
+        self.name = name
+        self.games = games
+        self.selectable = selectable
+        self.source = source
+        self._target = target
+        self._loaded = None
+
+    def supports(self, game: str) -> bool:
+        """Returns True if the registered Bot can play the given game."""
+        return self.games is None or game in self.games
+
+    def load(self) -> t.Any:
+        """
+        Imports (only once) and returns the registered implementation.
+
+        Returns:
+            Any: game class or Bot factory
+        """
+        if self._loaded is None:
+            target = self._target
+            if isinstance(target, metadata.EntryPoint):
+                self._loaded = target.load()
+            elif isinstance(target, str):
+                module_name, _, attributes = target.partition(":")
+                obj = importlib.import_module(module_name)
+                for attribute in filter(None, attributes.split(".")):
+                    obj = getattr(obj, attribute)
+                self._loaded = obj
+            else:
+                self._loaded = target
+        return self._loaded
+
+
+class Registry:
+    """
+    Collection of registrations for one kind of plugin (games or Bots).
+
+    Registrations come from two sources: the in-process API (register()) and
+    the package entry points of the given group. Entry points are only listed
+    (not loaded) the first time the registry is queried. Names registered
+    in-process take precedence over entry points with the same name.
+    """
+
+    def __init__(self, entry_point_group: str):
+        self._entry_point_group = entry_point_group
+        self._registrations = dict()
+        self._entry_points_scanned = False
+
+    def register(self, name: str, target: t.Any, **kwargs) -> Registration:
+        """
+        Registers a new game or Bot. An existing registration with the same
+        name is replaced.
+
+        Parameters:
+            name (str): name used to select the game or Bot
+            target (Any): "module:attribute" string or object
+            kwargs: metadata stored in the Registration (see Registration)
+
+        Returns:
+            Registration: the new registration
+        """
+        kwargs.setdefault("source", "runtime")
+        registration = Registration(name, target, **kwargs)
+        self._registrations[name] = registration
+        return registration
+
+    def _scan_entry_points(self):
+        """Adds a (not loaded) registration for each installed entry point."""
+        if self._entry_points_scanned:
+            return
+        self._entry_points_scanned = True
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            group = entry_points.select(group=self._entry_point_group)
+        else:  # Python < 3.10
+            group = entry_points.get(self._entry_point_group, [])
+        for entry_point in group:
+            if entry_point.name not in self._registrations:
+                self._registrations[entry_point.name] = Registration(
+                    entry_point.name, entry_point, source="entry_point"
+                )
+
+    def __contains__(self, name: str) -> bool:
+        self._scan_entry_points()
+        return name in self._registrations
+
+    def get(self, name: str) -> Registration:
+        """
+        Returns the registration of a game or Bot.
+
+        Parameters:
+            name (str): name of the game or Bot
+
+        Returns:
+            Registration: the registration associated to name
+        """
+        self._scan_entry_points()
+        if name not in self._registrations:
+            raise KeyError(
+                f"{name} not in list of available {self._entry_point_group}: "
+                f"{list(self._registrations.keys())}"
+            )
+        return self._registrations[name]
+
+    def names(self) -> t.List[str]:
+        """Returns the names of all registrations, in registration order."""
+        self._scan_entry_points()
+        return list(self._registrations.keys())
+
+    def load(self, name: str) -> t.Any:
+        """Imports and returns the implementation registered as name."""
+        return self.get(name).load()
+
+
+games = Registry(GAMES_ENTRY_POINT_GROUP)
+bots = Registry(BOTS_ENTRY_POINT_GROUP)
+
+
+def register_game(name: str, target: t.Any, **kwargs) -> Registration:
+    """
+    Registers a game class (subclass of pygame_spiel.games.base.Game).
+
+    Parameters:
+        name (str): open_spiel name of the game (e.g. "breakthrough")
+        target (Any): "module:attribute" string or class
+    """
+    return games.register(name, target, **kwargs)
+
+
+def register_bot(
+    name: str,
+    target: t.Any,
+    games: t.Optional[t.List[str]] = None,
+    selectable: bool = True,
+    **kwargs,
+) -> Registration:
+    """
+    Registers a Bot factory. The factory is called as
+    factory(game=game, player_id=player_id, **params), so both pyspiel.Bot
+    subclasses and functions returning a Bot can be registered.
+
+    Parameters:
+        name (str): name of the Bot type (e.g. "mcts")
+        target (Any): "module:attribute" string, class or function
+        games (list[str]): games supported by the Bot (None means all games)
+        selectable (bool): whether the Bot is listed in the menu
+    """
+    return bots.register(name, target, games=games, selectable=selectable, **kwargs)
+
+
+def available_games() -> t.List[str]:
+    """Returns the names of the registered games."""
+    return games.names()
+
+
+def available_bots(game: str) -> t.List[str]:
+    """
+    Returns the names of the Bots which can be selected for a game.
+    Example: available_bots('breakthrough') -> ['mcts', 'dqn']
+
+    Parameters:
+        game (str): name of the game
+    """
+    return [
+        name
+        for name in bots.names()
+        if bots.get(name).selectable and bots.get(name).supports(game)
+    ]
+
+
+#  Built-in games and Bots. Only import paths are stored here: the modules
+#  (and their heavy dependencies, e.g. TensorFlow for DQN) are imported when
+#  the game or Bot is selected.
+BUILTIN_GAMES = {
+    "breakthrough": "pygame_spiel.games.breakthrough:Breakthrough",
+    "tic_tac_toe": "pygame_spiel.games.tic_tac_toe:TicTacToe",
+}
+BUILTIN_BOTS = {
+    "mcts": "pygame_spiel.bots.builtin:mcts_bot",
+    "mcts_book": "pygame_spiel.bots.builtin:mcts_book_bot",
+    "mcts_array": "pygame_spiel.bots.builtin:mcts_array_bot",
+    "mcts_fast": "pygame_spiel.bots.builtin:mcts_fast_bot",
+    "dqn": "pygame_spiel.bots.builtin:dqn_bot",
+    "alphabeta": "pygame_spiel.bots.builtin:alphabeta_bot",
+    "dqn_mcts": "pygame_spiel.bots.builtin:dqn_mcts_bot",
+    "dqn_torch": "pygame_spiel.bots.builtin:dqn_torch_bot",
+    "random": "pygame_spiel.bots.builtin:random_bot",
+    "human": "pygame_spiel.bots.builtin:human_bot",
+}
+
+for _game_name, _target in BUILTIN_GAMES.items():
+    register_game(_game_name, _target, source="builtin")
+
+for _bot_type, _target in BUILTIN_BOTS.items():
+    _games = [game for game, game_bots in GAMES_BOTS.items() if _bot_type in game_bots]
+    register_bot(
+        _bot_type,
+        _target,
+        games=_games or None,
+        selectable=bool(_games),
+        source="builtin",
+    )
@@ -0,0 +1,271 @@
+"""
+Non-blocking telemetry of games, moves and timings.
+
+Events are put in a bounded queue by the game loop and shipped in batches by
+a background thread to a backend (a JSON-lines file or a statsd server over
+UDP). When the queue is full, new events are dropped (and counted) instead of
+blocking the game.
+
+Telemetry is disabled by default. It's enabled from the environment:
+    PYGAME_SPIEL_TELEMETRY=jsonl:/path/to/events.jsonl
+    PYGAME_SPIEL_TELEMETRY=statsd:localhost:8125
+or programmatically with configure().
+"""
+
+import atexit
+import json
+import os
+import queue
+import socket
+import threading
+import time
+import typing as t
+
+from pygame_spiel.games.settings import (
+    TELEMETRY_BATCH_SIZE,
+    TELEMETRY_FLUSH_INTERVAL,
+    TELEMETRY_QUEUE_SIZE,
+)
+
+TELEMETRY_ENV_VAR = "PYGAME_SPIEL_TELEMETRY"
+
+
+def _to_json(value: t.Any) -> t.Any:
+    """
+    Converts the values json can't serialize: NumPy scalars and arrays (e.g.
+    actions returned by Bots) to Python numbers and lists, anything else to
+    its string.
+    """
+    if hasattr(value, "item") and getattr(value, "ndim", None) == 0:
+        return value.item()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+class JsonLinesBackend:
+    """Appends events to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        """
+        Parameters:
+            path (str): path of the file (created if needed)
+        """
+        self._file = open(path, "a", buffering=1 << 16)
+
+    def send(self, events: t.List[dict]):
+        self._file.write(
+            "".join(json.dumps(event, default=_to_json) + "\n" for event in events)
+        )
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class StatsdBackend:
+    """
+    Sends events as statsd metrics over UDP. Several metrics are packed in
+    each datagram (one per line), up to max_packet_size bytes.
+
+    Metrics:
+        <prefix>.game.start:1|c
+        <prefix>.game.end.<outcome>:1|c (outcome: player0, player1 or draw)
+        <prefix>.move:1|c
+        <prefix>.bot.<bot_type>.latency:<ms>|ms
+        <prefix>.frame:<ms>|ms
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 8125,
+        prefix: str = "pygame_spiel",
+        max_packet_size: int = 1432,
+    ):
+        """
+        Parameters:
+            host (str): statsd host
+            port (int): statsd UDP port
+            prefix (str): prefix of the metric names
+            max_packet_size (int): maximum size of a datagram, in bytes
+        """
+        self._address = (host, port)
+        self._prefix = prefix
+        self._max_packet_size = max_packet_size
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def _metric(self, event: dict) -> t.Optional[str]:
+        """Converts an event to a statsd metric line (None if not exported)."""
+        kind = event["type"]
+        if kind == "game_start":
+            return f"{self._prefix}.game.start:1|c"
+        if kind == "game_end":
+            return f"{self._prefix}.game.end.{event['outcome']}:1|c"
+        if kind == "move":
+            return f"{self._prefix}.move:1|c"
+        if kind == "bot_latency":
+            return f"{self._prefix}.bot.{event['bot']}.latency:{event['ms']:.3f}|ms"
+        if kind == "frame":
+            return f"{self._prefix}.frame:{event['ms']:.3f}|ms"
+        return None
+
+    def send(self, events: t.List[dict]):
+        packet = b""
+        for event in events:
+            metric = self._metric(event)
+            if metric is None:
+                continue
+            line = metric.encode()
+            if packet and len(packet) + 1 + len(line) > self._max_packet_size:
+                self._socket.sendto(packet, self._address)
+                packet = b""
+            packet = packet + b"\n" + line if packet else line
+        if packet:
+            self._socket.sendto(packet, self._address)
+
+    def close(self):
+        self._socket.close()
+
+
+class Telemetry:
+    """
+    Bounded queue of events, emptied by a background thread which sends them
+    to the backend in batches.
+    """
+
+    def __init__(
+        self,
+        backend: t.Any,
+        max_queue_size: int = TELEMETRY_QUEUE_SIZE,
+        batch_size: int = TELEMETRY_BATCH_SIZE,
+        flush_interval: float = TELEMETRY_FLUSH_INTERVAL,
+    ):
+        """
+        Parameters:
+            backend (Any): object with send(events) and close() methods
+            max_queue_size (int): maximum number of events waiting to be sent
+            batch_size (int): maximum number of events sent together
+            flush_interval (float): maximum time (seconds) an event waits
+                before being sent
+        """
+        self._backend = backend
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._closed = threading.Event()
+        self.dropped = 0  # Events dropped because the queue was full
+        self.failed = 0  # Batches the backend couldn't send
+        self._thread = threading.Thread(
+            target=self._run, name="pygame_spiel-telemetry", daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, event_type: str, **fields):
+        """
+        Queues an event, without blocking: the event is dropped if the queue
+        is full.
+
+        Parameters:
+            event_type (str): type of the event (e.g. "move")
+            fields: data of the event (JSON serializable)
+        """
+        fields["type"] = event_type
+        fields["time"] = time.time()
+        try:
+            self._queue.put_nowait(fields)
+        except queue.Full:
+            self.dropped += 1
+
+    def _next_batch(self) -> t.List[dict]:
+        """Waits for events (up to flush_interval) and returns a batch."""
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=self._flush_interval))
+            while len(batch) < self._batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            try:
+                self._backend.send(batch)
+            except Exception:
+                # e.g. network errors: the batch is lost, but the thread keeps
+                # sending the next ones
+                self.failed += 1
+
+    def close(self):
+        """Sends the queued events and stops the background thread."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._thread.join()
+        self._backend.close()
+
+
+class NullTelemetry:
+    """Telemetry sink used when telemetry is disabled: events are ignored."""
+
+    dropped = 0
+    failed = 0
+
+    def emit(self, event_type: str, **fields):
+        pass
+
+    def close(self):
+        pass
+
+
+_telemetry = NullTelemetry()
+
+
+def get() -> t.Union[Telemetry, NullTelemetry]:
+    """Returns the telemetry sink of the process."""
+    return _telemetry
+
+
+def emit(event_type: str, **fields):
+    """Queues an event in the telemetry sink of the process (see Telemetry.emit)."""
+    _telemetry.emit(event_type, **fields)
+
+
+def configure(backend: t.Any = None, **kwargs) -> t.Union[Telemetry, NullTelemetry]:
+    """
+    Sets the telemetry sink of the process, closing the previous one.
+
+    Parameters:
+        backend (Any): telemetry backend (None disables telemetry)
+        kwargs: parameters of Telemetry (e.g. max_queue_size)
+
+    Returns:
+        the new telemetry sink
+    """
+    global _telemetry
+    _telemetry.close()
+    _telemetry = NullTelemetry() if backend is None else Telemetry(backend, **kwargs)
+    atexit.register(_telemetry.close)
+    return _telemetry
+
+
+def configure_from_env() -> t.Union[Telemetry, NullTelemetry]:
+    """
+    Configures the telemetry from the PYGAME_SPIEL_TELEMETRY environment
+    variable: "jsonl:<path>" or "statsd:<host>:<port>". Telemetry stays
+    disabled if the variable isn't set.
+    """
+    setting = os.environ.get(TELEMETRY_ENV_VAR)
+    if not setting:
+        return _telemetry
+    kind, _, target = setting.partition(":")
+    if kind == "jsonl":
+        return configure(JsonLinesBackend(target))
+    if kind == "statsd":
+        host, _, port = target.rpartition(":")
+        return configure(StatsdBackend(host or "localhost", int(port or 8125)))
+    raise ValueError(f"Invalid {TELEMETRY_ENV_VAR} value: {setting}")
@@ -0,0 +1,332 @@
+"""
+Shared-memory transport between the UI and Bots running in other processes.
+
+Observation tensors, legal-action masks and serialized states are written in
+the slots of a ring buffer placed in multiprocessing.shared_memory. The worker
+reads them through NumPy views (no copy, no pickling) and writes the chosen
+action back in the same slot. Two semaphores signal new requests and new
+responses, so a move costs a couple of memory copies and two semaphore
+operations, whatever the size of the tensors.
+"""
+
+import multiprocessing as mp
+import traceback
+import typing as t
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import pyspiel
+
+_SHUTDOWN = -1
+_MAX_ERROR_BYTES = 2048
+_POLL_INTERVAL = 0.5  # Seconds between two checks that the worker is alive
+_JOIN_TIMEOUT = 5.0  # Seconds given to the worker to stop before killing it
+
+
+class ObservationRing:
+    """
+    Ring buffer of request/response slots in a shared memory block.
+
+    Each slot holds: the request sequence number, the player to move, the
+    observation tensor, the legal-action mask, the serialized state (and its
+    length), the chosen action and the sequence number of the response, and
+    the traceback of the bot (empty unless its step() raised an exception).
+    """
+
+    def __init__(
+        self,
+        observation_size: int,
+        num_actions: int,
+        num_slots: int = 4,
+        max_state_bytes: int = 8192,
+        name: str = None,
+    ):
+        """
+        Creates the ring buffer (or attaches to an existing one if name is given).
+
+        Parameters:
+            observation_size (int): size of the flat observation tensor
+            num_actions (int): number of distinct actions of the game
+            num_slots (int): number of slots (requests in flight)
+            max_state_bytes (int): maximum size of a serialized state
+            name (str): name of an existing shared memory block
+        """
+        self._dtype = np.dtype(
+            [
+                ("seq", "<i8"),
+                ("player", "<i8"),
+                ("response_seq", "<i8"),
+                ("action", "<i8"),
+                ("state_length", "<i8"),
+                ("observation", "<f4", (observation_size,)),
+                ("legal_mask", "u1", (num_actions,)),
+                ("state", "u1", (max_state_bytes,)),
+                ("error", f"S{_MAX_ERROR_BYTES}"),
+            ],
+            align=True,
+        )
+        self.layout = (observation_size, num_actions, num_slots, max_state_bytes)
+        size = self._dtype.itemsize * num_slots
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._owner = True
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            self._owner = False
+        self.slots = np.ndarray((num_slots,), dtype=self._dtype, buffer=self._shm.buf)
+        if self._owner:
+            self.slots["seq"] = 0
+            self.slots["response_seq"] = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def write_request(self, seq: int, state: pyspiel.State) -> int:
+        """
+        Writes a state in the slot of request seq.
+
+        Parameters:
+            seq (int): request sequence number (starting from 1)
+            state (pyspiel.State): state to send
+
+        Returns:
+            slot (int): index of the slot
+        """
+        slot = seq % len(self.slots)
+        record = self.slots[slot]
+        player = state.current_player()
+        record["player"] = player
+        record["observation"][:] = state.observation_tensor(player)
+        mask = record["legal_mask"]
+        mask[:] = 0
+        mask[state.legal_actions(player)] = 1
+        serialized = state.serialize().encode()
+        if len(serialized) > len(record["state"]):
+            raise ValueError(
+                f"Serialized state too large ({len(serialized)} bytes) for the "
+                f"shared memory slots ({len(record['state'])} bytes)"
+            )
+        record["state"][: len(serialized)] = np.frombuffer(serialized, np.uint8)
+        record["state_length"] = len(serialized)
+        record["error"] = b""
+        record["seq"] = seq  # Written last: the request is complete
+        return slot
+
+    def close(self):
+        """Detaches from the shared memory (and frees it, for the creator)."""
+        self.slots = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+class SharedStateView:
+    """
+    Read-only view of a state received through an ObservationRing.
+
+    observation_tensor(), legal_actions() and current_player() are answered
+    from the shared memory (the observation tensor is a NumPy view, not a
+    copy). Any other method is forwarded to the full pyspiel state, which is
+    only deserialized the first time it's needed (e.g. by MCTS, which clones
+    the state).
+    """
+
+    def __init__(self, game: pyspiel.Game, record: np.void):
+        self._game = game
+        self._record = record
+        self._state = None
+
+    def current_player(self) -> int:
+        return int(self._record["player"])
+
+    def observation_tensor(self, player: int = None) -> np.ndarray:
+        if player is not None and player != self.current_player():
+            return self._full_state().observation_tensor(player)
+        return self._record["observation"]
+
+    def legal_actions(self, player: int = None) -> t.List[int]:
+        if player is not None and player != self.current_player():
+            return self._full_state().legal_actions(player)
+        return np.flatnonzero(self._record["legal_mask"]).tolist()
+
+    def legal_actions_mask(self, player: int = None) -> np.ndarray:
+        if player is not None and player != self.current_player():
+            return np.asarray(self._full_state().legal_actions_mask(player))
+        return self._record["legal_mask"]
+
+    def is_terminal(self) -> bool:
+        return False  # Bots are only asked to move in non-terminal states
+
+    def _full_state(self) -> pyspiel.State:
+        if self._state is None:
+            length = int(self._record["state_length"])
+            serialized = self._record["state"][:length].tobytes().decode()
+            self._state = self._game.deserialize_state(serialized)
+        return self._state
+
+    def __getattr__(self, name):
+        return getattr(self._full_state(), name)
+
+
+def serve(
+    ring_name: str,
+    layout: t.Tuple[int, int, int, int],
+    game_string: str,
+    bot_type: str,
+    player_id: int,
+    requests: t.Any,
+    responses: t.Any,
+):
+    """
+    Worker loop: waits for requests in the ring buffer, asks the bot for an
+    action and writes it back. The bot is built as in the UI (see
+    pygame_spiel.games.base.init_bot). If the bot raises an exception, its
+    traceback is written back instead of the action.
+
+    Parameters:
+        ring_name (str): name of the shared memory block
+        layout (tuple): ObservationRing.layout of the ring buffer
+        game_string (str): open_spiel game string (e.g. "breakthrough()")
+        bot_type (str): Bot type
+        player_id (int): id of the player driven by the bot
+        requests, responses (multiprocessing.Semaphore): signal new
+            requests and new responses
+    """
+    from pygame_spiel.games.base import get_breakpoint_dir, init_bot
+
+    game = pyspiel.load_game(game_string)
+    bot = init_bot(
+        bot_type,
+        game,
+        player_id,
+        breakpoint_dir=get_breakpoint_dir(game.get_type().short_name, bot_type),
+    )
+    ring = ObservationRing(*layout, name=ring_name)
+    seq, record = 0, None
+    try:
+        while True:
+            requests.acquire()
+            seq += 1
+            record = ring.slots[seq % len(ring.slots)]
+            if record["seq"] == _SHUTDOWN:
+                break
+            try:
+                record["action"] = bot.step(SharedStateView(game, record))
+            except Exception:
+                error = traceback.format_exc().encode(errors="replace")
+                record["error"] = error[-_MAX_ERROR_BYTES:]
+            record["response_seq"] = seq
+            responses.release()
+    finally:
+        record = None  # Views must be released before closing the memory
+        ring.close()
+
+
+def _stop_worker(process: mp.Process, ring: ObservationRing, requests: t.Any):
+    """
+    Stops the worker process of a RemoteBot (killing it if it doesn't stop
+    in time) and frees the ring buffer.
+    """
+    if process.is_alive():
+        # No request is in flight: whatever slot the worker reads next, it
+        # finds the shutdown request
+        ring.slots["seq"] = _SHUTDOWN
+        requests.release()
+        process.join(timeout=_JOIN_TIMEOUT)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+    ring.close()
+
+
+class RemoteBot(pyspiel.Bot):
+    """
+    Bot running in a separate process, fed through an ObservationRing.
+
+    The remote bot receives the complete state at every move, so it doesn't
+    need inform_action() or restart_at() calls. The worker is stopped and the
+    shared memory freed by close(), or at the latest when the RemoteBot is
+    garbage collected or the interpreter exits.
+    """
+
+    def __init__(
+        self,
+        game: pyspiel.Game,
+        player_id: int,
+        bot_type: str,
+        num_slots: int = 4,
+        max_state_bytes: int = 8192,
+    ):
+        """
+        Parameters:
+            game (pyspiel.Game): open_spiel game
+            player_id (int): id of the player driven by the bot
+            bot_type (str): type of the bot run in the worker process
+            num_slots (int): number of slots of the ring buffer
+            max_state_bytes (int): maximum size of a serialized state
+        """
+        pyspiel.Bot.__init__(self)
+        self._ring = ObservationRing(
+            game.observation_tensor_size(),
+            game.num_distinct_actions(),
+            num_slots=num_slots,
+            max_state_bytes=max_state_bytes,
+        )
+        context = mp.get_context("spawn")
+        self._requests = context.Semaphore(0)
+        self._responses = context.Semaphore(0)
+        self._seq = 0
+        self._bot_type = bot_type
+        self._process = context.Process(
+            target=serve,
+            args=(
+                self._ring.name,
+                self._ring.layout,
+                str(game),
+                bot_type,
+                player_id,
+                self._requests,
+                self._responses,
+            ),
+            daemon=True,
+        )
+        self._process.start()
+        self._finalizer = weakref.finalize(
+            self, _stop_worker, self._process, self._ring, self._requests
+        )
+
+    def restart_at(self, state):
+        pass
+
+    def step(self, state):
+        """
+        Sends the state to the worker and waits for its action.
+
+        Raises:
+            RuntimeError: if the bot raised an exception, or if the worker
+                process exited
+        """
+        self._seq += 1
+        slot = self._ring.write_request(self._seq, state)
+        self._requests.release()
+        while not self._responses.acquire(timeout=_POLL_INTERVAL):
+            if not self._process.is_alive():
+                raise RuntimeError(
+                    f"The process of bot {self._bot_type} exited "
+                    f"(exit code {self._process.exitcode})"
+                )
+        record = self._ring.slots[slot]
+        assert record["response_seq"] == self._seq, "Out of order response"
+        if record["error"]:
+            raise RuntimeError(
+                f"Bot {self._bot_type} failed in its process:\n"
+                + record["error"].decode(errors="replace")
+            )
+        return int(record["action"])
+
+    def close(self):
+        """Stops the worker process and frees the shared memory."""
+        self._finalizer()
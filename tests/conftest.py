@@ -0,0 +1,5 @@
+import os
+
+# The games draw with pygame: tests run without a display (nor sound)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
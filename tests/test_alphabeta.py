@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+import pyspiel
+
+from pygame_spiel.bots.alphabeta import AlphaBetaBot, BreakthroughBoard
+
+
+def random_states(game, n_games=5, seed=0):
+    """Yields the non-terminal states of random games."""
+    rng = random.Random(seed)
+    for _ in range(n_games):
+        state = game.new_initial_state()
+        while not state.is_terminal():
+            yield state
+            state = state.child(rng.choice(state.legal_actions()))
+
+
+@pytest.mark.parametrize(
+    "game_string", ["breakthrough", "breakthrough(rows=6,columns=5)"]
+)
+def test_moves_match_the_legal_actions(game_string):
+    game = pyspiel.load_game(game_string)
+    params = game.get_parameters()
+    board = BreakthroughBoard(params["rows"], params["columns"])
+    for state in random_states(game):
+        board.set_state(state)
+        actions = [move[0] for move in board.moves()]
+        assert sorted(actions) == state.legal_actions()
+
+
+def test_apply_and_undo_restore_the_board():
+    game = pyspiel.load_game("breakthrough(rows=6,columns=6)")
+    board = BreakthroughBoard(6, 6)
+    for state in random_states(game, n_games=2):
+        board.set_state(state)
+        cells, pawns, player, key = (
+            list(board.cells),
+            [set(p) for p in board.pawns],
+            board.player,
+            board.hash,
+        )
+        for move in board.moves():
+            board.apply(move)
+            # Same position as open_spiel's, hash included
+            child_state = state.child(move[0])
+            child = BreakthroughBoard(6, 6)
+            child.set_state(child_state)
+            assert board.cells == child.cells
+            if not child_state.is_terminal():  # No player to move otherwise
+                assert board.hash == child.hash
+            board.undo(move)
+            assert board.cells == cells
+            assert board.pawns == pawns
+            assert board.player == player
+            assert board.hash == key
+
+
+def test_bot_only_plays_breakthrough():
+    with pytest.raises(ValueError):
+        AlphaBetaBot(pyspiel.load_game("tic_tac_toe"), 0)
+
+
+def test_bot_plays_a_winning_move():
+    game = pyspiel.load_game("breakthrough(rows=6,columns=6)")
+    for state in random_states(game, n_games=10, seed=1):
+        player = state.current_player()
+        winning = [
+            action
+            for action in state.legal_actions()
+            if state.child(action).is_terminal()
+        ]
+        if winning:
+            break
+    else:
+        pytest.fail("no position with a winning move")
+
+    bot = AlphaBetaBot(game, player, time_limit=0.2)
+    action = bot.step(state)
+    assert state.child(action).returns()[player] == 1.0
+    assert bot.last_search["nodes"] >= 0
+
+
+def test_bot_plays_legal_moves():
+    game = pyspiel.load_game("breakthrough(rows=5,columns=5)")
+    bots = [AlphaBetaBot(game, player, time_limit=0.02) for player in range(2)]
+    state = game.new_initial_state()
+    while not state.is_terminal():
+        action = bots[state.current_player()].step(state)
+        assert action in state.legal_actions()
+        state.apply_action(action)
@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+import pyspiel
+from open_spiel.python.algorithms import mcts
+
+from pygame_spiel.bots.array_mcts import ArrayMCTSBot, NodePool
+
+
+def _bot(game, **kwargs) -> ArrayMCTSBot:
+    evaluator = mcts.RandomRolloutEvaluator(1, np.random.RandomState(0))
+    return ArrayMCTSBot(game, 0, evaluator, **kwargs)
+
+
+def _subtree(pool: NodePool, node: int) -> tuple:
+    """Statistics of the nodes of a subtree, children in order."""
+    children = ()
+    if pool.first_child[node] >= 0:
+        children = tuple(
+            _subtree(pool, child)
+            for child in range(pool.children(node).start, pool.children(node).stop)
+        )
+    stats = tuple(
+        getattr(pool, name)[node].item()
+        for name, _ in NodePool.FIELDS
+        if name != "first_child"
+    )
+    return stats, children
+
+
+def _add_children(pool: NodePool, node: int, actions: list, rng) -> int:
+    start = pool.allocate(len(actions))
+    end = start + len(actions)
+    pool.action[start:end] = actions
+    pool.player[start:end] = 1 - pool.player[node]
+    pool.visits[start:end] = rng.randint(1, 100, size=len(actions))
+    pool.value_sum[start:end] = rng.uniform(-10, 10, size=len(actions))
+    pool.solved[start:end] = rng.randint(-1, 2, size=len(actions))
+    pool.first_child[node] = start
+    pool.num_children[node] = len(actions)
+    return start
+
+
+def test_compact_keeps_the_subtree():
+    rng = np.random.RandomState(0)
+    pool = NodePool(64)
+    root = pool.reset(1)
+    first = _add_children(pool, root, [0, 1, 2], rng)
+    # Interleave the allocations of the subtrees of children 0 and 1
+    a = _add_children(pool, first + 1, [3, 4], rng)
+    _add_children(pool, first, [5, 6, 7], rng)
+    _add_children(pool, a + 1, [8], rng)
+    b = _add_children(pool, a, [9, 10], rng)
+    _add_children(pool, b + 1, [11, 12, 13], rng)
+
+    expected = _subtree(pool, first + 1)
+    new_root = pool.compact(first + 1)
+    assert new_root == 0
+    assert _subtree(pool, new_root) == expected
+    assert pool.size == 1 + 2 + 1 + 2 + 3  # Subtree of child 1 only
+
+    # Each level is stored contiguously after the previous one
+    assert pool.first_child[0] == 1
+    assert pool.children(1) == slice(3, 5)
+    assert pool.children(2) == slice(5, 6)
+    assert pool.children(4) == slice(6, 9)
+
+    # New nodes go after the subtree, and compacting again works
+    assert pool.allocate(2) == pool.size - 2
+    expected = _subtree(pool, 1)
+    assert _subtree(pool, pool.compact(1)) == expected
+
+
+def test_allocate_fails_when_full():
+    pool = NodePool(4)
+    pool.reset(0)
+    assert pool.allocate(3) == 1
+    assert pool.allocate(1) == -1
+
+
+def test_solver_finds_a_win_in_one():
+    game = pyspiel.load_game("tic_tac_toe")
+    state = game.new_initial_state()
+    for action in (0, 3, 1, 4):  # x: 0, 1 - o: 3, 4 - x to move, 2 wins
+        state.apply_action(action)
+    bot = _bot(game, max_simulations=1000)
+    root = bot.search(state)
+    pool = bot._pool
+    winning = pool.find_child(root, 2)
+    assert pool.solved[winning] == 1
+    assert pool.solved[root] == -1  # Lost for the player who moved into it
+    assert pool.visits[root] < 1000  # The search stops once solved
+    assert bot.step(state) == 2
+
+
+def test_tree_is_reused_between_moves():
+    game = pyspiel.load_game("tic_tac_toe")
+    bot = _bot(game, max_simulations=200)
+    state = game.new_initial_state()
+    root = bot.search(state)
+    pool = bot._pool
+    grandchild = pool.find_child(pool.find_child(root, 4), 0)
+    visits = int(pool.visits[grandchild])
+    assert visits > 0
+    state.apply_action(4)
+    state.apply_action(0)
+    root = bot.search(state)
+    # The grandchild became the root, and kept its visits
+    assert pool.visits[root] == visits + 200
+
+
+def test_full_pool_falls_back_to_a_legal_action():
+    game = pyspiel.load_game("tic_tac_toe")
+    state = game.new_initial_state()
+    # The root is only expanded on its second visit
+    bot = _bot(game, max_simulations=1)
+    assert bot.step(state) in state.legal_actions()
+
+    # Room for the root and its children only
+    bot = _bot(game, max_simulations=100, max_nodes=game.num_distinct_actions() + 1)
+    while not state.is_terminal():
+        action = bot.step(state)
+        assert action in state.legal_actions()
+        state.apply_action(action)
+
+
+def test_max_nodes_too_small():
+    game = pyspiel.load_game("tic_tac_toe")
+    with pytest.raises(ValueError):
+        _bot(game, max_nodes=game.num_distinct_actions())
@@ -0,0 +1,95 @@
+import numpy as np
+import pygame
+import pytest
+
+import pyspiel
+
+from pygame_spiel.bots import dqn_numpy
+from pygame_spiel.games.factory import GameFactory
+from pygame_spiel.games.settings import BREAKTHROUGH_MAX_BOARD_SIZE, GAMES_PARAMS
+from pygame_spiel.menu import Menu
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture(params=list(GAMES_PARAMS["breakthrough"]))
+def game(request):
+    params = GAMES_PARAMS["breakthrough"][request.param]
+    return GameFactory.get_game("breakthrough", current_player=0, params=params)
+
+
+def test_board_shape_follows_the_parameters(game):
+    params = game._game.get_parameters()
+    assert game._board_shape() == (params["rows"], params["columns"])
+    width, height = game._screen_size()
+    if game._is_default_board():
+        assert game._background is not None
+    else:
+        assert game._background is None
+        assert game._layout.size[0] <= BREAKTHROUGH_MAX_BOARD_SIZE
+        assert (width, height) == pygame.display.get_surface().get_size()
+
+
+def test_tokens_are_read_from_the_state_string(game):
+    n_rows, n_cols = game._board_shape()
+    state_string = game._state.to_string()
+    tokens = [
+        state_string[game._get_token_by_position(row, col)]
+        for row in range(n_rows)
+        for col in range(n_cols)
+    ]
+    assert tokens[:n_cols] == ["b"] * n_cols
+    assert tokens[-n_cols:] == ["w"] * n_cols
+    assert set(tokens[2 * n_cols : -2 * n_cols]) <= {"."}
+
+
+def test_actions_round_trip(game):
+    state = game._state
+    for action in state.legal_actions():
+        assert game._action_to_string(action) == state.action_to_string(0, action)
+        row, col, _, _ = game._unrank_action_mixed_base(action)
+        dest_row, dest_col = game._action_cell(action)
+        assert (
+            game._from_action_string_to_int(row, col, dest_row, dest_col, ".") == action
+        )
+
+
+def test_clicks_move_a_pawn(game):
+    game._handle_click(1, 0)
+    assert (game._selected_row, game._selected_col) == (1, 0)
+    game._handle_click(2, 0)
+    assert game._selected_row is None
+    assert game._state.history() == [game._from_action_string_to_int(1, 0, 2, 0, ".")]
+
+
+def test_weight_bots_only_on_the_default_board():
+    menu = Menu.__new__(Menu)  # Only the bot filtering is used, no widgets
+    default_bots = menu._get_game_available_bots("breakthrough")
+    small_bots = menu._get_game_available_bots(
+        "breakthrough", GAMES_PARAMS["breakthrough"]["6x6"]
+    )
+    assert "dqn" in default_bots
+    assert "dqn" not in small_bots
+    assert "mcts" in small_bots
+
+
+def test_dqn_weights_must_fit_the_board(tmp_path):
+    game = pyspiel.load_game("breakthrough")
+    q_network = dqn_numpy.QNetwork.random(
+        game.observation_tensor_size(), [8], game.num_distinct_actions()
+    )
+    arrays = dict()
+    for i, (w, b) in enumerate(zip(q_network.weights, q_network.biases)):
+        arrays[f"w{i}"], arrays[f"b{i}"] = w, b
+    np.savez(dqn_numpy.weights_path(tmp_path, 0), **arrays)
+    assert dqn_numpy.load_q_network(str(tmp_path), 0, game) is not None
+    with pytest.raises(ValueError, match="don't fit"):
+        dqn_numpy.load_q_network(
+            str(tmp_path), 0, pyspiel.load_game("breakthrough(rows=6,columns=6)")
+        )
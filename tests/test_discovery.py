@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from pygame_spiel.discovery import BotDiscovery
+
+BOT_MODULE = """
+import pyspiel
+
+with open({log!r}, "a") as log:
+    log.write("executed\\n")
+
+
+class {name}(pyspiel.Bot):
+    pass
+"""
+
+
+@pytest.fixture
+def discovery():
+    return BotDiscovery()
+
+
+def _touch_directory(path, offset: int):
+    """Moves the mtime of a directory, as if an entry was added or removed."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset))
+
+
+def test_list_directory_is_cached_until_it_changes(tmp_path, discovery, monkeypatch):
+    (tmp_path / "b.py").write_text("")
+    (tmp_path / "a").mkdir()
+    (tmp_path / "notes.txt").write_text("")
+    assert discovery.list_directory(str(tmp_path)) == ["a", "b.py"]
+
+    scans = []
+    scan = discovery._scan_directory
+    monkeypatch.setattr(
+        discovery, "_scan_directory", lambda path: scans.append(path) or scan(path)
+    )
+    assert discovery.list_directory(str(tmp_path)) == ["a", "b.py"]
+    assert scans == []
+
+    (tmp_path / "c.py").write_text("")
+    _touch_directory(tmp_path, 10**9)
+    assert discovery.list_directory(str(tmp_path)) == ["a", "b.py", "c.py"]
+    assert scans == [str(tmp_path)]
+
+
+def test_list_missing_directory(tmp_path, discovery):
+    assert discovery.list_directory(str(tmp_path / "missing")) == []
+
+
+def test_find_bots_executes_unchanged_modules_once(tmp_path, discovery):
+    log = tmp_path / "executions.log"
+    path = tmp_path / "my_bots.py"
+    path.write_text(BOT_MODULE.format(log=str(log), name="MyBot"))
+    assert list(discovery.find_bots(str(path))) == ["MyBot"]
+    assert list(discovery.find_bots(str(path))) == ["MyBot"]
+    assert len(log.read_text().splitlines()) == 1
+
+    # A modified module is executed again
+    path.write_text(BOT_MODULE.format(log=str(log), name="MyOtherBot"))
+    assert list(discovery.find_bots(str(path))) == ["MyOtherBot"]
+    assert len(log.read_text().splitlines()) == 2
+
+
+def test_find_bots_skips_modules_without_classes(tmp_path, discovery):
+    path = tmp_path / "script.py"
+    path.write_text("raise RuntimeError('executed')\n")
+    assert discovery.find_bots(str(path)) == dict()
+
+
+def test_find_bots_reports_syntax_errors(tmp_path, discovery):
+    path = tmp_path / "broken.py"
+    path.write_text("class Broken(:\n")
+    with pytest.raises(SyntaxError):
+        discovery.find_bots(str(path))
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import pyspiel
+
+from pygame_spiel.bots import builtin, dqn_numpy
+
+CHECKPOINT_DIR = Path(__file__).parent / "data" / "dqn_checkpoint"
+
+
+class _Game:
+    """Stand-in for a game matching the shapes of the test checkpoint."""
+
+    def observation_tensor_size(self):
+        return 4
+
+    def num_distinct_actions(self):
+        return 2
+
+
+def _play(bot, game):
+    state = game.new_initial_state()
+    while not state.is_terminal():
+        action = bot.step(state)
+        assert action in state.legal_actions()
+        state.apply_action(action)
+
+
+def test_numpy_backend_builds_only_the_q_network():
+    game = pyspiel.load_game("tic_tac_toe")
+    bot = builtin.dqn_bot(game, 0)
+    assert isinstance(bot, dqn_numpy.DQNBot)
+    assert set(vars(bot)) == {"_player_id", "_q_network"}
+    _play(bot, game)
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        builtin.dqn_bot(pyspiel.load_game("tic_tac_toe"), 0, backend="jax")
+
+
+def test_tensorflow_bot_reads_the_checkpoint():
+    pytest.importorskip("tensorflow")
+    from pygame_spiel.bots import dqn
+
+    expected = np.load(CHECKPOINT_DIR / "expected_pid0.npz")
+    bot = dqn.DQNBot(_Game(), 0, checkpoint_dir=str(CHECKPOINT_DIR))
+    q_values = bot._sess.run(
+        bot._q_values, feed_dict={bot._info_state_ph: expected["inputs"]}
+    )
+    np.testing.assert_allclose(q_values, expected["q_values"], rtol=1e-5, atol=1e-5)
+
+
+def test_tensorflow_bot_without_checkpoint():
+    pytest.importorskip("tensorflow")
+
+    game = pyspiel.load_game("tic_tac_toe")
+    bot = builtin.dqn_bot(game, 1, backend="tensorflow")
+    _play(bot, game)
+    with pytest.raises(FileNotFoundError):
+        builtin.dqn_bot(game, 1, checkpoint_dir="missing", backend="tensorflow")
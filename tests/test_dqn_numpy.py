@@ -0,0 +1,99 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pygame_spiel.bots import dqn_numpy, tf_checkpoint
+
+# Q-network of 12 layers (sizes 4, 3, ..., 3, 2) saved by TensorFlow 2.13's
+# tf.train.Saver with open_spiel's variable names, and its Q-values on a few
+# random inputs.
+CHECKPOINT_DIR = Path(__file__).parent / "data" / "dqn_checkpoint"
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path):
+    dest = tmp_path / "dqn_checkpoint"
+    shutil.copytree(CHECKPOINT_DIR, dest)
+    return dest
+
+
+def test_read_variables():
+    variables = tf_checkpoint.read_variables(str(CHECKPOINT_DIR / "q_network_pid0"))
+    assert variables["global_step"].dtype == np.int64
+    assert variables["global_step"].shape == ()
+    assert variables["mlp/linear/weights"].shape == (4, 3)
+    assert variables["mlp/linear_11/bias"].shape == (2,)
+
+
+def test_read_checkpoint_orders_layers():
+    weights, biases = dqn_numpy.read_checkpoint(CHECKPOINT_DIR, 0)
+    assert len(weights) == len(biases) == 12
+    assert weights[0].shape == (4, 3)
+    assert weights[-1].shape == (3, 2)
+    assert all(w.dtype == np.float32 for w in weights)
+
+
+def test_export_round_trip(checkpoint_dir):
+    expected = np.load(CHECKPOINT_DIR / "expected_pid0.npz")
+    q_network = dqn_numpy.load_q_network(checkpoint_dir, 0)
+    assert dqn_numpy.weights_path(checkpoint_dir, 0).exists()
+    np.testing.assert_allclose(
+        q_network(expected["inputs"]), expected["q_values"], rtol=1e-5, atol=1e-5
+    )
+
+    # The second load reads the exported .npz
+    q_network = dqn_numpy.load_q_network(checkpoint_dir, 0)
+    np.testing.assert_allclose(
+        q_network(expected["inputs"]), expected["q_values"], rtol=1e-5, atol=1e-5
+    )
+
+
+def _patch_variables(monkeypatch, variables):
+    monkeypatch.setattr(tf_checkpoint, "read_variables", lambda prefix: variables)
+
+
+def test_read_checkpoint_rejects_mismatched_layers(monkeypatch):
+    _patch_variables(
+        monkeypatch,
+        {
+            "mlp/linear/weights": np.zeros((4, 3), np.float32),
+            "mlp/linear/bias": np.zeros(3, np.float32),
+            "mlp/linear_1/weights": np.zeros((5, 2), np.float32),
+            "mlp/linear_1/bias": np.zeros(2, np.float32),
+        },
+    )
+    with pytest.raises(ValueError, match="takes 5 inputs"):
+        dqn_numpy.read_checkpoint("unused", 0)
+
+
+def test_read_checkpoint_rejects_mismatched_bias(monkeypatch):
+    _patch_variables(
+        monkeypatch,
+        {
+            "mlp/linear/weights": np.zeros((4, 3), np.float32),
+            "mlp/linear/bias": np.zeros(2, np.float32),
+        },
+    )
+    with pytest.raises(ValueError, match="bias"):
+        dqn_numpy.read_checkpoint("unused", 0)
+
+
+def test_read_checkpoint_rejects_missing_bias(monkeypatch):
+    _patch_variables(
+        monkeypatch,
+        {
+            "mlp/linear/weights": np.zeros((4, 3), np.float32),
+            "mlp/linear/bias": np.zeros(3, np.float32),
+            "mlp/linear_1/weights": np.zeros((3, 2), np.float32),
+        },
+    )
+    with pytest.raises(ValueError, match="weight and a bias"):
+        dqn_numpy.read_checkpoint("unused", 0)
+
+
+def test_read_variables_rejects_other_files(tmp_path):
+    (tmp_path / "q_network_pid0.index").write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        tf_checkpoint.read_variables(str(tmp_path / "q_network_pid0"))
@@ -0,0 +1,60 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from pygame_spiel.bots import dqn_pytorch  # noqa: E402
+
+CHECKPOINT_DIR = Path(__file__).parent / "data" / "dqn_checkpoint"
+
+
+class _Game:
+    """Stand-in for a game matching the shapes of the test checkpoint."""
+
+    def observation_tensor_size(self):
+        return 4
+
+    def num_distinct_actions(self):
+        return 2
+
+
+def _mlp() -> torch.nn.Module:
+    # Same layout as open_spiel's PyTorch MLP
+    torch.manual_seed(0)
+    return torch.nn.Sequential(
+        torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.ReLU()),
+        torch.nn.Linear(8, 3),
+    )
+
+
+@pytest.mark.parametrize("fmt", ["module", "state_dict", "checkpoint"])
+def test_load_q_network_formats(tmp_path, fmt):
+    mlp = _mlp()
+    if fmt == "module":
+        data = mlp
+    elif fmt == "state_dict":
+        data = mlp.state_dict()
+    else:
+        data = {"iteration": 10, "last_loss_value": 0.5, "model": mlp.state_dict()}
+    path = tmp_path / "q_network_pid0.pt"
+    torch.save(data, path)
+
+    inputs = torch.randn(5, 4)
+    with torch.no_grad():
+        torch.testing.assert_close(
+            dqn_pytorch.load_q_network(path)(inputs), mlp(inputs)
+        )
+
+
+def test_bot_reads_tensorflow_checkpoint(tmp_path):
+    checkpoint_dir = tmp_path / "dqn_checkpoint"
+    shutil.copytree(CHECKPOINT_DIR, checkpoint_dir)
+    expected = np.load(CHECKPOINT_DIR / "expected_pid0.npz")
+
+    bot = dqn_pytorch.DQNBot(_Game(), 0, checkpoint_dir=str(checkpoint_dir))
+    with torch.no_grad():
+        q_values = bot.load()(torch.from_numpy(expected["inputs"])).numpy()
+    np.testing.assert_allclose(q_values, expected["q_values"], rtol=1e-5, atol=1e-5)
@@ -0,0 +1,89 @@
+import argparse
+import json
+import random
+
+import pygame
+import pytest
+
+import pyspiel
+
+from pygame_spiel import export
+
+
+@pytest.fixture(autouse=True)
+def display(monkeypatch):
+    pygame.init()
+    monkeypatch.setattr(export, "_games", dict())  # No UI from a closed display
+    yield
+    pygame.quit()
+
+
+def random_actions(game_string, seed=0):
+    rng = random.Random(seed)
+    state = pyspiel.load_game(game_string).new_initial_state()
+    actions = []
+    while not state.is_terminal():
+        actions.append(rng.choice(state.legal_actions()))
+        state.apply_action(actions[-1])
+    return actions
+
+
+def frames(export_dir):
+    return [
+        (ply, pygame.surfarray.array3d(frame))
+        for ply, frame in export.read_frames(export_dir)
+    ]
+
+
+@pytest.mark.parametrize(
+    "game_string", ["tic_tac_toe", "breakthrough(rows=6,columns=6)"]
+)
+def test_delta_frames_match_the_png_frames(tmp_path, game_string):
+    actions = random_actions(game_string)
+    n_png = export.export_game(game_string, actions, tmp_path / "png", "png")
+    n_delta = export.export_game(
+        game_string, actions, tmp_path / "delta", "delta", keyframe_interval=4
+    )
+    assert n_png == n_delta == len(actions) + 1  # Every move changes the board
+
+    png_frames = frames(tmp_path / "png")
+    delta_frames = frames(tmp_path / "delta")
+    assert [ply for ply, _ in png_frames] == list(range(len(actions) + 1))
+    for (ply, png), (delta_ply, delta) in zip(png_frames, delta_frames):
+        assert ply == delta_ply
+        assert (png == delta).all()
+
+
+def test_delta_manifest(tmp_path):
+    actions = random_actions("tic_tac_toe", seed=1)
+    export.export_game("tic_tac_toe", actions, tmp_path, "delta", keyframe_interval=3)
+    with open(tmp_path / export.MANIFEST_FILE) as f:
+        manifest = json.load(f)
+    assert manifest["game"] == "tic_tac_toe"
+    assert manifest["format"] == "delta"
+    assert manifest["actions"] == actions
+    width, height = manifest["size"]
+    for index, entry in enumerate(manifest["frames"]):
+        assert entry.get("keyframe", False) == (index % 3 == 0)
+        if not entry.get("keyframe"):
+            # Only the changed rectangle is stored
+            image = pygame.image.load(str(tmp_path / entry["file"]))
+            assert image.get_width() < width or image.get_height() < height
+
+
+def test_game_ui_is_reused(tmp_path):
+    export.export_game("tic_tac_toe", [4], tmp_path / "a")
+    game = export._games["tic_tac_toe"]
+    export.export_game("tic_tac_toe", [0, 1], tmp_path / "b")
+    assert export._games["tic_tac_toe"] is game
+    assert game.get_history() == [0, 1]  # Reset between the exports
+
+
+def test_read_games(tmp_path):
+    args = argparse.Namespace(actions="4, 0,8", actions_file=None)
+    assert export._read_games(args) == [[4, 0, 8]]
+
+    path = tmp_path / "games.jsonl"
+    path.write_text('[4, 0]\n\n{"actions": [1, 2, 3]}\n')
+    args = argparse.Namespace(actions=None, actions_file=str(path))
+    assert export._read_games(args) == [[4, 0], [1, 2, 3]]
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+import pyspiel
+from open_spiel.python.algorithms import mcts
+
+from pygame_spiel.bots import builtin, fast_rollout
+
+
+@pytest.fixture(params=["tic_tac_toe", "breakthrough(rows=6,columns=6)"])
+def game(request):
+    return pyspiel.load_game(request.param)
+
+
+def test_board_matches_the_state():
+    game = pyspiel.load_game("tic_tac_toe")
+    state = game.new_initial_state()
+    state.apply_action(4)  # x (player 0)
+    state.apply_action(0)  # o (player 1)
+    board = fast_rollout.FastRolloutEvaluator(game).board(state)
+    assert board.tolist() == [2, 0, 0, 0, 1, 0, 0, 0, 0]
+
+
+def test_rollouts_end_with_a_winner(game):
+    state = game.new_initial_state()
+    evaluator = fast_rollout.FastRolloutEvaluator(game, n_rollouts=50, seed=3)
+    returns = evaluator.evaluate(state)
+    assert returns.shape == (2,)
+    assert returns[0] == pytest.approx(-returns[1])
+    assert -1.0 <= returns[0] <= 1.0
+
+
+def test_evaluators_have_their_own_generator(game):
+    state = game.new_initial_state()
+    alone = fast_rollout.FastRolloutEvaluator(game, n_rollouts=20, seed=1)
+    expected = [alone.evaluate(state) for _ in range(5)]
+
+    # Another evaluator playing (and being created) in between doesn't change
+    # the rollouts of the first one
+    evaluator = fast_rollout.FastRolloutEvaluator(game, n_rollouts=20, seed=1)
+    results = []
+    for i in range(5):
+        results.append(evaluator.evaluate(state))
+        other = fast_rollout.FastRolloutEvaluator(game, n_rollouts=20, seed=i)
+        other.evaluate(state)
+    np.testing.assert_array_equal(results, expected)
+
+
+def test_rollout_values_are_plausible():
+    # Random tic-tac-toe: the first player wins ~58% of the games, loses ~29%
+    game = pyspiel.load_game("tic_tac_toe")
+    evaluator = fast_rollout.FastRolloutEvaluator(game, n_rollouts=20000, seed=5)
+    value = evaluator.evaluate(game.new_initial_state())[0]
+    assert value == pytest.approx(0.29, abs=0.03)
+
+
+def test_unsupported_game():
+    with pytest.raises(ValueError):
+        fast_rollout.FastRolloutEvaluator(pyspiel.load_game("connect_four"))
+
+
+def test_rollout_evaluator_choice():
+    game = pyspiel.load_game("tic_tac_toe")
+    rng = np.random.RandomState(0)
+    assert isinstance(
+        builtin.rollout_evaluator(game, "pyspiel", rng), mcts.RandomRolloutEvaluator
+    )
+    assert isinstance(
+        builtin.rollout_evaluator(game, "fast", rng),
+        fast_rollout.FastRolloutEvaluator,
+    )
+    with pytest.raises(ValueError):
+        builtin.rollout_evaluator(game, "slow", rng)
+
+
+def test_mcts_bots_default_to_pyspiel_rollouts():
+    game = pyspiel.load_game("tic_tac_toe")
+    assert isinstance(builtin.mcts_bot(game, 0).evaluator, mcts.RandomRolloutEvaluator)
+    assert isinstance(
+        builtin.mcts_fast_bot(game, 0).evaluator, fast_rollout.FastRolloutEvaluator
+    )
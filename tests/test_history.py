@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+import pyspiel
+
+from pygame_spiel.games.history import MoveHistory
+
+
+def _play(game, history, state, n_moves, rng):
+    """Plays random moves, returning the string of each state reached."""
+    strings = []
+    for _ in range(n_moves):
+        if state.is_terminal():
+            break
+        action = int(rng.choice(state.legal_actions()))
+        state.apply_action(action)
+        history.record(action, state)
+        strings.append(str(state))
+    return strings
+
+
+@pytest.fixture
+def game():
+    return pyspiel.load_game("breakthrough(rows=6,columns=6)")
+
+
+def test_states_are_rebuilt_from_thinned_snapshots(game):
+    rng = np.random.RandomState(0)
+    state = game.new_initial_state()
+    history = MoveHistory(state, snapshot_interval=2, max_snapshots=4)
+    strings = [str(state)] + _play(game, history, state, 40, rng)
+
+    assert history.ply == len(strings) - 1
+    assert len(history._snapshots) <= 4
+    assert history._snapshot_interval > 2
+    # Snapshots stay on the grid of the current interval
+    assert all(p % history._snapshot_interval == 0 for p in history._snapshots)
+    for ply, string in enumerate(strings):
+        assert str(history.state_at(ply)) == string
+
+
+def test_undo_and_redo(game):
+    rng = np.random.RandomState(1)
+    state = game.new_initial_state()
+    history = MoveHistory(state, snapshot_interval=4)
+    strings = [str(state)] + _play(game, history, state, 10, rng)
+    actions = history.actions
+
+    for ply in range(len(strings) - 2, -1, -1):
+        state = history.undo()
+        assert str(state) == strings[ply]
+    assert not history.can_undo()
+    with pytest.raises(IndexError):
+        history.undo()
+
+    for ply in range(1, len(strings)):
+        state = history.redo(state)
+        assert str(state) == strings[ply]
+    assert not history.can_redo()
+    with pytest.raises(IndexError):
+        history.redo(state)
+    assert history.actions == actions
+
+
+def test_recording_after_undo_discards_the_redo_moves(game):
+    rng = np.random.RandomState(2)
+    state = game.new_initial_state()
+    history = MoveHistory(state, snapshot_interval=2)
+    _play(game, history, state, 8, rng)
+    for _ in range(5):
+        state = history.undo()
+    assert history.can_redo()
+
+    strings = _play(game, history, state, 6, rng)
+    assert not history.can_redo()
+    assert history.ply == 3 + len(strings)
+    assert all(p <= history.ply for p in history._snapshots)
+    for i, string in enumerate(strings):
+        assert str(history.state_at(4 + i)) == string
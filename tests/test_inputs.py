@@ -0,0 +1,84 @@
+import time
+
+import pygame
+import pytest
+
+from pygame_spiel.games.factory import GameFactory
+from pygame_spiel.games.inputs import InputBuffer, InputEvent, LatencyMeter
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    yield
+    pygame.quit()
+
+
+def test_input_buffer_keeps_events_in_order():
+    buffer = InputBuffer(maxlen=3)
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(5, 6)))
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(1, 2), button=1))
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(3, 4), button=1))
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_z, mod=0))
+    buffer.poll()
+
+    events = buffer.drain()
+    assert [event.type for event in events] == ["click", "release", "key"]
+    assert events[0].pos == (1, 2) and events[0].button == 1
+    assert events[2].key == pygame.K_z
+    assert buffer.hover == (3, 4)  # Mouse motions only move the hover position
+    assert buffer.drain() == []
+
+
+def test_input_buffer_drops_the_oldest_events():
+    buffer = InputBuffer(maxlen=2)
+    pygame.event.clear()
+    for x in range(4):
+        pygame.event.post(
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, 0), button=1)
+        )
+    buffer.poll()
+    assert [event.pos for event in buffer.drain()] == [(2, 0), (3, 0)]
+
+
+def test_input_buffer_quit():
+    buffer = InputBuffer()
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    buffer.wait(timeout=100)
+    assert buffer.quit_requested
+
+
+def test_latency_meter_counts_the_oldest_pending_input():
+    meter = LatencyMeter()
+    assert meter.summary() == dict()
+    meter.frame_displayed()  # No input: nothing measured
+    meter.input_received(time.perf_counter() - 0.05)
+    meter.input_received(time.perf_counter())
+    meter.frame_displayed()
+    stats = meter.summary()
+    assert stats["count"] == 1
+    assert stats["max"] >= 50
+
+
+def test_process_input_returns_the_handled_events():
+    game = GameFactory.get_game("tic_tac_toe", current_player=0)
+    game.set_bots(
+        bot1_type="human", bot1_params=None, bot2_type="random", bot2_params=None
+    )
+    _, handled = game.process_input(
+        [InputEvent("release", 1.0, pos=(0, 0), button=1)], (0, 0)
+    )
+    assert handled == []
+
+    events = [
+        InputEvent("click", 2.0, pos=(100, 100), button=1),
+        InputEvent("release", 3.0, pos=(100, 100), button=1),
+        InputEvent("key", 4.0, key=pygame.K_a),
+        InputEvent("key", 5.0, key=pygame.K_z, mod=pygame.KMOD_LCTRL),
+    ]
+    updated, handled = game.process_input(events, (0, 0))
+    assert updated
+    assert handled == [2.0, 5.0]
@@ -0,0 +1,97 @@
+import json
+import math
+
+import pytest
+
+from pygame_spiel import ladder
+
+
+def test_elo_to_score():
+    assert ladder.elo_to_score(0) == 0.5
+    assert ladder.elo_to_score(400) == pytest.approx(10 / 11)
+    assert ladder.elo_to_score(-120) == pytest.approx(1 - ladder.elo_to_score(120))
+
+
+def _pairing(results: str) -> ladder.Pairing:
+    pairing = ladder.Pairing("a", "b")
+    for result in results:
+        pairing.add({"w": 1.0, "d": 0.5, "l": 0.0}[result])
+    return pairing
+
+
+def test_llr_sign_follows_the_results():
+    assert _pairing("w").llr(30) == 0.0  # Not enough games
+    assert _pairing("wwwdl" * 4).llr(30) > 0
+    assert _pairing("lllwd" * 4).llr(30) < 0
+    assert _pairing("wl" * 10).llr(30) == pytest.approx(0.0)
+
+
+@pytest.mark.parametrize(
+    "results, status", [("w", "H1"), ("l", "H0"), ("wl", "max_games")]
+)
+def test_sprt_stops(results, status):
+    pairing = ladder.Pairing("a", "b")
+    while pairing.status is None:
+        for result in results:
+            pairing.add({"w": 1.0, "l": 0.0}[result])
+        pairing.update_status(30.0, 0.05, 0.05, max_games=400)
+    assert pairing.status == status
+    if status == "max_games":
+        assert pairing.n_games >= 400
+    else:
+        assert pairing.n_games < 400
+
+
+def test_bradley_terry():
+    pairings = [
+        ladder.Pairing("a", "b", wins=300, losses=100),
+        ladder.Pairing("b", "c", wins=300, losses=100),
+        ladder.Pairing("a", "c", wins=90, losses=10),
+    ]
+    ratings = ladder.bradley_terry(pairings, iterations=500)
+    assert ratings["a"] > ratings["b"] > ratings["c"]
+    assert sum(ratings.values()) / 3 == pytest.approx(ladder.INITIAL_ELO)
+    # 3:1 odds are about 191 Elo points
+    assert ratings["a"] - ratings["b"] == pytest.approx(400 * math.log10(3), abs=20)
+
+
+def test_bradley_terry_without_losses_is_finite():
+    ratings = ladder.bradley_terry([ladder.Pairing("a", "b", wins=10)])
+    assert all(math.isfinite(r) for r in ratings.values())
+    assert ratings["a"] > ratings["b"]
+
+
+def test_results_are_saved_and_resumed(tmp_path):
+    path = tmp_path / "ladder.json"
+    results = ladder.Ladder("tic_tac_toe", ["random", "mcts"], path)
+    results._pairings[("random", "mcts")].add(0.0)
+    results._pairings[("random", "mcts")].status = "H0"
+    results.save()
+    data = json.loads(path.read_text())
+    assert data["game"] == "tic_tac_toe"
+    assert set(data["bradley_terry"]) == {"random", "mcts"}
+
+    resumed = ladder.Ladder("tic_tac_toe", ["random", "mcts", "mcts_array"], path)
+    assert resumed._pairings[("random", "mcts")].losses == 1
+    assert resumed._pairings[("random", "mcts")].status == "H0"
+    assert resumed._pairings[("random", "mcts_array")].status is None
+
+    with pytest.raises(ValueError):
+        ladder.Ladder("breakthrough", ["random"], path)
+    with pytest.raises(ValueError):
+        ladder.Ladder("tic_tac_toe", ["no_such_bot"], tmp_path / "other.json")
+
+
+def test_run(tmp_path):
+    path = tmp_path / "ladder.json"
+    results = ladder.Ladder("tic_tac_toe", ["random", "mcts"], path, max_games=4)
+    results.run(workers=2)
+    pairing = results._pairings[("random", "mcts")]
+    assert pairing.status is not None
+    assert 1 <= pairing.n_games <= 4
+    assert json.loads(path.read_text())["pairings"][0]["status"] == pairing.status
+
+
+def test_play_game_scores():
+    score = ladder.play_game("tic_tac_toe", ("random", "random"), 0, 2)
+    assert score in (0.0, 0.5, 1.0)
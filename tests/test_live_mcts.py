@@ -0,0 +1,136 @@
+import time
+
+import numpy as np
+import pygame
+import pytest
+
+import pyspiel
+from open_spiel.python.algorithms import mcts
+
+from pygame_spiel.bots.live_mcts import LiveMCTSBot, SearchCancelled
+from pygame_spiel.games.factory import GameFactory
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class HookedEvaluator(mcts.RandomRolloutEvaluator):
+    """Rollout evaluator calling a function before every evaluation."""
+
+    def __init__(self, hook, delay=0.0):
+        super().__init__(n_rollouts=1, random_state=np.random.RandomState(0))
+        self.hook = hook
+        self.delay = delay
+        self.calls = 0
+
+    def evaluate(self, state):
+        self.calls += 1
+        self.hook(self.calls)
+        time.sleep(self.delay)
+        return super().evaluate(state)
+
+
+def make_bot(game, evaluator, max_simulations=200, **kwargs):
+    return LiveMCTSBot(
+        game,
+        2.0,
+        max_simulations,
+        evaluator,
+        random_state=np.random.RandomState(0),
+        **kwargs,
+    )
+
+
+def test_snapshots_follow_the_search():
+    game = pyspiel.load_game("tic_tac_toe")
+    snapshots = []
+    evaluator = HookedEvaluator(lambda _: snapshots.append(bot.snapshot))
+    bot = make_bot(game, evaluator, snapshot_interval=0.0, check_every=4)
+    state = game.new_initial_state()
+    action = bot.step(state)
+
+    assert action in state.legal_actions()
+    assert bot.snapshot is None  # Only available during the search
+    snapshots = [s for s in snapshots if s is not None]
+    assert snapshots
+    simulations = [s.simulations for s in snapshots]
+    assert simulations == sorted(simulations)
+    assert all(s % 4 == 0 for s in simulations)  # Taken every check_every
+    for snapshot in snapshots:
+        assert snapshot.player == 0
+        assert set(snapshot.actions) <= set(state.legal_actions())
+        assert snapshot.visits.sum() <= snapshot.simulations
+        assert np.all(np.abs(snapshot.values) <= 1.0)
+
+
+def test_snapshots_are_rate_limited():
+    game = pyspiel.load_game("tic_tac_toe")
+    snapshots = set()
+    evaluator = HookedEvaluator(lambda _: snapshots.add(id(bot.snapshot)))
+    bot = make_bot(game, evaluator, snapshot_interval=60.0, check_every=1)
+    bot.step(game.new_initial_state())
+    assert snapshots == {id(None)}  # The search is shorter than the interval
+
+
+def test_cancel_stops_the_search():
+    game = pyspiel.load_game("tic_tac_toe")
+
+    def cancel(calls):
+        if calls == 50:
+            bot.cancel()
+
+    evaluator = HookedEvaluator(cancel)
+    bot = make_bot(game, evaluator, max_simulations=1000, check_every=8)
+    state = game.new_initial_state()
+    with pytest.raises(SearchCancelled):
+        bot.step(state)
+    assert evaluator.calls < 50 + 8 + 1
+    assert bot.snapshot is None
+
+    # restart_at() clears the flag
+    evaluator.hook = lambda _: None
+    bot.restart_at(state)
+    assert bot.step(state) in state.legal_actions()
+
+
+def test_undo_cancels_the_thinking_bot():
+    game = GameFactory.get_game("tic_tac_toe", current_player=0)
+    evaluator = HookedEvaluator(lambda _: None, delay=0.001)
+    bot = make_bot(
+        game._game,
+        evaluator,
+        max_simulations=100000,
+        snapshot_interval=0.0,
+        check_every=1,
+    )
+    game.set_bots(
+        bot1_type="human",
+        bot1_params=None,
+        bot2_type="mcts",
+        bot2_params=None,
+        bot2=bot,
+    )
+    game._apply_action(4)
+    assert game._bot_step(1) is None
+    assert game.is_bot_thinking()
+    deadline = time.perf_counter() + 5
+    while game._search_snapshot is None and time.perf_counter() < deadline:
+        time.sleep(0.01)
+        assert game._bot_step(1) is None
+    assert game._search_snapshot is not None  # The overlay follows the search
+
+    future = game._pending_move
+    game.undo()
+    with pytest.raises(SearchCancelled):
+        future.result(timeout=5)
+    assert not game.is_bot_thinking()
+    assert game._search_snapshot is None
+
+    # The Bot restarts in the Bot thread, after the search stopped
+    game._bot_executor.submit(lambda: None).result(timeout=5)
+    assert not bot._cancelled
+    assert game._state.history() == []
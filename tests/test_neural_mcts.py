@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+import pyspiel
+
+from pygame_spiel.bots.dqn_numpy import QNetwork
+from pygame_spiel.bots.neural_mcts import BatchedMCTSBot, QNetworkEvaluator
+
+
+@pytest.fixture
+def game():
+    return pyspiel.load_game("breakthrough(rows=5,columns=5)")
+
+
+def _evaluator(game) -> QNetworkEvaluator:
+    rng = np.random.RandomState(0)
+    return QNetworkEvaluator(
+        [
+            QNetwork.random(
+                game.observation_tensor_size(),
+                [16],
+                game.num_distinct_actions(),
+                rng=rng,
+            )
+            for _ in range(2)
+        ]
+    )
+
+
+class _CountingEvaluator(QNetworkEvaluator):
+    def __init__(self, evaluator):
+        super().__init__(evaluator._q_networks)
+        self.batch_sizes = []
+
+    def evaluate_batch(self, states):
+        self.batch_sizes.append(len(states))
+        return super().evaluate_batch(states)
+
+
+def test_evaluate_batch_matches_single_evaluations(game):
+    evaluator = _evaluator(game)
+    states = [game.new_initial_state()]
+    for action in (states[0].legal_actions()[0], 0):
+        state = states[-1].clone()
+        state.apply_action(state.legal_actions()[action])
+        states.append(state)
+
+    results = evaluator.evaluate_batch(states)
+    for state, (value, priors) in zip(states, results):
+        assert -1.0 <= value <= 1.0
+        assert [a for a, _ in priors] == state.legal_actions()
+        assert sum(p for _, p in priors) == pytest.approx(1.0)
+        single_value, single_priors = evaluator.evaluate_batch([state])[0]
+        assert single_value == pytest.approx(value)
+        np.testing.assert_allclose(
+            [p for _, p in single_priors], [p for _, p in priors], rtol=1e-5
+        )
+    returns = evaluator.evaluate(states[0])
+    assert returns[0] == pytest.approx(-returns[1])
+
+
+def test_search_runs_every_simulation(game):
+    evaluator = _CountingEvaluator(_evaluator(game))
+    bot = BatchedMCTSBot(game, 0, evaluator, max_simulations=200, batch_size=16)
+    root = bot.search(game.new_initial_state())
+    # The root is evaluated first, then each simulation adds one visit (the
+    # virtual losses are all removed)
+    assert root.visits == 201
+    assert sum(child.visits for child in root.children) == 200
+    assert max(evaluator.batch_sizes) > 1
+
+
+def test_collisions_dont_end_the_round(game):
+    # With a small virtual loss, descents often reach a leaf already waiting
+    # for evaluation: skipping them (instead of ending the round) fills the
+    # batches, so fewer rounds are needed
+    rounds = []
+    for max_collisions in (0, 8):
+        evaluator = _CountingEvaluator(_evaluator(game))
+        bot = BatchedMCTSBot(
+            game,
+            0,
+            evaluator,
+            max_simulations=200,
+            batch_size=16,
+            virtual_loss=0.2,
+            max_collisions=max_collisions,
+        )
+        root = bot.search(game.new_initial_state())
+        assert root.visits == pytest.approx(201)
+        assert sum(child.visits for child in root.children) == pytest.approx(200)
+        rounds.append(len(evaluator.batch_sizes))
+    assert rounds[1] < rounds[0]
+
+
+def test_step_plays_legal_moves(game):
+    bot = BatchedMCTSBot(game, 0, _evaluator(game), max_simulations=32, batch_size=8)
+    state = game.new_initial_state()
+    while not state.is_terminal():
+        action = bot.step(state)
+        assert action in state.legal_actions()
+        state.apply_action(action)
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+import pyspiel
+from open_spiel.python.algorithms import mcts
+
+from pygame_spiel.bots import opening_book
+
+
+@pytest.fixture
+def book(tmp_path):
+    book = opening_book.OpeningBook(tmp_path / "test.book", capacity=64)
+    yield book
+    book.close()
+
+
+def test_update_and_lookup(book):
+    assert book.lookup(5) is None
+    book.update(5, visits=10, value_sum=4.0, ply=1)
+    book.update(5, visits=10, value_sum=2.0, ply=1)
+    visits, value = book.lookup(5)
+    assert visits == 20
+    assert value == pytest.approx(0.3)
+
+
+def test_least_recently_used_record_is_evicted(tmp_path):
+    book = opening_book.OpeningBook(tmp_path / "small.book", capacity=4, probe_length=2)
+    book.update(4, 1, 0.0, 1)  # Keys 4, 8 and 12 share slots 0 and 1
+    book.new_game()
+    book.update(8, 1, 0.0, 1)
+    book.new_game()
+    book.update(12, 1, 0.0, 1)
+    assert book.lookup(4) is None
+    assert book.lookup(8) is not None
+    assert book.lookup(12) is not None
+    book.close()
+
+
+def test_records_persist(tmp_path):
+    path = tmp_path / "test.book"
+    book = opening_book.OpeningBook(path, capacity=64)
+    book.update(7, 3, 1.5, 2)
+    book.close()
+    book = opening_book.OpeningBook(path, capacity=128)  # Capacity of the file
+    assert book.lookup(7) == (3, 0.5)
+    book.close()
+
+
+def test_not_a_book(tmp_path):
+    path = tmp_path / "other.book"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        opening_book.OpeningBook(path)
+
+
+def test_flush_only_when_dirty(book, monkeypatch):
+    flushes = []
+    monkeypatch.setattr(book._records, "flush", lambda: flushes.append(1))
+    book.flush()
+    assert flushes == []
+    book.update(5, 1, 0.0, 1)
+    book.flush()
+    book.flush()
+    assert flushes == [1]
+
+
+def _bot(book: opening_book.OpeningBook) -> opening_book.OpeningBookMCTSBot:
+    game = pyspiel.load_game("tic_tac_toe")
+    rng = np.random.RandomState(0)
+    return opening_book.OpeningBookMCTSBot(
+        game,
+        2.0,
+        50,
+        mcts.RandomRolloutEvaluator(1, rng),
+        book,
+        refresh_probability=1.0,  # Always search
+        random_state=rng,
+    )
+
+
+def test_bot_records_its_searches(book):
+    bot = _bot(book)
+    state = pyspiel.load_game("tic_tac_toe").new_initial_state()
+    bot.restart_at(state)
+    action = bot.step(state)
+    entry = book.lookup(opening_book.state_key(state.child(action)))
+    assert entry is not None and entry[0] > 0
+
+
+def test_clock_advances_once_per_searched_game(book):
+    bot = _bot(book)
+    state = pyspiel.load_game("tic_tac_toe").new_initial_state()
+    clock = book._clock
+
+    # Restarts without search (e.g. undo and redo) don't advance the clock
+    for _ in range(3):
+        bot.restart_at(state)
+    assert book._clock == clock
+
+    state.apply_action(bot.step(state))
+    assert book._clock == clock + 1
+    bot.restart_at(state)  # Undo/redo in the middle of the game
+    state.apply_action(bot.step(state))
+    assert book._clock == clock + 1
+
+    bot.restart_at(pyspiel.load_game("tic_tac_toe").new_initial_state())
+    bot.step(state)
+    assert book._clock == clock + 2
@@ -0,0 +1,66 @@
+import sys
+from importlib import metadata
+
+import pytest
+
+from pygame_spiel import registry
+
+
+@pytest.fixture
+def plugin_module(tmp_path, monkeypatch):
+    """Name of a module which isn't imported yet."""
+    (tmp_path / "my_plugin.py").write_text("def my_bot(game, player_id):\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "my_plugin"
+    sys.modules.pop("my_plugin", None)
+
+
+def test_targets_are_imported_on_first_load(plugin_module):
+    bots = registry.Registry("test.bots")
+    registration = bots.register("mine", f"{plugin_module}:my_bot")
+    assert registration.source == "runtime"
+    assert plugin_module not in sys.modules
+    assert "mine" in bots
+
+    factory = bots.load("mine")
+    assert factory is sys.modules[plugin_module].my_bot
+    assert bots.load("mine") is factory
+
+
+def test_objects_and_unknown_names():
+    bots = registry.Registry("test.bots")
+    bots.register("object", len)
+    assert bots.load("object") is len
+    with pytest.raises(KeyError):
+        bots.get("missing")
+
+
+def test_entry_points(plugin_module, monkeypatch):
+    entry_points = [
+        metadata.EntryPoint("plugin", f"{plugin_module}:my_bot", "test.bots"),
+        metadata.EntryPoint("shadowed", f"{plugin_module}:my_bot", "test.bots"),
+        metadata.EntryPoint("other", f"{plugin_module}:my_bot", "other.group"),
+    ]
+
+    class EntryPoints(list):
+        def select(self, group):
+            return [e for e in self if e.group == group]
+
+    monkeypatch.setattr(metadata, "entry_points", lambda: EntryPoints(entry_points))
+    bots = registry.Registry("test.bots")
+    bots.register("shadowed", len)
+
+    assert bots.names() == ["shadowed", "plugin"]
+    assert bots.get("plugin").source == "entry_point"
+    assert plugin_module not in sys.modules  # Listed, not loaded
+    assert bots.load("plugin") is sys.modules[plugin_module].my_bot
+    assert bots.load("shadowed") is len  # In-process names take precedence
+
+
+def test_builtin_bots():
+    assert "mcts" in registry.available_bots("tic_tac_toe")
+    assert "alphabeta" in registry.available_bots("breakthrough")
+    assert "alphabeta" not in registry.available_bots("tic_tac_toe")
+    assert "human" not in registry.available_bots("breakthrough")  # Not selectable
+    assert "human" in registry.bots
+    assert set(registry.available_games()) >= {"breakthrough", "tic_tac_toe"}
@@ -0,0 +1,64 @@
+import pygame
+import pytest
+
+from pygame_spiel.games.rendering import GridLayout, LayeredRenderer
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((40, 40))
+    yield
+    pygame.quit()
+
+
+def test_grid_layout_maps_cells_both_ways():
+    layout = GridLayout(3, 4, origin=(10, 20), cell_size=(30, 25))
+    assert layout.size == (120, 75)
+    for row in range(3):
+        for col in range(4):
+            assert layout.cell_at(layout.cell_center(row, col)) == (row, col)
+            assert layout.cell_at(layout.cell_origin(row, col)) == (row, col)
+            assert layout.cell_rect(row, col).topleft == layout.cell_origin(row, col)
+    assert layout.cell_at((9, 20)) is None
+    assert layout.cell_at((130, 20)) is None
+    assert layout.cell_at((10, 95)) is None
+
+
+def test_layers_are_redrawn_only_when_invalidated():
+    calls = []
+
+    def callback(layer, color):
+        def draw(surface):
+            calls.append(layer)
+            surface.fill(color, pygame.Rect(0, 0, 10, 10))
+
+        return draw
+
+    renderer = LayeredRenderer(
+        (20, 20),
+        {
+            "board": callback("board", (0, 0, 255)),
+            "pieces": callback("pieces", (255, 0, 0, 255)),
+        },
+        layers=("board", "pieces", "text"),
+    )
+    screen = pygame.Surface((20, 20))
+
+    assert renderer.render(screen)
+    assert calls == ["board", "pieces"]
+    assert screen.get_at((0, 0))[:3] == (255, 0, 0)  # Pieces on top
+
+    calls.clear()
+    assert not renderer.render(screen)  # Nothing changed
+    assert calls == []
+
+    renderer.invalidate("pieces")
+    assert renderer.render(screen)
+    assert calls == ["pieces"]
+
+    calls.clear()
+    renderer.invalidate()
+    assert renderer.render(screen)
+    assert calls == ["board", "pieces"]
+    assert renderer.frame.get_at((15, 15))[:3] == (0, 0, 0)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+import pyspiel
+
+from pygame_spiel.games.state import CachedState
+
+
+@pytest.fixture
+def state():
+    return CachedState(pyspiel.load_game("tic_tac_toe").new_initial_state())
+
+
+def test_views_match_the_wrapped_state(state):
+    state.apply_action(4)
+    raw = state.state
+    assert state.to_string() == raw.to_string()
+    assert state.current_player() == raw.current_player()
+    assert state.legal_actions() == raw.legal_actions()
+    assert state.legal_actions(1) == raw.legal_actions(1)
+    np.testing.assert_array_equal(state.observation_tensor(), raw.observation_tensor())
+    assert state.history() == raw.history()  # forwarded
+
+
+def test_legal_actions_are_copies(state):
+    actions = state.legal_actions()
+    actions.remove(4)
+    assert 4 in state.legal_actions()
+    assert state.legal_actions() is not state.legal_actions()
+
+
+def test_observation_is_cached_and_read_only(state):
+    observation = state.observation_tensor()
+    assert observation is state.observation_tensor()
+    assert observation.dtype == np.float32
+    with pytest.raises(ValueError):
+        observation[0] = 1.0
+
+
+def test_apply_action_clears_the_cache(state):
+    before = state.observation_tensor()
+    state.apply_action(0)
+    assert state.observation_tensor() is not before
+    assert 0 not in state.legal_actions()
+    assert state.current_player() == 1
+
+
+def test_wrapping_twice_and_clone(state):
+    wrapped = CachedState(state)
+    assert wrapped.state is state.state
+    clone = state.clone()
+    assert isinstance(clone, pyspiel.State)
+    clone.apply_action(0)
+    assert 0 in state.legal_actions()
+
+
+def test_cpp_bot_steps_on_the_wrapped_state(state):
+    game = pyspiel.load_game("tic_tac_toe")
+    evaluator = pyspiel.RandomRolloutEvaluator(1, 0)
+    bot = pyspiel.MCTSBot(game, evaluator, 2.0, 20, 100, 0, False, False)
+    assert bot.step(state.state) in state.legal_actions()
@@ -0,0 +1,90 @@
+import json
+import socket
+
+import numpy as np
+
+from pygame_spiel import telemetry
+
+
+def _udp_listener() -> socket.socket:
+    listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.settimeout(5.0)
+    return listener
+
+
+def test_statsd_backend_sends_metrics():
+    listener = _udp_listener()
+    port = listener.getsockname()[1]
+    sink = telemetry.Telemetry(
+        telemetry.StatsdBackend("127.0.0.1", port, prefix="test"),
+        flush_interval=0.01,
+    )
+    sink.emit("game_start", game="breakthrough")
+    sink.emit("move", action=np.int64(3))
+    sink.emit("bot_latency", bot="mcts", ms=np.float32(12.5))
+    sink.emit("game_end", outcome="draw")
+    sink.close()
+
+    lines = []
+    while len(lines) < 4:
+        lines += listener.recv(4096).decode().split("\n")
+    listener.close()
+    assert lines == [
+        "test.game.start:1|c",
+        "test.move:1|c",
+        "test.bot.mcts.latency:12.500|ms",
+        "test.game.end.draw:1|c",
+    ]
+    assert sink.dropped == 0 and sink.failed == 0
+
+
+def test_statsd_backend_packs_datagrams():
+    listener = _udp_listener()
+    port = listener.getsockname()[1]
+    backend = telemetry.StatsdBackend("127.0.0.1", port, max_packet_size=64)
+    backend.send([{"type": "move"}] * 10)
+    backend.close()
+
+    packets = []
+    while sum(len(p.split(b"\n")) for p in packets) < 10:
+        packets.append(listener.recv(4096))
+    listener.close()
+    assert len(packets) > 1
+    assert all(len(packet) <= 64 for packet in packets)
+
+
+def test_json_lines_backend_converts_numpy_values(tmp_path):
+    path = tmp_path / "events.jsonl"
+    sink = telemetry.Telemetry(
+        telemetry.JsonLinesBackend(str(path)), flush_interval=0.01
+    )
+    sink.emit("move", action=np.int64(7), returns=np.array([1.0, -1.0]))
+    sink.close()
+
+    event = json.loads(path.read_text())
+    assert event["action"] == 7
+    assert event["returns"] == [1.0, -1.0]
+    assert sink.failed == 0
+
+
+def test_failing_batch_does_not_stop_the_sender():
+    class FlakyBackend:
+        def __init__(self):
+            self.events = []
+
+        def send(self, events):
+            if any(event.get("fail") for event in events):
+                raise TypeError("not serializable")
+            self.events += events
+
+        def close(self):
+            pass
+
+    backend = FlakyBackend()
+    sink = telemetry.Telemetry(backend, batch_size=1, flush_interval=0.01)
+    sink.emit("move", fail=True)
+    sink.emit("move", action=1)
+    sink.close()
+    assert sink.failed == 1
+    assert [event["action"] for event in backend.events] == [1]
@@ -0,0 +1,84 @@
+import gc
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+import pyspiel
+
+from pygame_spiel import transport
+
+
+@pytest.fixture
+def game():
+    return pyspiel.load_game("tic_tac_toe")
+
+
+def test_shared_state_view(game):
+    state = game.new_initial_state()
+    state.apply_action(4)
+    ring = transport.ObservationRing(
+        game.observation_tensor_size(), game.num_distinct_actions()
+    )
+    worker_ring = transport.ObservationRing(*ring.layout, name=ring.name)
+    try:
+        slot = ring.write_request(1, state)
+        record = worker_ring.slots[slot]
+        view = transport.SharedStateView(game, record)
+        assert record["seq"] == 1
+        assert view.current_player() == state.current_player()
+        assert view.legal_actions() == state.legal_actions()
+        np.testing.assert_array_equal(
+            view.observation_tensor(), state.observation_tensor()
+        )
+        assert not view.is_terminal()
+        assert view.history() == state.history()  # From the serialized state
+        del record, view
+    finally:
+        worker_ring.close()
+        ring.close()
+
+
+def test_state_too_large(game):
+    ring = transport.ObservationRing(
+        game.observation_tensor_size(), game.num_distinct_actions(), max_state_bytes=4
+    )
+    state = game.new_initial_state()
+    for action in (0, 1, 2):
+        state.apply_action(action)
+    try:
+        with pytest.raises(ValueError):
+            ring.write_request(1, state)
+    finally:
+        ring.close()
+
+
+def test_remote_bot(game):
+    bot = transport.RemoteBot(game, 0, "random")
+    ring_name = bot._ring.name
+    process = bot._process
+    state = game.new_initial_state()
+    while not state.is_terminal():
+        if state.current_player() == 0:
+            action = bot.step(state)
+            assert action in state.legal_actions()
+        else:
+            action = state.legal_actions()[0]
+        state.apply_action(action)
+
+    # The worker is stopped and the memory freed when the Bot is collected
+    del bot
+    gc.collect()
+    assert not process.is_alive()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=ring_name)
+
+
+def test_remote_bot_error(game):
+    bot = transport.RemoteBot(game, 0, "no_such_bot")
+    try:
+        with pytest.raises(RuntimeError):
+            bot.step(game.new_initial_state())
+    finally:
+        bot.close()
+        bot.close()  # Closing twice is harmless
@@ -0,0 +1,99 @@
+import pygame
+import pytest
+
+import pyspiel
+
+from pygame_spiel.games.base import warm_up_bot
+from pygame_spiel.games.factory import GameFactory
+from pygame_spiel.menu import Menu
+
+
+# pygame_menu caches its fonts, which must outlive all the menus of the module
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class LazyBot(pyspiel.Bot):
+    """Bot recording its game, its model loading and its restarts."""
+
+    def __init__(self, game, player_id):
+        pyspiel.Bot.__init__(self)
+        self.game = game
+        self.player_id = player_id
+        self.loaded = False
+        self.restarts = 0
+
+    def load(self):
+        self.loaded = True
+
+    def restart_at(self, state):
+        self.restarts += 1
+
+    def step(self, state):
+        return state.legal_actions()[0]
+
+
+def test_warm_up_builds_the_bot():
+    bot = warm_up_bot("tic_tac_toe", "mcts", 1)
+    state = pyspiel.load_game("tic_tac_toe").new_initial_state()
+    state.apply_action(4)
+    assert bot.step(state) in state.legal_actions()
+
+
+def test_warm_up_loads_lazy_bots():
+    bot = warm_up_bot(
+        "breakthrough",
+        "lazy",
+        1,
+        params={"rows": 6, "columns": 6},
+        registered_bots={"lazy": LazyBot},
+    )
+    assert bot.loaded
+    assert bot.player_id == 1
+    assert bot.game.get_parameters()["rows"] == 6
+
+
+def test_set_bots_uses_the_warm_bot():
+    bot = warm_up_bot("tic_tac_toe", "lazy", 1, registered_bots={"lazy": LazyBot})
+    game = GameFactory.get_game("tic_tac_toe", current_player=0)
+    game.set_bots(
+        bot1_type="human",
+        bot1_params=None,
+        bot2_type="lazy",
+        bot2_params=None,
+        bot2=bot,
+    )
+    assert game._bots[1] is bot
+    assert bot.restarts == 1  # Restarted at the game's state
+
+
+@pytest.fixture
+def menu(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # Nothing to discover
+    menu = Menu()
+    yield menu
+    menu.get_warm_bot()  # Stops the warm-up thread
+
+
+def test_menu_warms_up_the_selected_opponent(menu):
+    menu._select_game([("tic_tac_toe", 2)], 1)
+    assert list(menu._warm_ups) == [("tic_tac_toe", (), "mcts")]
+    menu._select_opponent([("mcts_array", 3)], 2)
+    assert list(menu._warm_ups) == [("tic_tac_toe", (), "mcts_array")]
+
+    bot = menu.get_warm_bot()
+    assert isinstance(bot, pyspiel.Bot)
+    assert bot.step(pyspiel.load_game("tic_tac_toe").new_initial_state()) in range(9)
+    assert menu._warm_ups == {}
+
+
+def test_menu_without_warm_bot(menu, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("download failed")
+
+    monkeypatch.setattr("pygame_spiel.menu.warm_up_bot", fail)
+    menu._select_game([("tic_tac_toe", 2)], 1)
+    assert menu.get_warm_bot() is None  # set_bots() builds it instead